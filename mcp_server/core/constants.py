@@ -54,6 +54,7 @@ MAX_REQUEST_SIZE: Final[int] = 10 * 1024 * 1024  # 10 MB
 MAX_RESPONSE_SIZE: Final[int] = 50 * 1024 * 1024  # 50 MB
 MAX_CONCURRENT_REQUESTS: Final[int] = 100
 MAX_MESSAGE_QUEUE_SIZE: Final[int] = 1000
+MAX_PROTOCOL_CLIENTS: Final[int] = 10000  # per-client protocol states kept (LRU)
 
 # ============================================================================
 # Transport Configuration
@@ -6,6 +6,15 @@ Date: 2025-11-23
 Version: 0.2.0-alpha
 
 CHANGELOG:
+[2026-10-15 v0.2.1-alpha] Revocation checks
+  - auth/refresh rejects refresh tokens revoked in the token backend
+  - token_backend constructor parameter; with a shared backend
+    (RedisBackend) tokens of other workers are checked by their jti claim
+  - Stored jti is the refresh token's jti claim
+  - auth/token returns the stored jti (needed by auth/revoke)
+  - Client contexts and protocol state dropped on transport disconnect
+    and at stop()
+
 [2025-11-23 v0.2.0-alpha] Phase 2 integration
   - Integrated ToolManager for tool registration
   - Integrated PermissionManager for authorization
@@ -75,6 +84,9 @@ from ..security.authentication import (
 from ..persistence import (
     TokenManager,
     AuditLogger,
+    JSONBackend,
+    TokenBackend,
+    TokenStoreError,
 )
 
 
@@ -116,6 +128,7 @@ class MCPServer:
         server_version: str = SERVER_VERSION,
         data_dir: str = "./data",
         jwt_secret_key: Optional[str] = None,
+        token_backend: Optional[TokenBackend] = None,
     ):
         """
         Initialize MCP Server
@@ -125,6 +138,9 @@ class MCPServer:
             server_version: Version string
             data_dir: Directory for persistent data (Phase 3)
             jwt_secret_key: Secret key for JWT signing (defaults to env var or generated)
+            token_backend: Revocation backend, e.g. RedisBackend with several
+                workers; its store becomes the server's token store
+                (default: JSONBackend over a TokenManager in data_dir)
         """
         self.logger = logging.getLogger("core.mcp_server")
 
@@ -165,8 +181,13 @@ class MCPServer:
         )
 
         # Token & Client Management
-        self.token_manager = TokenManager(data_dir)
         self.client_manager = ClientManager(data_dir)
+        if token_backend is None:
+            token_backend = JSONBackend(TokenManager(data_dir))
+        self.token_manager = token_backend.store
+
+        # Revocation backend (RedisBackend with several workers)
+        self.token_backend = token_backend
 
         # Audit Logger
         self.audit_logger = AuditLogger(data_dir)
@@ -332,6 +353,13 @@ class MCPServer:
             except Exception as e:
                 self.logger.error(f"Error stopping transport: {e}")
 
+        for client_id in list(self._clients):
+            self.remove_client(client_id)
+
+        # Write out any debounced token store flush and buffered audit entries
+        self.token_manager.flush_now()
+        self.execution_manager.close()
+
         self.logger.info("Server stopped")
 
     async def run(self) -> None:
@@ -414,6 +442,28 @@ class MCPServer:
             except Exception as send_error:
                 self.logger.error(f"Error sending error response: {send_error}")
 
+    def remove_client(self, client_id: str) -> None:
+        """
+        Forget a client: its context and its protocol handler state
+
+        Args:
+            client_id: Transport-level client identifier
+        """
+        client = self._clients.pop(client_id, None)
+        if client is not None:
+            self.protocol_handler.remove_client(client.client_id)
+
+    async def _handle_client_event(self, client_id: str, event: str) -> None:
+        """
+        Handle client connect/disconnect events from transport
+
+        Args:
+            client_id: Transport-level client identifier
+            event: "connect" or "disconnect"
+        """
+        if event == "disconnect":
+            self.remove_client(client_id)
+
     async def _handle_transport_error(self, error: TransportError) -> None:
         """
         Handle error from transport
@@ -517,7 +567,9 @@ class MCPServer:
             params: {"username": "...", "password": "..."}
 
         Returns:
-            dict: {"access_token": "...", "refresh_token": "...", "expires_in": 3600}
+            dict: {"access_token": "...", "refresh_token": "...",
+                   "expires_in": 3600, "jti": "..."}
+            The jti identifies the stored token pair for auth/revoke.
 
         Raises:
             ValueError: If authentication fails
@@ -532,16 +584,19 @@ class MCPServer:
             # Authenticate client
             client_record = self.client_manager.authenticate(username, password)
 
-            # Generate tokens
+            # Generate tokens (the refresh token's jti is the record id,
+            # so any worker can check its revocation from the claim)
+            jti = self.token_manager.generate_jti()
             token_pair = self.jwt_handler.generate_tokens(
                 client_id=client_record.client_id,
                 username=client_record.username,
                 roles=client_record.roles,
+                refresh_jti=jti,
             )
 
             # Store tokens
             self.token_manager.create_token(
-                jti=token_pair.access_token.split(".")[-2][:8],  # Use part of JWT as JTI
+                jti=jti,
                 client_id=client_record.client_id,
                 username=client_record.username,
                 access_token=token_pair.access_token,
@@ -568,6 +623,7 @@ class MCPServer:
                 "refresh_token": token_pair.refresh_token,
                 "expires_in": 3600,
                 "token_type": "Bearer",
+                "jti": jti,
             }
 
         except ClientError as e:
@@ -594,13 +650,15 @@ class MCPServer:
             dict: {"access_token": "...", "expires_in": 3600}
 
         Raises:
-            ValueError: If refresh fails
+            ValueError: If refresh fails or the token has been revoked
         """
         refresh_token = params.get("refresh_token")
 
         if not refresh_token:
             raise ValueError("refresh_token required")
 
+        await self._check_not_revoked(refresh_token, "refresh")
+
         try:
             # Validate refresh token and get new access token
             access_token = self.jwt_handler.refresh_access_token(refresh_token)
@@ -623,6 +681,36 @@ class MCPServer:
         except (JWTError, JWTExpiredError) as e:
             raise ValueError(f"Token refresh failed: {e}")
 
+    async def _check_not_revoked(self, token: str, token_type: str) -> None:
+        """
+        Reject tokens that are unknown or revoked
+
+        With a local backend the token must be in this worker's store. A
+        shared backend (RedisBackend) also sees tokens issued by other
+        workers, which have no local record: the token's signature and
+        jti claim are checked instead.
+
+        Args:
+            token: Token string
+            token_type: "access" or "refresh"
+
+        Raises:
+            ValueError: If the token is unknown, invalid or revoked
+        """
+        if self.token_backend.shared:
+            try:
+                jti = self.jwt_handler.verify(token).jti
+            except JWTError as e:
+                raise ValueError(f"Token rejected: {e}")
+        else:
+            try:
+                jti = self.token_manager.validate_token(token, token_type).jti
+            except TokenStoreError as e:
+                raise ValueError(f"Token rejected: {e}")
+
+        if await self.token_backend.exists_blacklist(jti):
+            raise ValueError(f"Token rejected: token {jti} has been revoked")
+
     async def _handle_auth_revoke(
         self,
         client: ClientContext,
@@ -648,7 +736,7 @@ class MCPServer:
 
         try:
             # Revoke token
-            self.token_manager.revoke_token(jti)
+            await self.token_backend.add_blacklist(jti)
 
             # Log token revocation
             self.audit_logger.log_event(
@@ -687,8 +775,9 @@ class MCPServer:
             config = TCPConfig(host=host, port=port)
             tcp_transport = TCPTransport(config)
 
-            # Register message handler
+            # Register message and client handlers
             await tcp_transport.set_message_handler(self._handle_transport_message)
+            await tcp_transport.set_client_handler(self._handle_client_event)
 
             self.logger.info(f"Starting TCP transport on {host}:{port}")
             await tcp_transport.start()
@@ -716,8 +805,9 @@ class MCPServer:
             config = WebSocketConfig(host=host, port=port)
             ws_transport = WebSocketTransport(config)
 
-            # Register message handler
+            # Register message and client handlers
             await ws_transport.set_message_handler(self._handle_transport_message)
+            await ws_transport.set_client_handler(self._handle_client_event)
 
             self.logger.info(f"Starting WebSocket transport on {host}:{port}")
             await ws_transport.start()
@@ -763,6 +853,7 @@ class MCPServer:
             tcp_config = TCPConfig(host=tcp_host, port=tcp_port)
             tcp_transport = TCPTransport(tcp_config)
             await tcp_transport.set_message_handler(self._handle_transport_message)
+            await tcp_transport.set_client_handler(self._handle_client_event)
             tasks.append(tcp_transport.start())
             self.logger.info(f"TCP transport enabled on {tcp_host}:{tcp_port}")
 
@@ -770,6 +861,7 @@ class MCPServer:
             ws_config = WebSocketConfig(host=ws_host, port=ws_port)
             ws_transport = WebSocketTransport(ws_config)
             await ws_transport.set_message_handler(self._handle_transport_message)
+            await ws_transport.set_client_handler(self._handle_client_event)
             tasks.append(ws_transport.start())
             self.logger.info(f"WebSocket transport enabled on {ws_host}:{ws_port}")
 
@@ -796,7 +888,6 @@ class MCPServer:
 if __name__ == "__main__":
     import unittest
     from unittest.mock import AsyncMock, MagicMock, patch
-    import asyncio
 
     class TestMCPServer(unittest.TestCase):
         """Test suite for MCPServer"""
@@ -852,6 +943,19 @@ if __name__ == "__main__":
 
             self.assertEqual(self.server.active_clients, 2)
 
+        def test_disconnect_drops_client_state(self):
+            """Test a transport disconnect removes context and protocol state"""
+            client = ClientContext()
+            self.server._clients["conn-1"] = client
+            self.server.protocol_handler._get_client_state(client.client_id)
+
+            asyncio.run(self.server._handle_client_event("conn-1", "disconnect"))
+            self.assertNotIn("conn-1", self.server._clients)
+            self.assertNotIn(client.client_id, self.server.protocol_handler._client_states)
+
+            # Unknown clients are ignored
+            asyncio.run(self.server._handle_client_event("conn-2", "disconnect"))
+
         def test_get_status(self):
             """Test getting server status"""
             status = self.server.get_status()
@@ -874,5 +978,113 @@ if __name__ == "__main__":
             self.assertGreater(uptime, 0.0)
             self.assertLess(uptime, 1.0)
 
+    class TestMCPServerAuth(unittest.TestCase):
+        """Test suite for the auth/* handlers"""
+
+        def setUp(self):
+            """Setup before each test"""
+            import tempfile
+            self.test_dir = tempfile.mkdtemp()
+            self.server = MCPServer(data_dir=self.test_dir)
+            self.server.client_manager.create_client("alice", "S3cret-pass!")
+            self.client = ClientContext()
+
+        def tearDown(self):
+            """Cleanup after each test"""
+            import shutil
+            self.server.token_manager.close()
+            shutil.rmtree(self.test_dir, ignore_errors=True)
+
+        def _login(self):
+            return asyncio.run(self.server._handle_auth_token(
+                self.client, {"username": "alice", "password": "S3cret-pass!"}
+            ))
+
+        def test_refresh_checks_revocation_backend(self):
+            """Test auth/refresh rejects tokens the backend reports revoked"""
+            tokens = self._login()
+            params = {"refresh_token": tokens["refresh_token"]}
+
+            result = asyncio.run(self.server._handle_auth_refresh(self.client, params))
+            self.assertIn("access_token", result)
+
+            # Revoked by another worker: only the shared backend knows
+            self.server.token_backend.exists_blacklist = AsyncMock(return_value=True)
+            with self.assertRaises(ValueError):
+                asyncio.run(self.server._handle_auth_refresh(self.client, params))
+
+        def test_revoke_with_returned_jti(self):
+            """Test the jti from auth/token revokes the pair"""
+            tokens = self._login()
+            result = asyncio.run(self.server._handle_auth_revoke(
+                self.client, {"jti": tokens["jti"]}
+            ))
+            self.assertEqual(result, {"status": "revoked"})
+
+            with self.assertRaises(ValueError):
+                asyncio.run(self.server._handle_auth_refresh(
+                    self.client, {"refresh_token": tokens["refresh_token"]}
+                ))
+
+        def test_revocation_shared_between_workers(self):
+            """Test two workers sharing a Redis blacklist see each other's tokens"""
+            import tempfile
+            from ..persistence import RedisBackend
+
+            class FakeRedis:
+                """In-memory stand-in for the redis.asyncio calls used"""
+
+                def __init__(self):
+                    self.data = {}
+
+                async def setex(self, key, ttl, value):
+                    self.data[key] = (value, ttl)
+
+                async def exists(self, key):
+                    return int(key in self.data)
+
+            redis = FakeRedis()
+            workers = []
+            for _ in range(2):
+                data_dir = tempfile.mkdtemp()
+                backend = RedisBackend(redis, TokenManager(data_dir))
+                worker = MCPServer(
+                    data_dir=data_dir,
+                    jwt_secret_key=self.server.jwt_handler.secret_key,
+                    token_backend=backend,
+                )
+                self.assertIs(worker.token_manager, backend.store)
+                worker.client_manager.create_client("alice", "S3cret-pass!")
+                workers.append(worker)
+            worker_a, worker_b = workers
+
+            try:
+                tokens = asyncio.run(worker_a._handle_auth_token(
+                    self.client, {"username": "alice", "password": "S3cret-pass!"}
+                ))
+                params = {"refresh_token": tokens["refresh_token"]}
+
+                # Issued by A: refreshed by B, revoked by B, rejected by A
+                asyncio.run(worker_b._handle_auth_refresh(self.client, params))
+                asyncio.run(worker_b._handle_auth_revoke(
+                    self.client, {"jti": tokens["jti"]}
+                ))
+                for worker in workers:
+                    with self.assertRaises(ValueError):
+                        asyncio.run(worker._handle_auth_refresh(self.client, params))
+            finally:
+                import shutil
+                for worker in workers:
+                    worker.token_manager.close()
+                    shutil.rmtree(worker.data_dir, ignore_errors=True)
+
+        def test_refresh_unknown_token_rejected(self):
+            """Test auth/refresh rejects refresh tokens missing from the store"""
+            pair = self.server.jwt_handler.generate_tokens("client-1", "alice")
+            with self.assertRaises(ValueError):
+                asyncio.run(self.server._handle_auth_refresh(
+                    self.client, {"refresh_token": pair.refresh_token}
+                ))
+
     # Run tests
     unittest.main()
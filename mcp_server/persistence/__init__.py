@@ -3,20 +3,34 @@ Persistence module - JSON-based data storage
 
 Provides:
 - JSONStore: Base class for JSON file handling
+- JSONLStore: Append-only JSON Lines file handling
+- MsgpackStore: Append-only msgpack frames (optional msgpack dependency)
 - TokenManager: Token persistence and revocation
+- SQLiteTokenStore: TokenManager API backed by SQLite (WAL)
+- TokenBackend: Revocation backends (JSONBackend, RedisBackend)
 - AuditLogger: Audit trail logging with event types
 """
 
 from .json_store import JSONStore, JSONStoreError
+from .jsonl_store import JSONLStore
+from .msgpack_store import MsgpackStore
 from .token_store import TokenManager, TokenRecord, TokenStoreError
+from .sqlite_token_store import SQLiteTokenStore
+from .token_backend import TokenBackend, JSONBackend, RedisBackend
 from .audit_store import AuditLogger, AuditEntry, EventType
 
 __all__ = [
     "JSONStore",
     "JSONStoreError",
+    "JSONLStore",
+    "MsgpackStore",
     "TokenManager",
     "TokenRecord",
     "TokenStoreError",
+    "SQLiteTokenStore",
+    "TokenBackend",
+    "JSONBackend",
+    "RedisBackend",
     "AuditLogger",
     "AuditEntry",
     "EventType",
@@ -12,21 +12,64 @@ CHANGELOG:
   - Timestamped entries
   - Query support
 
+[2026-10-15 v0.3.1-alpha] Segmented JSONL storage
+  - Entries appended to audit.jsonl (no whole-file rewrite)
+  - Rotation into audit-YYYYMMDD-HHMMSS.jsonl segments
+  - Segment index (audit.idx.json) with timestamp bounds
+  - Date-range queries skip non-overlapping segments
+  - One-time import of legacy audit.json entries
+  - Compact mode (no message) and None fields omitted on disk
+  - In-memory ring buffer of recent entries for get_recent_entries
+  - Buffer misses tail-read segments instead of loading every entry
+  - Date-range queries scan overlapping segments in parallel
+  - Field queries pre-filter raw lines, parse only candidate entries
+  - query(**filters): generated multi-field predicate, cached per shape
+  - Optional bounded write queue drained by a background thread
+  - Optional msgpack segments (binary=True)
+
 ARCHITECTURE:
 AuditLogger provides:
   - Immutable audit trail
   - Structured event logging
   - Filtering and querying
   - Automatic timestamp management
+
+Storage layout (data_dir):
+  - audit.jsonl          active segment, one entry per line
+  - audit-*.jsonl        rotated (closed) segments
+  - audit.idx.json       {"segments": [{path, start_ts, end_ts, count}]}
+
+With binary=True the segments are msgpack frames instead (audit.msgpack,
+audit-*.msgpack, same index file); see MsgpackStore.
 """
 
 import logging
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Callable, Tuple
 from datetime import datetime, timezone
 from enum import Enum
 
 from .json_store import JSONStore
+from .jsonl_store import JSONLStore
+from .msgpack_store import MsgpackStore
+
+
+# Active segment is rotated once it grows past this size
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# Number of most recent entries kept in memory for get_recent_entries
+RECENT_BUFFER_SIZE = 1024
+
+# Max entries written per batch by the background drain thread
+DRAIN_BATCH_SIZE = 64
 
 
 class EventType(Enum):
@@ -43,9 +86,59 @@ class EventType(Enum):
     ERROR = "error"
 
 
+# Event type strings resolved once at import (no Enum lookup per log call)
+_AUTH_SUCCESS = sys.intern(EventType.AUTH_SUCCESS.value)
+_AUTH_FAILED = sys.intern(EventType.AUTH_FAILED.value)
+_TOOL_EXECUTED = sys.intern(EventType.TOOL_EXECUTED.value)
+_PERMISSION_DENIED = sys.intern(EventType.PERMISSION_DENIED.value)
+_CLIENT_CREATED = sys.intern(EventType.CLIENT_CREATED.value)
+_CLIENT_DELETED = sys.intern(EventType.CLIENT_DELETED.value)
+
+# Equality filters accepted by AuditLogger.query, most selective first
+_QUERY_FIELDS = ("client_id", "username", "event_type", "status")
+
+
+@lru_cache(maxsize=32)
+def _predicate_factory(fields: Tuple[str, ...]) -> Callable[..., Callable[[Dict[str, Any]], bool]]:
+    """
+    Generate a fused equality predicate for one filter shape
+
+    Field names come from _QUERY_FIELDS only; filter values are bound
+    through closure arguments, never pasted into the source.
+
+    Args:
+        fields: Filtered field names, in _QUERY_FIELDS order
+
+    Returns:
+        factory(*values) -> predicate(entry_dict) -> bool
+    """
+    checks = " and ".join(f"get({name!r}) == {name}" for name in fields) or "True"
+    source = (
+        f"def factory({', '.join(fields)}):\n"
+        f"    def predicate(entry):\n"
+        f"        get = entry.get\n"
+        f"        return {checks}\n"
+        f"    return predicate\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<audit-query>", "exec"), namespace)
+    return namespace["factory"]
+
+
 class AuditEntry:
     """Represents an audit log entry"""
 
+    __slots__ = (
+        "timestamp",
+        "event_type",
+        "client_id",
+        "username",
+        "status",
+        "message",
+        "error",
+        "details",
+    )
+
     def __init__(
         self,
         timestamp: datetime,
@@ -67,17 +160,22 @@ class AuditEntry:
         self.details = details or {}
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON storage"""
-        return {
+        """Convert to dictionary for JSON storage (None fields omitted)"""
+        data = {
             "timestamp": self.timestamp.isoformat(),
             "event_type": self.event_type,
-            "client_id": self.client_id,
-            "username": self.username,
             "status": self.status,
-            "message": self.message,
-            "error": self.error,
             "details": self.details,
         }
+        if self.client_id is not None:
+            data["client_id"] = self.client_id
+        if self.username is not None:
+            data["username"] = self.username
+        if self.message is not None:
+            data["message"] = self.message
+        if self.error is not None:
+            data["error"] = self.error
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AuditEntry":
@@ -98,28 +196,220 @@ class AuditLogger:
     """
     Append-only audit trail logger.
 
-    Logs all significant events to audit.json.
+    Logs all significant events to segmented audit JSONL files.
     Supports filtering and querying.
+
+    Writes are synchronous by default. With queue_maxsize > 0, log_event
+    only enqueues the entry and a daemon thread writes batches; reads
+    flush the queue first so they always see every logged entry.
     """
 
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(
+        self,
+        data_dir: str = "./data",
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        compact: bool = False,
+        queue_maxsize: int = 0,
+        drop_when_full: bool = False,
+        put_timeout: Optional[float] = None,
+        binary: bool = False,
+    ):
         """
         Initialize audit logger
 
         Args:
-            data_dir: Directory for audit file
+            data_dir: Directory for audit files
+            segment_max_bytes: Size threshold for rotating the active segment
+            compact: Skip human-readable messages in log_* helpers
+                (event_type + username already carry the information)
+            queue_maxsize: Bound of the background write queue
+                (0 = write synchronously in log_event)
+            drop_when_full: Drop (and count) entries instead of blocking
+                when the queue is full
+            put_timeout: Max seconds to block on a full queue before
+                dropping (None = block until there is room)
+            binary: Store entries as msgpack frames instead of JSON Lines
+                (requires msgpack)
         """
         self.logger = logging.getLogger("persistence.audit_logger")
         self.data_dir = Path(data_dir)
-        self.audit_file = self.data_dir / "audit.json"
-
-        # Initialize store with default structure
-        default_data = {
-            "entries": [],
+        self._store_cls = MsgpackStore if binary else JSONLStore
+        self._segment_ext = ".msgpack" if binary else ".jsonl"
+        self.audit_file = self.data_dir / f"audit{self._segment_ext}"
+        self.index_file = self.data_dir / "audit.idx.json"
+        self.segment_max_bytes = segment_max_bytes
+        self.compact = compact
+
+        # Active segment + index of rotated segments
+        self.store = self._store_cls(str(self.audit_file))
+        self.index = JSONStore(str(self.index_file), {"segments": []})
+        self._segments: List[Dict[str, Any]] = self.index.load()["segments"]
+
+        self._migrate_legacy_store()
+
+        # Timestamp bounds and entry count of the active segment
+        self._active_segment: Dict[str, Any] = {
+            "start_ts": None,
+            "end_ts": None,
+            "count": 0,
         }
-        self.store = JSONStore(str(self.audit_file), default_data)
+        recent: deque = deque(maxlen=RECENT_BUFFER_SIZE)
+        for e in self.store.iter_entries():
+            self._track_active(e["timestamp"])
+            recent.append(e)
+
+        # Warm cache of the newest entries (oldest first)
+        self._recent: deque = deque(
+            (AuditEntry.from_dict(e) for e in recent),
+            maxlen=RECENT_BUFFER_SIZE,
+        )
+
+        # Guards appends, rotation and the recent buffer
+        self._lock = threading.RLock()
+
+        # Optional bounded write queue (back-pressure for audit storms)
+        self.drop_when_full = drop_when_full
+        self.put_timeout = put_timeout
+        self._dropped = 0
+        self._queue_high_water = 0
+        self._queue: Optional[queue.Queue] = None
+        self._drain_thread: Optional[threading.Thread] = None
+        if queue_maxsize > 0:
+            self._queue = queue.Queue(maxsize=queue_maxsize)
+            self._drain_thread = threading.Thread(
+                target=self._drain, name="audit-drain", daemon=True
+            )
+            self._drain_thread.start()
+
         self.logger.info(f"AuditLogger initialized (file={self.audit_file})")
 
+    def _write_batch(self, entries: List[AuditEntry]) -> None:
+        """Append entries to the active segment, rotating if needed"""
+        records = [entry.to_dict() for entry in entries]
+        with self._lock:
+            self.store.append_raw(b"".join(map(self._store_cls.encode, records)))
+            for record in records:
+                self._track_active(record["timestamp"])
+            self._recent.extend(entries)
+            self._rotate_if_needed()
+
+    def _drain(self) -> None:
+        """Background thread: write queued entries in batches"""
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < DRAIN_BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            entries = [entry for entry in batch if entry is not None]
+            try:
+                if entries:
+                    self._write_batch(entries)
+            except Exception as e:
+                self.logger.error(f"Audit write failed, {len(entries)} entries lost: {e}")
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+            if len(entries) != len(batch):  # close() sentinel
+                return
+
+    def flush(self) -> None:
+        """Wait until every queued entry has been written"""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush pending entries, stop the drain thread, release the file"""
+        if self._queue is not None:
+            self._queue.put(None)
+            self._drain_thread.join()
+            self._queue = None
+            self._drain_thread = None
+        with self._lock:
+            self.store.close()
+
+    def get_queue_stats(self) -> Dict[str, int]:
+        """
+        Get background queue metrics
+
+        Returns:
+            pending entries, high-water mark and dropped entry count
+        """
+        return {
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "high_water": self._queue_high_water,
+            "dropped": self._dropped,
+        }
+
+    def _migrate_legacy_store(self) -> None:
+        """Import entries from the pre-JSONL audit.json once"""
+        legacy_file = self.data_dir / "audit.json"
+        if not legacy_file.exists() or self._segments or self.store.size() > 0:
+            return
+
+        entries = JSONStore(str(legacy_file), {"entries": []}).load().get("entries", [])
+        if entries:
+            self.store.append_raw(b"".join(map(self._store_cls.encode, entries)))
+            self.logger.info(f"Imported {len(entries)} entries from {legacy_file}")
+
+    def _track_active(self, timestamp: str) -> None:
+        """Extend active segment bounds with a new entry timestamp"""
+        active = self._active_segment
+        if active["start_ts"] is None:
+            active["start_ts"] = timestamp
+        active["end_ts"] = timestamp
+        active["count"] += 1
+
+    def _rotate_if_needed(self) -> None:
+        """Close the active segment once it exceeds segment_max_bytes"""
+        if self.store.size() < self.segment_max_bytes:
+            return
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        segment_path = self.data_dir / f"audit-{stamp}{self._segment_ext}"
+        suffix = 1
+        while segment_path.exists():
+            segment_path = self.data_dir / f"audit-{stamp}-{suffix}{self._segment_ext}"
+            suffix += 1
+
+        self.audit_file.replace(segment_path)
+        self.store.reset()
+
+        self._segments.append({
+            "path": segment_path.name,
+            "start_ts": self._active_segment["start_ts"],
+            "end_ts": self._active_segment["end_ts"],
+            "count": self._active_segment["count"],
+        })
+        self.index.save({"segments": self._segments})
+        self._active_segment = {"start_ts": None, "end_ts": None, "count": 0}
+
+        self.logger.info(f"Rotated audit segment to {segment_path.name}")
+
+    def _segment_store(self, path: Path):
+        """Get the store (JSONLStore or MsgpackStore) for one segment file"""
+        if path == self.audit_file:
+            return self.store
+        return self._store_cls(str(path))
+
+    def _iter_segment(
+        self,
+        path: Path,
+        needle: Optional[bytes] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate raw entries of one segment file (optionally pre-filtered)"""
+        return self._segment_store(path).iter_matching(needle)
+
+    def _iter_all(self, needle: Optional[bytes] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate raw entries of every segment, oldest first"""
+        for segment in self._segments:
+            yield from self._iter_segment(self.data_dir / segment["path"], needle)
+        yield from self._iter_segment(self.audit_file, needle)
+
     def log_event(
         self,
         event_type: str,
@@ -156,8 +446,20 @@ class AuditLogger:
             details=details,
         )
 
-        # Append to store
-        self.store.append_entry("entries", entry.to_dict())
+        q = self._queue
+        if q is None:
+            self._write_batch([entry])
+            return entry
+
+        try:
+            q.put(entry, block=not self.drop_when_full, timeout=self.put_timeout)
+        except queue.Full:
+            self._dropped += 1
+            return entry
+
+        depth = q.qsize()
+        if depth > self._queue_high_water:
+            self._queue_high_water = depth
 
         return entry
 
@@ -169,11 +471,11 @@ class AuditLogger:
     ) -> AuditEntry:
         """Log successful authentication"""
         return self.log_event(
-            event_type=EventType.AUTH_SUCCESS.value,
+            event_type=_AUTH_SUCCESS,
             client_id=client_id,
             username=username,
             status="success",
-            message=f"Client {username} authenticated",
+            message=None if self.compact else f"Client {username} authenticated",
             details=details,
         )
 
@@ -185,10 +487,10 @@ class AuditLogger:
     ) -> AuditEntry:
         """Log failed authentication"""
         return self.log_event(
-            event_type=EventType.AUTH_FAILED.value,
+            event_type=_AUTH_FAILED,
             username=username,
             status="failure",
-            message=f"Authentication failed for {username}: {reason}",
+            message=None if self.compact else f"Authentication failed for {username}: {reason}",
             error=reason,
             details=details,
         )
@@ -211,11 +513,11 @@ class AuditLogger:
             exec_details.update(details)
 
         return self.log_event(
-            event_type=EventType.TOOL_EXECUTED.value,
+            event_type=_TOOL_EXECUTED,
             client_id=client_id,
             username=username,
             status=status,
-            message=f"Tool executed: {tool_name} ({status})",
+            message=None if self.compact else f"Tool executed: {tool_name} ({status})",
             details=exec_details,
         )
 
@@ -236,11 +538,11 @@ class AuditLogger:
             exec_details.update(details)
 
         return self.log_event(
-            event_type=EventType.PERMISSION_DENIED.value,
+            event_type=_PERMISSION_DENIED,
             client_id=client_id,
             username=username,
             status="denied",
-            message=f"Permission denied: {required_permission}",
+            message=None if self.compact else f"Permission denied: {required_permission}",
             details=exec_details,
         )
 
@@ -252,11 +554,11 @@ class AuditLogger:
     ) -> AuditEntry:
         """Log client creation"""
         return self.log_event(
-            event_type=EventType.CLIENT_CREATED.value,
+            event_type=_CLIENT_CREATED,
             client_id=client_id,
             username=username,
             status="success",
-            message=f"Client created: {username}",
+            message=None if self.compact else f"Client created: {username}",
             details=details,
         )
 
@@ -268,11 +570,11 @@ class AuditLogger:
     ) -> AuditEntry:
         """Log client deletion"""
         return self.log_event(
-            event_type=EventType.CLIENT_DELETED.value,
+            event_type=_CLIENT_DELETED,
             client_id=client_id,
             username=username,
             status="success",
-            message=f"Client deleted: {username}",
+            message=None if self.compact else f"Client deleted: {username}",
             details=details,
         )
 
@@ -291,16 +593,7 @@ class AuditLogger:
         Returns:
             List of matching AuditEntry objects
         """
-        data = self.store.load()
-        entries = [
-            AuditEntry.from_dict(e)
-            for e in data["entries"]
-            if e.get("client_id") == client_id
-        ]
-
-        if limit:
-            return entries[-limit:]
-        return entries
+        return self._query_field("client_id", client_id, limit)
 
     def query_by_event_type(
         self,
@@ -317,16 +610,7 @@ class AuditLogger:
         Returns:
             List of matching AuditEntry objects
         """
-        data = self.store.load()
-        entries = [
-            AuditEntry.from_dict(e)
-            for e in data["entries"]
-            if e.get("event_type") == event_type
-        ]
-
-        if limit:
-            return entries[-limit:]
-        return entries
+        return self._query_field("event_type", event_type, limit)
 
     def query_by_username(
         self,
@@ -343,17 +627,100 @@ class AuditLogger:
         Returns:
             List of matching AuditEntry objects
         """
-        data = self.store.load()
-        entries = [
-            AuditEntry.from_dict(e)
-            for e in data["entries"]
-            if e.get("username") == username
-        ]
+        return self._query_field("username", username, limit)
+
+    def _query_field(
+        self,
+        key: str,
+        value: Any,
+        limit: Optional[int],
+    ) -> List[AuditEntry]:
+        """Collect entries where entry[key] == value (shared by query_by_*)"""
+        self.flush()
+        entries: List[AuditEntry] = []
+        append = entries.append
+        from_dict = AuditEntry.from_dict
+        for e in self._iter_all(self._store_cls.field_needle(key, value)):
+            if e.get(key) == value:
+                append(from_dict(e))
 
         if limit:
             return entries[-limit:]
         return entries
 
+    def query(
+        self,
+        limit: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        **filters: Any,
+    ) -> List[AuditEntry]:
+        """
+        Query audit entries matching all given filters
+
+        Equality filters are fused into one generated predicate (cached per
+        filter shape) that checks the most selective field first; that
+        field also drives the raw-line pre-filter.
+
+        Args:
+            limit: Max results (most recent kept)
+            start_time: Start time (inclusive)
+            end_time: End time (inclusive)
+            **filters: Any of client_id, username, event_type, status
+
+        Returns:
+            List of matching AuditEntry objects
+
+        Raises:
+            ValueError: Unknown filter name
+        """
+        self.flush()
+        unknown = set(filters).difference(_QUERY_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown audit filter(s): {', '.join(sorted(unknown))}")
+
+        fields = tuple(name for name in _QUERY_FIELDS if name in filters)
+        predicate = _predicate_factory(fields)(*[filters[name] for name in fields])
+        needle = None
+        if fields:
+            needle = self._store_cls.field_needle(fields[0], filters[fields[0]])
+
+        if start_time is None and end_time is None:
+            segments = [self.data_dir / segment["path"] for segment in self._segments]
+            segments.append(self.audit_file)
+        else:
+            start_time = start_time or datetime.min.replace(tzinfo=timezone.utc)
+            end_time = end_time or datetime.max.replace(tzinfo=timezone.utc)
+            segments = self._overlapping_segments(start_time, end_time)
+
+        entries: List[AuditEntry] = []
+        append = entries.append
+        from_dict = AuditEntry.from_dict
+        fromisoformat = datetime.fromisoformat
+        timed = start_time is not None
+        for path in segments:
+            for e in self._iter_segment(path, needle):
+                if not predicate(e):
+                    continue
+                if timed and not start_time <= fromisoformat(e["timestamp"]) <= end_time:
+                    continue
+                append(from_dict(e))
+
+        if limit:
+            return entries[-limit:]
+        return entries
+
+    def _overlapping_segments(self, start_time: datetime, end_time: datetime) -> List[Path]:
+        """Paths of segments whose bounds overlap [start_time, end_time]"""
+        segments = [
+            self.data_dir / segment["path"]
+            for segment in self._segments
+            if self._overlaps(segment, start_time, end_time)
+        ]
+        if self._overlaps(self._active_segment, start_time, end_time):
+            segments.append(self.audit_file)
+        return segments
+
     def query_by_date_range(
         self,
         start_time: datetime,
@@ -369,14 +736,53 @@ class AuditLogger:
         Returns:
             List of matching AuditEntry objects
         """
-        data = self.store.load()
-        entries = [
-            AuditEntry.from_dict(e)
-            for e in data["entries"]
-            if start_time <= datetime.fromisoformat(e["timestamp"]) <= end_time
-        ]
+        self.flush()
+        segments = self._overlapping_segments(start_time, end_time)
+
+        if len(segments) <= 1:
+            return list(chain.from_iterable(
+                self._scan_segment(path, start_time, end_time) for path in segments
+            ))
+
+        # Segments are independent: scan them concurrently, keep segment order
+        workers = min(len(segments), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._scan_segment, path, start_time, end_time)
+                for path in segments
+            ]
+            return list(chain.from_iterable(f.result() for f in futures))
+
+    def _scan_segment(
+        self,
+        path: Path,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> List[AuditEntry]:
+        """Collect entries of one segment within [start_time, end_time]"""
+        entries: List[AuditEntry] = []
+        append = entries.append
+        from_dict = AuditEntry.from_dict
+        fromisoformat = datetime.fromisoformat
+        for e in self._iter_segment(path):
+            if start_time <= fromisoformat(e["timestamp"]) <= end_time:
+                append(from_dict(e))
         return entries
 
+    @staticmethod
+    def _overlaps(
+        segment: Dict[str, Any],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> bool:
+        """Check whether a segment's [start_ts, end_ts] overlaps a range"""
+        if segment["start_ts"] is None:
+            return False
+        return (
+            datetime.fromisoformat(segment["start_ts"]) <= end_time
+            and datetime.fromisoformat(segment["end_ts"]) >= start_time
+        )
+
     def get_recent_entries(self, limit: int = 100) -> List[AuditEntry]:
         """
         Get most recent audit entries
@@ -387,14 +793,30 @@ class AuditLogger:
         Returns:
             List of AuditEntry objects (newest first)
         """
-        data = self.store.load()
-        all_entries = [AuditEntry.from_dict(e) for e in data["entries"]]
-        return all_entries[-limit:][::-1]
+        self.flush()
+        recent = self._recent
+        if limit <= len(recent) or len(recent) == self.get_entry_count():
+            return list(islice(reversed(recent), limit))
+
+        # Tail segments newest first until enough entries are collected
+        entries: List[AuditEntry] = []
+        extend = entries.extend
+        from_dict = AuditEntry.from_dict
+        paths = [self.audit_file] + [
+            self.data_dir / segment["path"] for segment in reversed(self._segments)
+        ]
+        for path in paths:
+            chunk = self._segment_store(path).tail(limit - len(entries))
+            extend(map(from_dict, reversed(chunk)))
+            if len(entries) >= limit:
+                break
+        return entries
 
     def get_entry_count(self) -> int:
         """Get total audit entries"""
-        data = self.store.load()
-        return len(data["entries"])
+        self.flush()
+        rotated = sum(segment["count"] for segment in self._segments)
+        return rotated + self._active_segment["count"]
 
 
 # ============================================================================
@@ -405,7 +827,6 @@ if __name__ == "__main__":
     import unittest
     import tempfile
     import shutil
-    import os
 
     class TestAuditLogger(unittest.TestCase):
         """Test suite for AuditLogger"""
@@ -555,4 +976,211 @@ if __name__ == "__main__":
             # Timestamps should be monotonically increasing
             self.assertLessEqual(entry1.timestamp, entry2.timestamp)
 
+        def test_compact_mode(self):
+            """Test compact mode skips messages and omits None fields"""
+            logger = AuditLogger(self.test_dir, compact=True)
+            entry = logger.log_auth_failed("alice", "invalid_credentials")
+
+            self.assertIsNone(entry.message)
+            stored = entry.to_dict()
+            self.assertNotIn("message", stored)
+            self.assertNotIn("client_id", stored)
+
+            # Queries tolerate the missing fields
+            results = logger.query_by_username("alice")
+            self.assertEqual(len(results), 1)
+            self.assertIsNone(results[0].client_id)
+            self.assertEqual(results[0].error, "invalid_credentials")
+            self.assertEqual(len(logger.query_by_client("client-1")), 0)
+
+        def test_audit_entry_has_no_dict(self):
+            """Test AuditEntry uses slots (no per-instance __dict__)"""
+            entry = self.logger.log_auth_success("client-1", "alice")
+            self.assertFalse(hasattr(entry, "__dict__"))
+            self.assertEqual(AuditEntry.from_dict(entry.to_dict()).username, "alice")
+
+        def test_recent_entries_from_buffer(self):
+            """Test recent entries are served newest first without disk reads"""
+            for i in range(5):
+                self.logger.log_auth_success(f"client-{i}", f"user-{i}")
+
+            self.logger._iter_all = None  # any disk scan would fail
+            recent = self.logger.get_recent_entries(limit=3)
+            self.assertEqual([e.username for e in recent], ["user-4", "user-3", "user-2"])
+
+        def test_recent_entries_after_restart(self):
+            """Test buffer is primed from disk and falls back past its size"""
+            logger = AuditLogger(self.test_dir, segment_max_bytes=1)
+            for i in range(3):
+                logger.log_auth_success(f"client-{i}", f"user-{i}")
+
+            # All entries rotated out: buffer is empty, fallback tails segments
+            reopened = AuditLogger(self.test_dir, segment_max_bytes=1)
+            self.assertEqual(len(reopened._recent), 0)
+            reopened._iter_all = None  # must not load every entry
+            recent = reopened.get_recent_entries(limit=2)
+            self.assertEqual([e.username for e in recent], ["user-2", "user-1"])
+            recent = reopened.get_recent_entries(limit=10)
+            self.assertEqual(len(recent), 3)
+
+            reopened = AuditLogger(self.test_dir)
+            reopened.log_auth_success("client-3", "user-3")
+            primed = AuditLogger(self.test_dir)
+            self.assertEqual(len(primed._recent), 1)
+            self.assertEqual(primed.get_recent_entries(limit=1)[0].username, "user-3")
+
+        def test_query_multiple_filters(self):
+            """Test combined filters match all fields"""
+            from datetime import timedelta
+
+            self.logger.log_auth_success("client-1", "alice")
+            self.logger.log_auth_failed("alice", "reason")
+            self.logger.log_auth_success("client-2", "alice")
+            self.logger.log_tool_execution("client-1", "alice", "greet", "success", 10)
+
+            results = self.logger.query(
+                client_id="client-1", event_type=EventType.AUTH_SUCCESS.value
+            )
+            self.assertEqual(len(results), 1)
+            self.assertEqual(len(self.logger.query(username="alice", status="failure")), 1)
+            self.assertEqual(len(self.logger.query(username="alice", limit=2)), 2)
+            self.assertEqual(len(self.logger.query()), 4)
+
+            now = datetime.now(timezone.utc)
+            self.assertEqual(len(self.logger.query(client_id="client-1", start_time=now)), 0)
+            self.assertEqual(
+                len(self.logger.query(client_id="client-1", end_time=now + timedelta(1))), 2
+            )
+
+        def test_query_unknown_filter(self):
+            """Test unknown filter names are rejected"""
+            with self.assertRaises(ValueError):
+                self.logger.query(client_id="client-1", message="x")
+
+        def test_background_queue(self):
+            """Test queued entries are written before reads"""
+            logger = AuditLogger(self.test_dir, queue_maxsize=100)
+            try:
+                for i in range(200):
+                    logger.log_auth_success("client-1", f"user-{i}")
+
+                self.assertEqual(logger.get_entry_count(), 200)
+                self.assertEqual(len(logger.query_by_client("client-1")), 200)
+                self.assertEqual(logger.get_recent_entries(limit=1)[0].username, "user-199")
+                self.assertEqual(logger.get_queue_stats()["dropped"], 0)
+            finally:
+                logger.close()
+
+            # After close, writes are synchronous again
+            logger.log_auth_success("client-1", "late")
+            self.assertEqual(AuditLogger(self.test_dir).get_entry_count(), 201)
+
+        def test_background_queue_drops_when_full(self):
+            """Test drop policy counts entries rejected by a full queue"""
+            logger = AuditLogger(self.test_dir, queue_maxsize=1, drop_when_full=True)
+            try:
+                with logger._lock:  # stall the drain thread
+                    for i in range(10):
+                        logger.log_auth_success("client-1", f"user-{i}")
+                    stats = logger.get_queue_stats()
+
+                self.assertGreater(stats["dropped"], 0)
+                self.assertEqual(stats["high_water"], 1)
+                self.assertEqual(logger.get_entry_count(), 10 - stats["dropped"])
+            finally:
+                logger.close()
+
+        def test_segment_rotation(self):
+            """Test active segment rotates and queries span segments"""
+            logger = AuditLogger(self.test_dir, segment_max_bytes=1)
+            for i in range(3):
+                logger.log_auth_success("client-1", f"user-{i}")
+
+            self.assertEqual(len(logger._segments), 3)
+            self.assertTrue(logger.index_file.exists())
+            self.assertEqual(logger.get_entry_count(), 3)
+            self.assertEqual(len(logger.query_by_client("client-1")), 3)
+
+            # Index survives restart
+            reopened = AuditLogger(self.test_dir, segment_max_bytes=1)
+            self.assertEqual(reopened.get_entry_count(), 3)
+
+        def test_date_range_skips_segments(self):
+            """Test date range query only reads overlapping segments"""
+            from datetime import timedelta
+
+            logger = AuditLogger(self.test_dir, segment_max_bytes=1)
+            logger.log_auth_success("client-1", "alice")
+            logger._segments[0]["start_ts"] = "2000-01-01T00:00:00+00:00"
+            logger._segments[0]["end_ts"] = "2000-01-01T00:00:00+00:00"
+            logger.log_auth_success("client-2", "bob")
+
+            scanned = []
+            original = logger._iter_segment
+
+            def tracking_iter(path, needle=None):
+                scanned.append(path.name)
+                return original(path, needle)
+
+            logger._iter_segment = tracking_iter
+            now = datetime.now(timezone.utc)
+            results = logger.query_by_date_range(now - timedelta(hours=1), now)
+
+            self.assertEqual([e.username for e in results], ["bob"])
+            self.assertEqual(scanned, [logger._segments[1]["path"]])
+
+        def test_date_range_across_segments_ordered(self):
+            """Test multi-segment date range keeps chronological order"""
+            from datetime import timedelta
+
+            logger = AuditLogger(self.test_dir, segment_max_bytes=1)
+            for i in range(6):
+                logger.log_auth_success("client-1", f"user-{i}")
+
+            now = datetime.now(timezone.utc)
+            results = logger.query_by_date_range(now - timedelta(hours=1), now)
+            self.assertEqual(
+                [e.username for e in results],
+                [f"user-{i}" for i in range(6)],
+            )
+
+        def test_binary_format(self):
+            """Test msgpack segments support the same queries"""
+            from datetime import timedelta
+
+            logger = AuditLogger(self.test_dir, segment_max_bytes=200, binary=True)
+            for i in range(6):
+                logger.log_auth_success(f"client-{i % 2}", f"user-{i}")
+
+            self.assertTrue(logger.audit_file.name.endswith(".msgpack"))
+            self.assertGreater(len(logger._segments), 0)
+            self.assertEqual(len(logger.query_by_client("client-1")), 3)
+            self.assertEqual(len(logger.query(client_id="client-0", username="user-2")), 1)
+
+            now = datetime.now(timezone.utc)
+            self.assertEqual(len(logger.query_by_date_range(now - timedelta(hours=1), now)), 6)
+
+            reopened = AuditLogger(self.test_dir, segment_max_bytes=200, binary=True)
+            self.assertEqual(reopened.get_entry_count(), 6)
+            reopened._recent.clear()
+            recent = reopened.get_recent_entries(limit=4)
+            self.assertEqual([e.username for e in recent], ["user-5", "user-4", "user-3", "user-2"])
+
+        def test_legacy_audit_json_imported(self):
+            """Test entries from legacy audit.json are imported once"""
+            legacy_dir = tempfile.mkdtemp()
+            try:
+                legacy = JSONStore(os.path.join(legacy_dir, "audit.json"), {"entries": []})
+                legacy.save({"entries": [AuditEntry(
+                    timestamp=datetime.now(timezone.utc),
+                    event_type=EventType.AUTH_SUCCESS.value,
+                    client_id="client-1",
+                ).to_dict()]})
+
+                logger = AuditLogger(legacy_dir)
+                self.assertEqual(logger.get_entry_count(), 1)
+                self.assertEqual(AuditLogger(legacy_dir).get_entry_count(), 1)
+            finally:
+                shutil.rmtree(legacy_dir)
+
     unittest.main()
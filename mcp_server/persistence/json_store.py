@@ -66,6 +66,7 @@ class JSONStore:
         self.logger = logging.getLogger(f"persistence.{self.__class__.__name__}")
         self.file_path = Path(file_path)
         self.default_data = default_data or {}
+        self._temp_path = self.file_path.with_suffix('.tmp')
 
         # Ensure directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -122,13 +123,13 @@ class JSONStore:
         """
         try:
             # Write to temporary file
-            temp_path = self.file_path.with_suffix('.tmp')
+            temp_path = self._temp_path
 
             with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, default=str)
 
             # Atomic rename
-            temp_path.replace(self.file_path)
+            os.replace(temp_path, self.file_path)
 
             # Set permissions to 0600 (rw-------)
             self.file_path.chmod(0o600)
@@ -0,0 +1,500 @@
+"""
+JSONL Store - Append-only JSON Lines file handling
+
+Module: persistence.jsonl_store
+Date: 2026-10-15
+Version: 0.3.1-alpha
+
+CHANGELOG:
+[2026-10-15 v0.3.1-alpha] Initial implementation
+  - One JSON document per line, append-only
+  - O(1) appends (no whole-file rewrite)
+  - Tracked file size for rotation decisions
+  - tail(n): reverse mmap scan, parses only the last n lines
+  - iter_matching(needle): mmap substring pre-filter, zero-copy parse
+  - Persistent O_APPEND descriptor, unbuffered os.write appends
+  - sync() / truncate() for logs replayed into a snapshot
+  - append_batch(): many entries in one write (+ at most one fsync)
+
+ARCHITECTURE:
+JSONLStore provides:
+  - Cheap appends for logs that only ever grow (audit trail)
+  - Sequential iteration over stored entries
+  - Restrictive file permissions (0600)
+
+Unlike JSONStore, the file is never rewritten: callers that need
+bounded files rotate them (see AuditLogger segments).
+"""
+
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# orjson is optional: faster parsing, same output as json.loads
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from .json_store import JSONStoreIOError, JSONStoreFormatError
+
+
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+class JSONLStore:
+    """
+    Append-only JSON Lines store.
+
+    Handles:
+    - File creation with 0600 permissions
+    - Single-line appends
+    - Iteration over stored entries
+
+    The append descriptor is opened on first write and kept for the
+    lifetime of the store; call close() (or reset() after moving the
+    file away) to release it.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize JSONL store
+
+        Args:
+            file_path: Path to JSONL file
+        """
+        self.logger = logging.getLogger(f"persistence.{self.__class__.__name__}")
+        self.file_path = Path(file_path)
+
+        # Ensure directory exists
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Create file if doesn't exist
+        if not self.file_path.exists():
+            fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT, 0o600)
+            os.close(fd)
+            self.logger.info(f"Created new store: {self.file_path}")
+
+        self._size = self.file_path.stat().st_size
+        self._fd: Optional[int] = None
+
+    @staticmethod
+    def encode(entry: Dict[str, Any]) -> bytes:
+        """
+        Encode an entry as one JSON line
+
+        Args:
+            entry: Entry to encode
+
+        Returns:
+            UTF-8 encoded line, newline terminated
+        """
+        return (
+            json.dumps(entry, separators=(",", ":"), ensure_ascii=False, default=str)
+            + "\n"
+        ).encode("utf-8")
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """
+        Append an entry as a new line
+
+        Args:
+            entry: Entry to append
+
+        Raises:
+            JSONStoreIOError: If write fails
+        """
+        self.append_raw(self.encode(entry))
+
+    def append_batch(self, entries: List[Dict[str, Any]], sync: bool = False) -> None:
+        """
+        Append several entries with a single write
+
+        Args:
+            entries: Entries to append, in order
+            sync: fsync once after the write
+
+        Raises:
+            JSONStoreIOError: If write or fsync fails
+        """
+        if not entries:
+            return
+        encode = self.encode
+        self.append_raw(b"".join([encode(entry) for entry in entries]))
+        if sync:
+            self.sync()
+
+    def append_raw(self, lines: bytes) -> None:
+        """
+        Append already-encoded lines
+
+        Args:
+            lines: Newline-terminated JSON lines
+
+        Raises:
+            JSONStoreIOError: If write fails
+        """
+        try:
+            if self._fd is None:
+                self._fd = os.open(
+                    self.file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+                )
+            view = memoryview(lines)
+            while view:
+                view = view[os.write(self._fd, view):]
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to append to {self.file_path}: {e}")
+        self._size += len(lines)
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over stored entries in file order
+
+        Yields:
+            Parsed entries
+
+        Raises:
+            JSONStoreIOError: If file cannot be read
+            JSONStoreFormatError: If a line is not valid JSON
+        """
+        try:
+            f = open(self.file_path, "rb")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to read {self.file_path}: {e}")
+
+        with f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError as e:
+                    raise JSONStoreFormatError(
+                        f"Invalid JSON in {self.file_path} line {line_no}: {e}"
+                    )
+
+    @staticmethod
+    def field_needle(key: str, value: Any) -> bytes:
+        """
+        Encode a key/value pair exactly as encode() writes it
+
+        Args:
+            key: Field name
+            value: Field value
+
+        Returns:
+            Bytes that appear in every line where entry[key] == value
+        """
+        return json.dumps(
+            {key: value}, separators=(",", ":"), ensure_ascii=False, default=str
+        )[1:-1].encode("utf-8")
+
+    def iter_matching(self, needle: Optional[bytes] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over entries whose raw line contains needle
+
+        The file is memory-mapped and searched with mmap.find, so lines
+        without the needle are never parsed. Matching lines are parsed
+        straight from a memoryview slice when orjson is available (no
+        per-line copy). The needle is only a pre-filter: callers still
+        check the parsed entry.
+
+        Args:
+            needle: Bytes to look for (None = every line)
+
+        Yields:
+            Parsed entries, file order
+
+        Raises:
+            JSONStoreIOError: If file cannot be read
+            JSONStoreFormatError: If a matching line is not valid JSON
+        """
+        try:
+            f = open(self.file_path, "rb")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to read {self.file_path}: {e}")
+
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                size = len(mm)
+                find = mm.find
+                rfind = mm.rfind
+                pos = 0
+                while pos < size:
+                    if needle is None:
+                        start = pos
+                    else:
+                        hit = find(needle, pos)
+                        if hit < 0:
+                            return
+                        start = rfind(b"\n", 0, hit) + 1
+                    end = find(b"\n", start)
+                    if end < 0:
+                        end = size
+                    pos = end + 1
+                    if end == start:
+                        continue
+                    try:
+                        if HAS_ORJSON:
+                            yield _loads(view[start:end])
+                        else:
+                            yield _loads(bytes(view[start:end]))
+                    except ValueError as e:
+                        raise JSONStoreFormatError(
+                            f"Invalid JSON in {self.file_path} at byte {start}: {e}"
+                        )
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Load all entries
+
+        Returns:
+            List of parsed entries
+        """
+        return list(self.iter_entries())
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Load the last n entries without reading the whole file
+
+        Scans the memory-mapped file backwards for newlines, then parses
+        only the bytes after the n-th newline from the end.
+
+        Args:
+            n: Number of entries
+
+        Returns:
+            Up to n entries, oldest first
+
+        Raises:
+            JSONStoreIOError: If file cannot be read
+        """
+        if n <= 0:
+            return []
+
+        try:
+            with open(self.file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = len(mm)
+                    if mm[end - 1] == 0x0A:  # trailing newline
+                        end -= 1
+                    pos = end
+                    for _ in range(n):
+                        pos = mm.rfind(b"\n", 0, pos)
+                        if pos < 0:
+                            break
+                    chunk = mm[pos + 1:end]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to read {self.file_path}: {e}")
+
+        return [_loads(line) for line in chunk.split(b"\n") if line.strip()]
+
+    def size(self) -> int:
+        """Get current file size in bytes"""
+        return self._size
+
+    def close(self) -> None:
+        """Close the append descriptor (reopened on next append)"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def sync(self) -> None:
+        """
+        Flush appended data to stable storage (fsync)
+
+        Raises:
+            JSONStoreIOError: If fsync fails
+        """
+        if self._fd is None:
+            return
+        try:
+            os.fsync(self._fd)
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to sync {self.file_path}: {e}")
+
+    def truncate(self) -> None:
+        """
+        Drop every stored entry
+
+        Raises:
+            JSONStoreIOError: If truncation fails
+        """
+        try:
+            fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.close(fd)
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to truncate {self.file_path}: {e}")
+        self._size = 0
+
+    def reset(self) -> None:
+        """Forget cached state after the file was moved away"""
+        self.close()
+        if not self.file_path.exists():
+            fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT, 0o600)
+            os.close(fd)
+        self._size = self.file_path.stat().st_size
+
+
+# ============================================================================
+# Unit Tests
+# ============================================================================
+
+if __name__ == "__main__":
+    import unittest
+    import unittest.mock
+    import tempfile
+    import shutil
+
+    class TestJSONLStore(unittest.TestCase):
+        """Test suite for JSONLStore"""
+
+        def setUp(self):
+            """Setup before each test"""
+            self.test_dir = tempfile.mkdtemp()
+            self.store_path = os.path.join(self.test_dir, "test.jsonl")
+
+        def tearDown(self):
+            """Cleanup after each test"""
+            if os.path.exists(self.test_dir):
+                shutil.rmtree(self.test_dir)
+
+        def test_initialization_creates_file(self):
+            """Test initialization creates empty file"""
+            store = JSONLStore(self.store_path)
+            self.assertTrue(os.path.exists(self.store_path))
+            self.assertEqual(store.size(), 0)
+            self.assertEqual(store.load(), [])
+
+        def test_append_and_load(self):
+            """Test appended entries are loaded in order"""
+            store = JSONLStore(self.store_path)
+            store.append({"id": 1})
+            store.append({"id": 2, "text": "é"})
+
+            entries = store.load()
+            self.assertEqual([e["id"] for e in entries], [1, 2])
+            self.assertEqual(entries[1]["text"], "é")
+
+        def test_one_line_per_entry(self):
+            """Test each entry takes exactly one line"""
+            store = JSONLStore(self.store_path)
+            store.append({"text": "multi\nline"})
+            store.append({"id": 2})
+
+            with open(self.store_path, "rb") as f:
+                self.assertEqual(len(f.readlines()), 2)
+
+        def test_size_tracks_appends(self):
+            """Test size matches bytes on disk"""
+            store = JSONLStore(self.store_path)
+            store.append({"id": 1})
+            self.assertEqual(store.size(), os.path.getsize(self.store_path))
+
+            # Reopening picks up existing size
+            reopened = JSONLStore(self.store_path)
+            self.assertEqual(reopened.size(), store.size())
+
+        def test_tail(self):
+            """Test tail returns the last entries in file order"""
+            store = JSONLStore(self.store_path)
+            self.assertEqual(store.tail(3), [])
+            for i in range(5):
+                store.append({"id": i})
+
+            self.assertEqual([e["id"] for e in store.tail(2)], [3, 4])
+            self.assertEqual([e["id"] for e in store.tail(10)], [0, 1, 2, 3, 4])
+            self.assertEqual(store.tail(0), [])
+
+        def test_iter_matching(self):
+            """Test needle pre-filter only yields lines containing it"""
+            store = JSONLStore(self.store_path)
+            self.assertEqual(list(store.iter_matching(b"x")), [])
+            for name in ["alice", "bob", "alice", "alicia"]:
+                store.append({"user": name})
+
+            needle = JSONLStore.field_needle("user", "alice")
+            self.assertEqual(len(list(store.iter_matching(needle))), 2)
+            self.assertEqual(len(list(store.iter_matching())), 4)
+            self.assertEqual(list(store.iter_matching(b"nobody")), [])
+
+        def test_append_descriptor_reused(self):
+            """Test one descriptor serves every append until close/reset"""
+            store = JSONLStore(self.store_path)
+            store.append({"id": 1})
+            fd = store._fd
+            store.append({"id": 2})
+            self.assertEqual(store._fd, fd)
+
+            # After the file is moved away, reset() targets a fresh file
+            os.replace(self.store_path, self.store_path + ".old")
+            store.reset()
+            self.assertIsNone(store._fd)
+            store.append({"id": 3})
+            self.assertEqual([e["id"] for e in store.load()], [3])
+            self.assertEqual(len(JSONLStore(self.store_path + ".old").load()), 2)
+
+            store.close()
+            self.assertIsNone(store._fd)
+
+        def test_append_batch(self):
+            """Test a batch is written in one append, in order"""
+            store = JSONLStore(self.store_path)
+            store.append_batch([])
+            self.assertIsNone(store._fd)
+
+            with unittest.mock.patch.object(store, "append_raw", wraps=store.append_raw) as raw:
+                store.append_batch([{"id": 1}, {"id": 2}, {"id": 3}], sync=True)
+            self.assertEqual(raw.call_count, 1)
+            self.assertEqual([e["id"] for e in store.load()], [1, 2, 3])
+
+        def test_truncate(self):
+            """Test truncate empties the file and keeps appending"""
+            store = JSONLStore(self.store_path)
+            store.append({"id": 1})
+            store.sync()
+            store.truncate()
+            self.assertEqual(store.size(), 0)
+            self.assertEqual(store.load(), [])
+
+            store.append({"id": 2})
+            self.assertEqual([e["id"] for e in store.load()], [2])
+            self.assertEqual(store.size(), os.path.getsize(self.store_path))
+
+        def test_file_permissions(self):
+            """Test file has restrictive permissions"""
+            JSONLStore(self.store_path)
+            mode = os.stat(self.store_path).st_mode & 0o777
+            self.assertEqual(mode, 0o600)
+
+        def test_invalid_line_raises_error(self):
+            """Test corrupted line raises format error"""
+            with open(self.store_path, "w") as f:
+                f.write('{"id": 1}\n{invalid}\n')
+
+            store = JSONLStore(self.store_path)
+            with self.assertRaises(JSONStoreFormatError):
+                store.load()
+
+    unittest.main()
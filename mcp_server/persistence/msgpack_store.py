@@ -0,0 +1,293 @@
+"""
+Msgpack Store - Append-only length-prefixed msgpack frames
+
+Module: persistence.msgpack_store
+Date: 2026-10-15
+Version: 0.3.1-alpha
+
+CHANGELOG:
+[2026-10-15 v0.3.1-alpha] Initial implementation
+  - Binary counterpart of JSONLStore (same interface)
+  - Frames: 4-byte little-endian length + msgpack payload
+  - mmap frame walk with substring pre-filter, zero-copy unpack
+  - JSON Lines dump for operators
+  - Shares file handling (append descriptor) with JSONLStore
+
+ARCHITECTURE:
+MsgpackStore provides:
+  - Smaller files and faster encode/decode than JSON text
+  - Cheap appends for logs that only ever grow (audit trail)
+  - Restrictive file permissions (0600)
+
+Frames cannot be found by scanning backwards, so tail() walks the frame
+headers forward (4-byte reads only) and unpacks just the last n payloads.
+
+Requires the optional msgpack package.
+
+Dump a file as JSON Lines:
+    python -m mcp_server.persistence.msgpack_store --dump data/audit.msgpack
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+from .json_store import JSONStoreIOError, JSONStoreFormatError
+from .jsonl_store import JSONLStore
+
+
+_HEADER = struct.Struct("<I")
+
+
+class MsgpackStore(JSONLStore):
+    """
+    Append-only store of length-prefixed msgpack frames.
+
+    Same interface as JSONLStore (file handling and the append descriptor
+    are inherited); only the encoding and readers differ.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize msgpack store
+
+        Args:
+            file_path: Path to msgpack file
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if not HAS_MSGPACK:
+            raise ImportError("msgpack required for binary audit storage")
+        super().__init__(file_path)
+
+    @staticmethod
+    def encode(entry: Dict[str, Any]) -> bytes:
+        """
+        Encode an entry as one frame
+
+        Args:
+            entry: Entry to encode
+
+        Returns:
+            Length header + msgpack payload
+        """
+        payload = msgpack.packb(entry, default=str)
+        return _HEADER.pack(len(payload)) + payload
+
+    @staticmethod
+    def field_needle(key: str, value: Any) -> bytes:
+        """
+        Encode a key/value pair exactly as encode() writes it in a map
+
+        Args:
+            key: Field name
+            value: Field value
+
+        Returns:
+            Bytes that appear in every frame where entry[key] == value
+        """
+        return msgpack.packb(key) + msgpack.packb(value, default=str)
+
+    def _iter_frames(self, mm: mmap.mmap) -> Iterator[tuple]:
+        """Yield (start, end) payload offsets of every frame"""
+        size = len(mm)
+        pos = 0
+        while pos + _HEADER.size <= size:
+            (length,) = _HEADER.unpack_from(mm, pos)
+            start = pos + _HEADER.size
+            end = start + length
+            if end > size:
+                raise JSONStoreFormatError(f"Truncated frame in {self.file_path} at byte {pos}")
+            yield start, end
+            pos = end
+
+    def iter_matching(self, needle: Optional[bytes] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over entries whose raw frame contains needle
+
+        Payloads are unpacked straight from memoryview slices of the
+        mapped file; frames without the needle are never unpacked. The
+        needle is only a pre-filter: callers still check the entry.
+
+        Args:
+            needle: Bytes to look for (None = every frame)
+
+        Yields:
+            Parsed entries, file order
+
+        Raises:
+            JSONStoreIOError: If file cannot be read
+            JSONStoreFormatError: If a frame is corrupted
+        """
+        try:
+            f = open(self.file_path, "rb")
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to read {self.file_path}: {e}")
+
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
+                find = mm.find
+                for start, end in self._iter_frames(mm):
+                    if needle is not None and find(needle, start, end) < 0:
+                        continue
+                    try:
+                        yield msgpack.unpackb(view[start:end])
+                    except (ValueError, msgpack.UnpackException) as e:
+                        raise JSONStoreFormatError(
+                            f"Invalid frame in {self.file_path} at byte {start}: {e}"
+                        )
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over stored entries in file order"""
+        return self.iter_matching(None)
+
+    def tail(self, n: int) -> List[Dict[str, Any]]:
+        """
+        Load the last n entries
+
+        Walks frame headers only, then unpacks the last n payloads.
+
+        Args:
+            n: Number of entries
+
+        Returns:
+            Up to n entries, oldest first
+
+        Raises:
+            JSONStoreIOError: If file cannot be read
+        """
+        if n <= 0:
+            return []
+
+        try:
+            with open(self.file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    last = deque(self._iter_frames(mm), maxlen=n)
+                    return [msgpack.unpackb(mm[start:end]) for start, end in last]
+        except FileNotFoundError:
+            return []
+        except JSONStoreFormatError:
+            raise
+        except Exception as e:
+            raise JSONStoreIOError(f"Failed to read {self.file_path}: {e}")
+
+    def dump(self, out: TextIO = sys.stdout) -> int:
+        """
+        Write every entry as one JSON line (for operators)
+
+        Args:
+            out: Text stream to write to
+
+        Returns:
+            Number of entries written
+        """
+        count = 0
+        for entry in self.iter_entries():
+            out.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            count += 1
+        return count
+
+
+# ============================================================================
+# Unit Tests
+# ============================================================================
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--dump":
+        MsgpackStore(sys.argv[2]).dump()
+        sys.exit(0)
+
+    import unittest
+    import tempfile
+    import shutil
+    import io
+
+    class TestMsgpackStore(unittest.TestCase):
+        """Test suite for MsgpackStore"""
+
+        def setUp(self):
+            """Setup before each test"""
+            self.test_dir = tempfile.mkdtemp()
+            self.store_path = os.path.join(self.test_dir, "test.msgpack")
+
+        def tearDown(self):
+            """Cleanup after each test"""
+            if os.path.exists(self.test_dir):
+                shutil.rmtree(self.test_dir)
+
+        def test_initialization_creates_file(self):
+            """Test initialization creates empty file"""
+            store = MsgpackStore(self.store_path)
+            self.assertTrue(os.path.exists(self.store_path))
+            self.assertEqual(store.load(), [])
+            self.assertEqual(store.tail(5), [])
+
+        def test_append_and_load(self):
+            """Test appended entries are loaded in order"""
+            store = MsgpackStore(self.store_path)
+            store.append({"id": 1})
+            store.append({"id": 2, "text": "é\n"})
+
+            entries = store.load()
+            self.assertEqual([e["id"] for e in entries], [1, 2])
+            self.assertEqual(entries[1]["text"], "é\n")
+            self.assertEqual(store.size(), os.path.getsize(self.store_path))
+
+        def test_tail(self):
+            """Test tail returns the last entries in file order"""
+            store = MsgpackStore(self.store_path)
+            for i in range(5):
+                store.append({"id": i})
+
+            self.assertEqual([e["id"] for e in store.tail(2)], [3, 4])
+            self.assertEqual(len(store.tail(10)), 5)
+
+        def test_iter_matching(self):
+            """Test needle pre-filter only yields frames containing it"""
+            store = MsgpackStore(self.store_path)
+            for name in ["alice", "bob", "alice", "alicia"]:
+                store.append({"user": name})
+
+            needle = MsgpackStore.field_needle("user", "alice")
+            self.assertEqual(len(list(store.iter_matching(needle))), 2)
+            self.assertEqual(len(list(store.iter_matching())), 4)
+
+        def test_truncated_frame_raises_error(self):
+            """Test a partially written frame raises format error"""
+            store = MsgpackStore(self.store_path)
+            store.append({"id": 1})
+            with open(self.store_path, "ab") as f:
+                f.write(_HEADER.pack(100) + b"xx")
+
+            with self.assertRaises(JSONStoreFormatError):
+                store.load()
+
+        def test_dump(self):
+            """Test dump writes one JSON line per entry"""
+            store = MsgpackStore(self.store_path)
+            store.append({"id": 1})
+            store.append({"id": 2})
+
+            out = io.StringIO()
+            self.assertEqual(store.dump(out), 2)
+            self.assertEqual(json.loads(out.getvalue().splitlines()[1]), {"id": 2})
+
+    unittest.main()
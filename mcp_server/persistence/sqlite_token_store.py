@@ -0,0 +1,589 @@
+"""
+SQLite Token Store - Token persistence backed by SQLite (WAL)
+
+Module: persistence.sqlite_token_store
+Date: 2026-10-15
+Version: 0.3.1-alpha
+
+CHANGELOG:
+[2026-10-15 v0.3.1-alpha] Initial implementation
+  - Same public API as TokenManager
+  - tokens table indexed on hashes, jti, client_id and refresh expiry
+  - Timestamps stored as INTEGER epoch seconds
+  - cleanup_expired is a single DELETE statement
+  - One-time import of tokens.json / tokens.log
+  - tokens.db created 0600 before SQLite opens it (-wal / -shm inherit it)
+
+ARCHITECTURE:
+SQLiteTokenStore provides:
+  - Indexed lookups without loading the whole registry in memory
+  - In-place updates (no file rewrite per mutation)
+  - Concurrent readers with one writer (WAL journal)
+
+Storage layout (data_dir):
+  - tokens.db      SQLite database (plus -wal / -shm while open)
+
+Epoch seconds drop sub-second precision, which token expiry (JWT exp is
+whole seconds) never uses.
+"""
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List
+
+from .token_store import (
+    TokenManager,
+    TokenRecord,
+    TokenStoreError,
+    TokenNotFoundError,
+    TokenRevoked,
+    HASH_ALG,
+    LEGACY_HASH_ALG,
+)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    jti TEXT PRIMARY KEY,
+    client_id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    access_hash TEXT NOT NULL UNIQUE,
+    refresh_hash TEXT NOT NULL UNIQUE,
+    created_at INTEGER NOT NULL,
+    access_expires_at INTEGER NOT NULL,
+    refresh_expires_at INTEGER NOT NULL,
+    revoked INTEGER NOT NULL DEFAULT 0,
+    revoked_at INTEGER,
+    hash_alg TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tokens_client_id ON tokens (client_id);
+CREATE INDEX IF NOT EXISTS tokens_refresh_expires_at ON tokens (refresh_expires_at);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_COLUMNS = (
+    "jti, client_id, username, access_hash, refresh_hash, created_at, "
+    "access_expires_at, refresh_expires_at, revoked, revoked_at, hash_alg"
+)
+
+
+def _to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """Convert a datetime to epoch seconds (None passes through)"""
+    return int(value.timestamp()) if value is not None else None
+
+
+def _from_epoch(value: Optional[int]) -> Optional[datetime]:
+    """Convert epoch seconds to an aware UTC datetime (None passes through)"""
+    return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+
+def _row_to_record(row: tuple) -> TokenRecord:
+    """Build a TokenRecord from a row selected with _COLUMNS"""
+    return TokenRecord(
+        jti=row[0],
+        client_id=sys.intern(row[1]),
+        username=sys.intern(row[2]),
+        access_token_hash=row[3],
+        refresh_token_hash=row[4],
+        created_at=_from_epoch(row[5]),
+        access_expires_at=_from_epoch(row[6]),
+        refresh_expires_at=_from_epoch(row[7]),
+        revoked=bool(row[8]),
+        revoked_at=_from_epoch(row[9]),
+        hash_alg=row[10],
+    )
+
+
+class SQLiteTokenStore:
+    """
+    Token persistence and revocation backed by SQLite.
+
+    Drop-in alternative to TokenManager for large registries. The
+    connection is shared between threads and serialized by an RLock.
+    """
+
+    generate_jti = staticmethod(TokenManager.generate_jti)
+
+    def __init__(self, data_dir: str = "./data"):
+        """
+        Initialize SQLite token store
+
+        Args:
+            data_dir: Directory for data files
+
+        Raises:
+            TokenStoreError: If the database cannot be opened
+        """
+        self.logger = logging.getLogger("persistence.sqlite_token_store")
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file = self.data_dir / "tokens.db"
+
+        self._lock = threading.RLock()
+        try:
+            # 0600 before SQLite opens it: the -wal / -shm files (same
+            # token hashes) are created with the database file's mode
+            os.close(os.open(self.db_file, os.O_RDWR | os.O_CREAT, 0o600))
+            for suffix in ("", "-wal", "-shm"):
+                path = self.db_file.with_name(self.db_file.name + suffix)
+                if path.exists():
+                    path.chmod(0o600)
+            self._conn = sqlite3.connect(
+                str(self.db_file), check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            raise TokenStoreError(f"Failed to open {self.db_file}: {e}")
+
+        self._migrate_json_store()
+        self._has_legacy = self._conn.execute(
+            "SELECT 1 FROM tokens WHERE hash_alg = ? LIMIT 1", (LEGACY_HASH_ALG,)
+        ).fetchone() is not None
+
+        self.logger.info(f"SQLiteTokenStore initialized (file={self.db_file})")
+
+    def _migrate_json_store(self) -> None:
+        """Import tokens.json (and its log) once, into an empty database"""
+        if not (self.data_dir / "tokens.json").exists():
+            return
+        if self._conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+            return
+
+        manager = TokenManager(str(self.data_dir))
+        records = [
+            TokenRecord._from_cached(t) for t in manager._data["tokens"]
+        ]
+        manager.close()
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO tokens ({_COLUMNS}) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                    [self._record_row(r) for r in records],
+                )
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('json_imported', ?)",
+                    (datetime.now(timezone.utc).isoformat(),),
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.logger.info(f"Imported {len(records)} tokens from tokens.json")
+
+    @staticmethod
+    def _record_row(record: TokenRecord) -> tuple:
+        """Convert a TokenRecord to a row in _COLUMNS order"""
+        return (
+            record.jti,
+            record.client_id,
+            record.username,
+            record.access_token_hash,
+            record.refresh_token_hash,
+            _to_epoch(record.created_at),
+            _to_epoch(record.access_expires_at),
+            _to_epoch(record.refresh_expires_at),
+            int(record.revoked),
+            _to_epoch(record.revoked_at),
+            record.hash_alg,
+        )
+
+    def create_token(
+        self,
+        jti: str,
+        client_id: str,
+        username: str,
+        access_token: str,
+        refresh_token: str,
+        access_expires_at: datetime,
+        refresh_expires_at: datetime,
+    ) -> TokenRecord:
+        """
+        Create and store a new token record
+
+        Args:
+            jti: JWT ID (unique identifier)
+            client_id: Client identifier
+            username: Username
+            access_token: Access token string
+            refresh_token: Refresh token string
+            access_expires_at: Access token expiration time
+            refresh_expires_at: Refresh token expiration time
+
+        Returns:
+            TokenRecord with stored data
+
+        Raises:
+            TokenStoreError: If jti or a token hash is already stored
+        """
+        record = TokenRecord(
+            jti=jti,
+            client_id=client_id,
+            username=username,
+            access_token_hash=TokenManager._hash_token(access_token),
+            refresh_token_hash=TokenManager._hash_token(refresh_token),
+            created_at=datetime.now(timezone.utc),
+            access_expires_at=access_expires_at,
+            refresh_expires_at=refresh_expires_at,
+        )
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    f"INSERT INTO tokens ({_COLUMNS}) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                    self._record_row(record),
+                )
+        except sqlite3.IntegrityError as e:
+            raise TokenStoreError(f"Token {jti} already stored: {e}")
+
+        self.logger.info(f"Token created: {jti} for {username}")
+        return record
+
+    def validate_token(
+        self,
+        token: str,
+        token_type: str = "access",
+    ) -> Optional[TokenRecord]:
+        """
+        Validate token and check if it's in the store and not revoked
+
+        Args:
+            token: Token string
+            token_type: "access" or "refresh"
+
+        Returns:
+            TokenRecord if valid, raises exception otherwise
+
+        Raises:
+            TokenNotFoundError: Token not found
+            TokenRevoked: Token has been revoked
+        """
+        row = self._lookup(TokenManager._hash_token(token), token_type)
+        if row is None and self._has_legacy:
+            row = self._lookup(TokenManager._hash_token(token, LEGACY_HASH_ALG), token_type)
+        return self._check_valid(row, token_type)
+
+    def validate_token_hash(
+        self,
+        token_hash: str,
+        token_type: str = "access",
+    ) -> Optional[TokenRecord]:
+        """
+        Validate an already hashed token (skips hashing)
+
+        Args:
+            token_hash: Token hash, as computed by TokenManager._hash_token()
+            token_type: "access" or "refresh"
+
+        Returns:
+            TokenRecord if valid, raises exception otherwise
+
+        Raises:
+            TokenNotFoundError: Token not found
+            TokenRevoked: Token has been revoked
+        """
+        return self._check_valid(self._lookup(token_hash, token_type), token_type)
+
+    def _lookup(self, token_hash: str, token_type: str) -> Optional[tuple]:
+        """
+        Find the stored row for a token hash
+
+        Args:
+            token_hash: Token hash
+            token_type: "access" or "refresh"
+
+        Returns:
+            Row in _COLUMNS order, or None
+        """
+        if token_type == "access":
+            column = "access_hash"
+        elif token_type == "refresh":
+            column = "refresh_hash"
+        else:
+            return None
+
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT {_COLUMNS} FROM tokens WHERE {column} = ?", (token_hash,)
+            ).fetchone()
+
+    @staticmethod
+    def _check_valid(row: Optional[tuple], token_type: str) -> TokenRecord:
+        """
+        Build the record for a lookup result, rejecting misses and revoked tokens
+
+        Args:
+            row: Result of _lookup()
+            token_type: "access" or "refresh" (for the error message)
+
+        Returns:
+            TokenRecord
+
+        Raises:
+            TokenNotFoundError: Token not found
+            TokenRevoked: Token has been revoked
+        """
+        if row is None:
+            raise TokenNotFoundError(f"Token not found in store ({token_type})")
+        if row[8]:
+            raise TokenRevoked(f"Token {row[0]} has been revoked")
+        return _row_to_record(row)
+
+    def revoke_token(self, jti: str) -> None:
+        """
+        Revoke a token by JTI
+
+        Args:
+            jti: JWT ID to revoke
+
+        Raises:
+            TokenNotFoundError: JTI not found
+        """
+        now = _to_epoch(datetime.now(timezone.utc))
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE tokens SET revoked = 1, revoked_at = ? WHERE jti = ?", (now, jti)
+            )
+        if cursor.rowcount == 0:
+            raise TokenNotFoundError(f"JTI {jti} not found in store")
+        self.logger.info(f"Token revoked: {jti}")
+
+    def cleanup_expired(self) -> int:
+        """
+        Remove expired tokens from store
+
+        Returns:
+            Number of tokens removed
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM tokens WHERE refresh_expires_at <= ?", (_to_epoch(now),)
+            )
+            removed_count = cursor.rowcount
+            if removed_count > 0:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_cleanup', ?)",
+                    (now.isoformat(),),
+                )
+
+        if removed_count > 0:
+            self.logger.info(f"Cleanup removed {removed_count} expired tokens")
+        return removed_count
+
+    def get_token_by_jti(self, jti: str) -> Optional[TokenRecord]:
+        """
+        Get token record by JTI
+
+        Args:
+            jti: JWT ID
+
+        Returns:
+            TokenRecord if found, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM tokens WHERE jti = ?", (jti,)
+            ).fetchone()
+        return _row_to_record(row) if row is not None else None
+
+    def list_client_tokens(self, client_id: str) -> list:
+        """
+        List all tokens for a client
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            List of TokenRecord objects
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM tokens WHERE client_id = ? ORDER BY rowid",
+                (client_id,),
+            ).fetchall()
+        return [_row_to_record(row) for row in rows]
+
+    def list_client_jtis(self, client_id: str) -> List[str]:
+        """
+        List token JTIs for a client (no record construction)
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            List of JTIs, creation order
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT jti FROM tokens WHERE client_id = ? ORDER BY rowid", (client_id,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def flush_now(self) -> None:
+        """No-op: every statement is committed as it runs"""
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# ============================================================================
+# Unit Tests
+# ============================================================================
+
+if __name__ == "__main__":
+    import unittest
+    import tempfile
+    import shutil
+    from datetime import timedelta
+
+    class TestSQLiteTokenStore(unittest.TestCase):
+        """Test suite for SQLiteTokenStore"""
+
+        def setUp(self):
+            """Setup before each test"""
+            self.test_dir = tempfile.mkdtemp()
+            self.store = SQLiteTokenStore(self.test_dir)
+            self.now = datetime.now(timezone.utc)
+
+        def tearDown(self):
+            """Cleanup after each test"""
+            self.store.close()
+            if os.path.exists(self.test_dir):
+                shutil.rmtree(self.test_dir)
+
+        def _create(self, store, i, client_id="client-123", days=7):
+            return store.create_token(
+                jti=f"token-{i}",
+                client_id=client_id,
+                username="alice",
+                access_token=f"access-{i}",
+                refresh_token=f"refresh-{i}",
+                access_expires_at=self.now + timedelta(hours=1),
+                refresh_expires_at=self.now + timedelta(days=days),
+            )
+
+        def test_initialization(self):
+            """Test database is created in WAL mode with restrictive permissions"""
+            self.assertTrue(self.store.db_file.exists())
+            mode = self.store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(mode, "wal")
+            self.assertEqual(os.stat(self.store.db_file).st_mode & 0o777, 0o600)
+
+            # The WAL and shared-memory files hold the same hashes
+            self._create(self.store, 1)
+            for suffix in ("-wal", "-shm"):
+                path = f"{self.store.db_file}{suffix}"
+                self.assertTrue(os.path.exists(path), path)
+                self.assertEqual(os.stat(path).st_mode & 0o777, 0o600, path)
+
+        def test_create_and_validate(self):
+            """Test created tokens validate by access and refresh token"""
+            self._create(self.store, 1)
+
+            record = self.store.validate_token("access-1", "access")
+            self.assertEqual(record.jti, "token-1")
+            self.assertEqual(record.hash_alg, HASH_ALG)
+            self.assertEqual(
+                record.refresh_expires_at,
+                (self.now + timedelta(days=7)).replace(microsecond=0),
+            )
+            self.assertEqual(self.store.validate_token("refresh-1", "refresh").jti, "token-1")
+
+            with self.assertRaises(TokenNotFoundError):
+                self.store.validate_token("access-1", "refresh")
+            with self.assertRaises(TokenNotFoundError):
+                self.store.validate_token("unknown", "access")
+
+        def test_duplicate_jti_rejected(self):
+            """Test storing a jti twice raises TokenStoreError"""
+            self._create(self.store, 1)
+            with self.assertRaises(TokenStoreError):
+                self.store.create_token(
+                    jti="token-1",
+                    client_id="client-123",
+                    username="alice",
+                    access_token="other-access",
+                    refresh_token="other-refresh",
+                    access_expires_at=self.now,
+                    refresh_expires_at=self.now,
+                )
+
+        def test_revoke_token(self):
+            """Test revoked tokens fail validation"""
+            self._create(self.store, 1)
+            self.store.revoke_token("token-1")
+
+            with self.assertRaises(TokenRevoked):
+                self.store.validate_token("access-1", "access")
+            self.assertIsNotNone(self.store.get_token_by_jti("token-1").revoked_at)
+            with self.assertRaises(TokenNotFoundError):
+                self.store.revoke_token("nonexistent")
+
+        def test_cleanup_expired(self):
+            """Test cleanup deletes expired tokens in one statement"""
+            self._create(self.store, 1)
+            self._create(self.store, 2, days=-1)
+
+            self.assertEqual(self.store.cleanup_expired(), 1)
+            self.assertIsNone(self.store.get_token_by_jti("token-2"))
+            self.assertIsNotNone(self.store.get_token_by_jti("token-1"))
+            self.assertEqual(self.store.cleanup_expired(), 0)
+
+        def test_list_client_tokens(self):
+            """Test listing tokens and jtis for a client"""
+            for i in range(3):
+                self._create(self.store, i, client_id="alice-id")
+            self._create(self.store, 9, client_id="bob-id")
+
+            self.assertEqual(len(self.store.list_client_tokens("alice-id")), 3)
+            self.assertEqual(
+                self.store.list_client_jtis("alice-id"),
+                ["token-0", "token-1", "token-2"],
+            )
+            self.assertEqual(self.store.list_client_tokens("charlie-id"), [])
+
+        def test_persists_across_instances(self):
+            """Test tokens survive reopening the database"""
+            self._create(self.store, 1)
+            self.store.close()
+
+            self.store = SQLiteTokenStore(self.test_dir)
+            self.assertEqual(self.store.validate_token("access-1").jti, "token-1")
+
+        def test_imports_json_store_once(self):
+            """Test tokens.json contents are imported into a new database"""
+            json_dir = tempfile.mkdtemp()
+            try:
+                manager = TokenManager(json_dir)
+                self._create(manager, 1)
+                self._create(manager, 2)
+                manager.revoke_token("token-2")
+                manager.close()
+
+                store = SQLiteTokenStore(json_dir)
+                self.assertEqual(store.validate_token("access-1").jti, "token-1")
+                with self.assertRaises(TokenRevoked):
+                    store.validate_token("access-2")
+                store.revoke_token("token-1")
+                store.close()
+
+                # Reopening does not import again
+                store = SQLiteTokenStore(json_dir)
+                with self.assertRaises(TokenRevoked):
+                    store.validate_token("access-1")
+                store.close()
+            finally:
+                shutil.rmtree(json_dir)
+
+    unittest.main()
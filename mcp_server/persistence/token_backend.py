@@ -0,0 +1,304 @@
+"""
+Token Backend - Pluggable revocation (blacklist) storage
+
+Module: persistence.token_backend
+Date: 2026-10-15
+Version: 0.3.1-alpha
+
+CHANGELOG:
+[2026-10-15 v0.3.1-alpha] Initial implementation
+  - TokenBackend interface: blacklist check/add, record lookup
+  - JSONBackend: local token store (TokenManager / SQLiteTokenStore)
+  - RedisBackend: blacklist shared between worker processes
+  - RedisBackend revokes tokens issued by other workers (no local record:
+    TTL from max_ttl_seconds); TokenBackend.shared flags such backends
+
+ARCHITECTURE:
+TokenManager keeps revocations in process memory, so workers of a
+multi-process deployment do not see each other's revocations. A
+TokenBackend puts the blacklist check behind one interface:
+
+  - JSONBackend     the local store is the source of truth (single process)
+  - RedisBackend    revocations are SETEX keys ("rev:<jti>") whose TTL is
+                    the token's remaining lifetime, so Redis expires them
+                    itself; records still come from the local store,
+                    which only knows this worker's tokens (shared = True:
+                    callers must not require a local record)
+
+Methods are coroutines so network backends never block the event loop.
+RedisBackend requires the optional redis package (redis.asyncio).
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+from .token_store import TokenManager, TokenRecord, TokenNotFoundError
+from .sqlite_token_store import SQLiteTokenStore
+
+
+class TokenBackend(ABC):
+    """Abstract revocation backend"""
+
+    # True if revocations are shared between workers, so a token may be
+    # valid (and revocable) without a record in the local store
+    shared = False
+
+    @abstractmethod
+    async def exists_blacklist(self, jti: str) -> bool:
+        """
+        Check whether a token is revoked
+
+        Args:
+            jti: JWT ID
+
+        Returns:
+            True if revoked
+        """
+
+    @abstractmethod
+    async def add_blacklist(self, jti: str, ttl_seconds: Optional[int] = None) -> None:
+        """
+        Revoke a token
+
+        Args:
+            jti: JWT ID
+            ttl_seconds: How long the revocation must be kept
+                (None = until the token's refresh expiry)
+
+        Raises:
+            TokenNotFoundError: JTI not found (local backends)
+        """
+
+    @abstractmethod
+    async def get_record(self, jti: str) -> Optional[TokenRecord]:
+        """
+        Get token record by JTI
+
+        Args:
+            jti: JWT ID
+
+        Returns:
+            TokenRecord if found, None otherwise
+        """
+
+
+class JSONBackend(TokenBackend):
+    """Backend over a local token store (the current, single-process setup)"""
+
+    def __init__(self, store: Union[TokenManager, SQLiteTokenStore]):
+        """
+        Initialize JSON backend
+
+        Args:
+            store: Local token store
+        """
+        self.store = store
+
+    async def exists_blacklist(self, jti: str) -> bool:
+        record = self.store.get_token_by_jti(jti)
+        return record is not None and record.revoked
+
+    async def add_blacklist(self, jti: str, ttl_seconds: Optional[int] = None) -> None:
+        # The local store keeps revoked records until cleanup_expired
+        self.store.revoke_token(jti)
+
+    async def get_record(self, jti: str) -> Optional[TokenRecord]:
+        return self.store.get_token_by_jti(jti)
+
+
+class RedisBackend(TokenBackend):
+    """
+    Backend sharing revocations through Redis.
+
+    Records stay in the local store; only the blacklist is shared. Each
+    revocation is mirrored locally so this worker's validate_token also
+    rejects the token. Tokens issued by another worker have no local
+    record: their revocation is kept for max_ttl_seconds.
+    """
+
+    KEY_PREFIX = "rev:"
+    DEFAULT_MAX_TTL = 7 * 24 * 3600 + 1  # refresh token lifetime
+
+    shared = True
+
+    def __init__(
+        self,
+        client,
+        store: Union[TokenManager, SQLiteTokenStore],
+        max_ttl_seconds: int = DEFAULT_MAX_TTL,
+    ):
+        """
+        Initialize Redis backend
+
+        Args:
+            client: redis.asyncio.Redis (or compatible) client
+            store: Local token store (records and local revocation)
+            max_ttl_seconds: Revocation TTL for tokens without a local
+                record (at least the refresh token lifetime)
+        """
+        self.logger = logging.getLogger("persistence.token_backend")
+        self.client = client
+        self.store = store
+        self.max_ttl_seconds = max_ttl_seconds
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        store: Union[TokenManager, SQLiteTokenStore],
+        max_ttl_seconds: int = DEFAULT_MAX_TTL,
+    ) -> "RedisBackend":
+        """
+        Create a backend connected to a Redis URL
+
+        Args:
+            url: Redis URL (e.g. "redis://localhost:6379/0")
+            store: Local token store
+            max_ttl_seconds: See __init__
+
+        Returns:
+            RedisBackend instance
+
+        Raises:
+            ImportError: If redis is not installed
+        """
+        if not HAS_REDIS:
+            raise ImportError("redis required for RedisBackend")
+        return cls(aioredis.Redis.from_url(url), store, max_ttl_seconds)
+
+    async def exists_blacklist(self, jti: str) -> bool:
+        return bool(await self.client.exists(self.KEY_PREFIX + jti))
+
+    async def add_blacklist(self, jti: str, ttl_seconds: Optional[int] = None) -> None:
+        if ttl_seconds is None:
+            record = self.store.get_token_by_jti(jti)
+            if record is None:
+                # Issued by another worker: expiry unknown here
+                ttl_seconds = self.max_ttl_seconds
+            else:
+                remaining = record.refresh_expires_at - datetime.now(timezone.utc)
+                ttl_seconds = int(remaining.total_seconds()) + 1
+        if ttl_seconds > 0:
+            await self.client.setex(self.KEY_PREFIX + jti, ttl_seconds, 1)
+
+        try:
+            self.store.revoke_token(jti)
+        except TokenNotFoundError:
+            # Token issued by another worker: the shared key is enough
+            self.logger.debug(f"Revoked {jti} without local record")
+
+    async def get_record(self, jti: str) -> Optional[TokenRecord]:
+        return self.store.get_token_by_jti(jti)
+
+
+# ============================================================================
+# Unit Tests
+# ============================================================================
+
+if __name__ == "__main__":
+    import unittest
+    import asyncio
+    import tempfile
+    import shutil
+    import os
+    from datetime import timedelta
+
+    class FakeRedis:
+        """In-memory stand-in for the two redis.asyncio calls used"""
+
+        def __init__(self):
+            self.data = {}
+
+        async def setex(self, key, ttl, value):
+            self.data[key] = (value, ttl)
+
+        async def exists(self, key):
+            return int(key in self.data)
+
+    class TestTokenBackends(unittest.TestCase):
+        """Test suite for token backends"""
+
+        def setUp(self):
+            """Setup before each test"""
+            self.test_dir = tempfile.mkdtemp()
+            self.manager = TokenManager(self.test_dir)
+            now = datetime.now(timezone.utc)
+            self.manager.create_token(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token="access-token",
+                refresh_token="refresh-token",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+
+        def tearDown(self):
+            """Cleanup after each test"""
+            self.manager.close()
+            if os.path.exists(self.test_dir):
+                shutil.rmtree(self.test_dir)
+
+        def test_json_backend(self):
+            """Test JSON backend revokes through the local store"""
+            backend = JSONBackend(self.manager)
+
+            async def test():
+                self.assertFalse(await backend.exists_blacklist("token-1"))
+                await backend.add_blacklist("token-1")
+                self.assertTrue(await backend.exists_blacklist("token-1"))
+                self.assertTrue((await backend.get_record("token-1")).revoked)
+                self.assertFalse(await backend.exists_blacklist("unknown"))
+                with self.assertRaises(TokenNotFoundError):
+                    await backend.add_blacklist("unknown")
+
+            asyncio.run(test())
+
+        def test_redis_backend(self):
+            """Test Redis backend shares revocations with a TTL"""
+            client = FakeRedis()
+            backend = RedisBackend(client, self.manager)
+            other_worker = RedisBackend(client, TokenManager(tempfile.mkdtemp()))
+
+            async def test():
+                await backend.add_blacklist("token-1")
+                _, ttl = client.data["rev:token-1"]
+                self.assertGreater(ttl, 6 * 24 * 3600)
+                self.assertLessEqual(ttl, 7 * 24 * 3600 + 1)
+
+                # Visible to another worker, and mirrored locally
+                self.assertTrue(await other_worker.exists_blacklist("token-1"))
+                self.assertTrue(self.manager.get_token_by_jti("token-1").revoked)
+
+                # Explicit TTL for tokens this worker never stored
+                await other_worker.add_blacklist("foreign", ttl_seconds=60)
+                self.assertEqual(client.data["rev:foreign"], (1, 60))
+                # Without a TTL, tokens of other workers get max_ttl_seconds
+                await other_worker.add_blacklist("foreign-no-ttl")
+                self.assertEqual(
+                    client.data["rev:foreign-no-ttl"], (1, RedisBackend.DEFAULT_MAX_TTL)
+                )
+                self.assertTrue(await backend.exists_blacklist("foreign-no-ttl"))
+
+            try:
+                asyncio.run(test())
+            finally:
+                other_worker.store.close()
+                shutil.rmtree(other_worker.store.data_dir)
+
+        def test_from_url_requires_redis(self):
+            """Test from_url fails clearly without the redis package"""
+            if HAS_REDIS:
+                self.skipTest("redis installed")
+            with self.assertRaises(ImportError):
+                RedisBackend.from_url("redis://localhost", self.manager)
+
+    unittest.main()
@@ -12,21 +12,77 @@ CHANGELOG:
   - Expiration handling
   - Blacklist checking
 
+[2026-10-15 v0.3.1-alpha] In-memory store with append-only log
+  - tokens.json parsed once, in-memory copy is authoritative
+  - Hash/jti/client indexes: validation is a dict lookup
+  - Datetimes parsed at load, serialized only on disk write
+  - Expiry min-heap on epoch seconds: cleanup only touches expired records
+  - Mutations appended to tokens.log, compacted into tokens.json
+  - Token hashes use BLAKE2b-160 (per-record hash_alg, sha256 legacy)
+  - validate_token_hash(): validation for callers that cached the hash
+  - Optional debounced flush (fsync/compaction) inside an event loop
+  - client_id/username interned (shared across a client's records)
+  - generate_jti(): one secrets.token_urlsafe call per id
+  - TokenRecord is a NamedTuple (immutable, no per-instance __dict__)
+  - Tokens accepted as str or bytes (encoded at most once)
+
 ARCHITECTURE:
 TokenManager provides:
   - Persistent token registry
   - Token hashing for comparison
   - Revocation tracking (blacklist)
   - Automatic cleanup of expired tokens
+
+tokens.json is parsed once at startup; the in-memory copy is
+authoritative and written through to disk on every mutation. Lookups go
+through dict indexes (access hash, refresh hash, jti, client) over that
+copy, so validation is one hash probe with no file I/O. Cached records hold
+datetime objects; ISO strings only exist on disk. A min-heap on refresh
+expiry lets cleanup_expired pop just the expired records.
+
+Storage layout (data_dir):
+  - tokens.json    snapshot {"tokens": [...], "last_cleanup": ...}
+  - tokens.log     mutations since the snapshot, one JSON line each:
+                   {"op": "create", <record>} / {"op": "revoke", jti, revoked_at}
+
+Tokens are high-entropy random strings, so a fast unkeyed hash is
+enough to avoid storing them in plaintext: new records use BLAKE2b with
+a 160-bit digest. Records without a hash_alg tag predate it (sha256) and
+stay valid; lookups fall back to sha256 only while such records exist.
+
+Startup loads the snapshot and replays the log. Once the log exceeds
+compact_threshold bytes (or cleanup_expired removes records), the
+snapshot is rewritten atomically and the log truncated.
+
+With flush_interval set, mutations made from a running event loop only
+mark the log dirty; a timer fsyncs / compacts once per interval, so a
+burst of N mutations costs one flush. Call flush_now() (or close())
+before shutdown.
 """
 
+import asyncio
 import logging
 import hashlib
+import sys
+import heapq
+import hmac
+import itertools
+import secrets
+import threading
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Union
 from pathlib import Path
 
 from .json_store import JSONStore, JSONStoreError
+from .jsonl_store import JSONLStore
+
+
+# Compact tokens.log into tokens.json once it grows past this size
+DEFAULT_LOG_COMPACT_BYTES = 1024 * 1024
+
+# Token hash algorithms (stored per record as "hash_alg")
+HASH_ALG = "blake2b-160"
+LEGACY_HASH_ALG = "sha256"
 
 
 class TokenStoreError(Exception):
@@ -44,32 +100,50 @@ class TokenRevoked(TokenStoreError):
     pass
 
 
-class TokenRecord:
-    """Represents a stored token record"""
+# Record fields stored as ISO strings on disk, datetimes in memory
+_DATETIME_FIELDS = ("created_at", "access_expires_at", "refresh_expires_at", "revoked_at")
 
-    def __init__(
-        self,
-        jti: str,
-        client_id: str,
-        username: str,
-        access_token_hash: str,
-        refresh_token_hash: str,
-        created_at: datetime,
-        access_expires_at: datetime,
-        refresh_expires_at: datetime,
-        revoked: bool = False,
-        revoked_at: Optional[datetime] = None,
-    ):
-        self.jti = jti
-        self.client_id = client_id
-        self.username = username
-        self.access_token_hash = access_token_hash
-        self.refresh_token_hash = refresh_token_hash
-        self.created_at = created_at
-        self.access_expires_at = access_expires_at
-        self.refresh_expires_at = refresh_expires_at
-        self.revoked = revoked
-        self.revoked_at = revoked_at
+
+def _parse_datetimes(token_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a record loaded from disk to its in-memory form (in place)"""
+    token_dict["client_id"] = sys.intern(token_dict["client_id"])
+    token_dict["username"] = sys.intern(token_dict["username"])
+    for field in _DATETIME_FIELDS:
+        value = token_dict.get(field)
+        token_dict[field] = datetime.fromisoformat(value) if value else None
+    token_dict.setdefault("revoked", False)
+    token_dict.setdefault("hash_alg", LEGACY_HASH_ALG)
+    return token_dict
+
+
+def _format_datetimes(token_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an in-memory record with datetimes serialized to ISO strings"""
+    disk_dict = dict(token_dict)
+    for field in _DATETIME_FIELDS:
+        value = disk_dict[field]
+        disk_dict[field] = value.isoformat() if value else None
+    return disk_dict
+
+
+class TokenRecord(NamedTuple):
+    """
+    Represents a stored token record.
+
+    Immutable snapshot returned by TokenManager; the manager's own state
+    lives in plain dicts.
+    """
+
+    jti: str
+    client_id: str
+    username: str
+    access_token_hash: str
+    refresh_token_hash: str
+    created_at: datetime
+    access_expires_at: datetime
+    refresh_expires_at: datetime
+    revoked: bool = False
+    revoked_at: Optional[datetime] = None
+    hash_alg: str = HASH_ALG
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON storage"""
@@ -84,6 +158,7 @@ class TokenRecord:
             "refresh_expires_at": self.refresh_expires_at.isoformat(),
             "revoked": self.revoked,
             "revoked_at": self.revoked_at.isoformat() if self.revoked_at else None,
+            "hash_alg": self.hash_alg,
         }
 
     @classmethod
@@ -91,8 +166,8 @@ class TokenRecord:
         """Create from dictionary (from JSON)"""
         return cls(
             jti=data["jti"],
-            client_id=data["client_id"],
-            username=data["username"],
+            client_id=sys.intern(data["client_id"]),
+            username=sys.intern(data["username"]),
             access_token_hash=data["access_token_hash"],
             refresh_token_hash=data["refresh_token_hash"],
             created_at=datetime.fromisoformat(data["created_at"]),
@@ -100,6 +175,24 @@ class TokenRecord:
             refresh_expires_at=datetime.fromisoformat(data["refresh_expires_at"]),
             revoked=data.get("revoked", False),
             revoked_at=datetime.fromisoformat(data["revoked_at"]) if data.get("revoked_at") else None,
+            hash_alg=data.get("hash_alg", LEGACY_HASH_ALG),
+        )
+
+    @classmethod
+    def _from_cached(cls, data: Dict[str, Any]) -> "TokenRecord":
+        """Create from an in-memory record (datetimes already parsed)"""
+        return cls(
+            data["jti"],
+            data["client_id"],
+            data["username"],
+            data["access_token_hash"],
+            data["refresh_token_hash"],
+            data["created_at"],
+            data["access_expires_at"],
+            data["refresh_expires_at"],
+            data["revoked"],
+            data["revoked_at"],
+            data["hash_alg"],
         )
 
 
@@ -109,18 +202,37 @@ class TokenManager:
 
     Stores tokens in tokens.json with hashed values.
     Supports revocation via blacklist marking.
+
+    Thread-safe: all access to the in-memory copy holds an RLock.
     """
 
-    def __init__(self, data_dir: str = "./data"):
+    def __init__(
+        self,
+        data_dir: str = "./data",
+        compact_threshold: int = DEFAULT_LOG_COMPACT_BYTES,
+        fsync: bool = False,
+        flush_interval: Optional[float] = None,
+    ):
         """
         Initialize token manager
 
         Args:
             data_dir: Directory for data files
+            compact_threshold: Log size (bytes) that triggers compaction
+            fsync: fsync tokens.log after every append
+            flush_interval: Debounce window (seconds) for fsync/compaction when
+                called from a running event loop (None = flush every mutation)
         """
         self.logger = logging.getLogger("persistence.token_manager")
         self.data_dir = Path(data_dir)
         self.tokens_file = self.data_dir / "tokens.json"
+        self.log_file = self.data_dir / "tokens.log"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self.flush_interval = flush_interval
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Initialize store with default structure
         default_data = {
@@ -128,8 +240,180 @@ class TokenManager:
             "last_cleanup": None,
         }
         self.store = JSONStore(str(self.tokens_file), default_data)
+
+        # Authoritative in-memory copy, loaded once
+        self._lock = threading.RLock()
+        self._data: Dict[str, Any] = self.store.load()
+        for token_dict in self._data["tokens"]:
+            _parse_datetimes(token_dict)
+        self._by_access: Dict[str, Dict[str, Any]] = {}
+        self._by_refresh: Dict[str, Dict[str, Any]] = {}
+        self._by_jti: Dict[str, Dict[str, Any]] = {}
+        # client_id -> {jti: token_dict}, insertion (creation) order
+        self._by_client_id: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # (refresh expiry epoch, seq, token_dict); seq keeps ties orderable
+        self._expiry_heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._heap_seq = itertools.count()
+        # Records still hashed with LEGACY_HASH_ALG (enables fallback lookup)
+        self._legacy_count = 0
+        self._rebuild_indexes()
+
+        # Replay mutations logged since the snapshot
+        self.log = JSONLStore(str(self.log_file))
+        replayed = self._replay_log()
+        if replayed:
+            self.logger.info(f"Replayed {replayed} token log entries")
+
         self.logger.info(f"TokenManager initialized (file={self.tokens_file})")
 
+    def _rebuild_indexes(self) -> None:
+        """Rebuild lookup indexes from the in-memory token list"""
+        self._by_access = {}
+        self._by_refresh = {}
+        self._by_jti = {}
+        self._by_client_id = {}
+        self._expiry_heap = []
+        self._legacy_count = 0
+        for token_dict in self._data["tokens"]:
+            self._index(token_dict)
+
+    def _replay_log(self) -> int:
+        """
+        Apply tokens.log entries to the in-memory copy
+
+        Replay is idempotent: a record already in the snapshot (crash
+        between snapshot write and log truncation) is not added twice.
+
+        Returns:
+            Number of log entries applied
+        """
+        count = 0
+        for entry in self.log.iter_entries():
+            op = entry.pop("op", None)
+            if op == "create":
+                if entry["jti"] not in self._by_jti:
+                    token_dict = _parse_datetimes(entry)
+                    self._data["tokens"].append(token_dict)
+                    self._index(token_dict)
+            elif op == "revoke":
+                token_dict = self._by_jti.get(entry["jti"])
+                if token_dict is not None:
+                    token_dict["revoked"] = True
+                    token_dict["revoked_at"] = datetime.fromisoformat(entry["revoked_at"])
+            else:
+                self.logger.warning(f"Skipping unknown token log op: {op}")
+                continue
+            count += 1
+        return count
+
+    def _append_log(self, entry: Dict[str, Any]) -> None:
+        """
+        Append one mutation to tokens.log, then flush (now or debounced)
+
+        Args:
+            entry: Log entry ({"op": ..., ...})
+        """
+        self.log.append(entry)
+        self._dirty = True
+
+        if self.flush_interval is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None:
+                if self._flush_handle is None or self._flush_loop is not loop:
+                    if self._flush_handle is not None:
+                        # Left on a loop that has ended: it will never fire
+                        self._flush_handle.cancel()
+                    self._flush_handle = loop.call_later(self.flush_interval, self._flush)
+                    self._flush_loop = loop
+                return
+
+        self._flush()
+
+    def _flush(self) -> None:
+        """fsync tokens.log if requested, compact it once it grew too large"""
+        with self._lock:
+            self._flush_handle = None
+            self._flush_loop = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            if self.fsync:
+                self.log.sync()
+            if self.log.size() >= self.compact_threshold:
+                self.compact()
+
+    def flush_now(self) -> None:
+        """Run any pending debounced flush immediately"""
+        with self._lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            self._flush()
+
+    def compact(self) -> None:
+        """Rewrite tokens.json from memory and truncate tokens.log"""
+        with self._lock:
+            self._save()
+            self.log.truncate()
+        self.logger.debug(f"Token log compacted into {self.tokens_file}")
+
+    def close(self) -> None:
+        """Flush pending writes and release the tokens.log descriptor"""
+        self.flush_now()
+        self.log.close()
+
+    def _save(self) -> None:
+        """Write the in-memory copy to disk (datetimes as ISO strings)"""
+        self.store.save({
+            **self._data,
+            "tokens": [_format_datetimes(t) for t in self._data["tokens"]],
+        })
+
+    def _index(self, token_dict: Dict[str, Any]) -> None:
+        """
+        Add a stored token dict to the lookup indexes
+
+        Args:
+            token_dict: Dict held in self._data["tokens"]
+        """
+        # setdefault: first record wins, as with the former linear scan
+        self._by_access.setdefault(token_dict["access_token_hash"], token_dict)
+        self._by_refresh.setdefault(token_dict["refresh_token_hash"], token_dict)
+        self._by_jti.setdefault(token_dict["jti"], token_dict)
+        self._by_client_id.setdefault(token_dict["client_id"], {}).setdefault(
+            token_dict["jti"], token_dict
+        )
+        heapq.heappush(
+            self._expiry_heap,
+            (token_dict["refresh_expires_at"].timestamp(), next(self._heap_seq), token_dict),
+        )
+        if token_dict["hash_alg"] == LEGACY_HASH_ALG:
+            self._legacy_count += 1
+
+    def _unindex(self, token_dict: Dict[str, Any]) -> None:
+        """
+        Remove a stored token dict from the lookup indexes
+
+        Args:
+            token_dict: Dict being dropped from self._data["tokens"]
+        """
+        for index, key in (
+            (self._by_access, token_dict["access_token_hash"]),
+            (self._by_refresh, token_dict["refresh_token_hash"]),
+            (self._by_jti, token_dict["jti"]),
+        ):
+            if index.get(key) is token_dict:
+                del index[key]
+        client_tokens = self._by_client_id.get(token_dict["client_id"])
+        if client_tokens is not None and client_tokens.get(token_dict["jti"]) is token_dict:
+            del client_tokens[token_dict["jti"]]
+            if not client_tokens:
+                del self._by_client_id[token_dict["client_id"]]
+        if token_dict["hash_alg"] == LEGACY_HASH_ALG:
+            self._legacy_count -= 1
+
     def create_token(
         self,
         jti: str,
@@ -155,6 +439,9 @@ class TokenManager:
         Returns:
             TokenRecord with stored data
         """
+        client_id = sys.intern(client_id)
+        username = sys.intern(username)
+
         # Hash tokens for storage (never store plaintext)
         access_hash = self._hash_token(access_token)
         refresh_hash = self._hash_token(refresh_token)
@@ -170,24 +457,69 @@ class TokenManager:
             refresh_expires_at=refresh_expires_at,
         )
 
-        # Store to file
-        data = self.store.load()
-        data["tokens"].append(record.to_dict())
-        self.store.save(data)
+        # Update memory, then log the mutation
+        token_dict = {
+            "jti": jti,
+            "client_id": client_id,
+            "username": username,
+            "access_token_hash": access_hash,
+            "refresh_token_hash": refresh_hash,
+            "created_at": record.created_at,
+            "access_expires_at": access_expires_at,
+            "refresh_expires_at": refresh_expires_at,
+            "revoked": False,
+            "revoked_at": None,
+            "hash_alg": HASH_ALG,
+        }
+        with self._lock:
+            self._data["tokens"].append(token_dict)
+            self._index(token_dict)
+            self._append_log({"op": "create", **_format_datetimes(token_dict)})
 
         self.logger.info(f"Token created: {jti} for {username}")
         return record
 
     def validate_token(
         self,
-        token: str,
+        token: Union[str, bytes],
         token_type: str = "access",
     ) -> Optional[TokenRecord]:
         """
         Validate token and check if it's in the store and not revoked
 
         Args:
-            token: Token string
+            token: Token string (or its UTF-8 bytes, as read off the wire)
+            token_type: "access" or "refresh"
+
+        Returns:
+            TokenRecord if valid, raises exception otherwise
+
+        Raises:
+            TokenNotFoundError: Token not found
+            TokenRevoked: Token has been revoked
+        """
+        if isinstance(token, str):
+            token = token.encode()  # once, even if the legacy hash is needed
+
+        with self._lock:
+            token_dict = self._lookup(self._hash_token(token), token_type)
+            if token_dict is None and self._legacy_count:
+                token_dict = self._lookup(self._hash_token(token, LEGACY_HASH_ALG), token_type)
+            return self._check_valid(token_dict, token_type)
+
+    def validate_token_hash(
+        self,
+        token_hash: str,
+        token_type: str = "access",
+    ) -> Optional[TokenRecord]:
+        """
+        Validate an already hashed token (skips hashing)
+
+        For callers that keep the hash for the lifetime of a bearer token
+        (e.g. per connection) instead of rehashing it on every request.
+
+        Args:
+            token_hash: Token hash, as computed by _hash_token()
             token_type: "access" or "refresh"
 
         Returns:
@@ -197,24 +529,55 @@ class TokenManager:
             TokenNotFoundError: Token not found
             TokenRevoked: Token has been revoked
         """
-        token_hash = self._hash_token(token)
-        data = self.store.load()
+        with self._lock:
+            return self._check_valid(self._lookup(token_hash, token_type), token_type)
+
+    def _lookup(self, token_hash: str, token_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the stored record for a token hash
+
+        Args:
+            token_hash: Token hash
+            token_type: "access" or "refresh"
+
+        Returns:
+            Stored token dict, or None
+        """
+        if token_type == "access":
+            token_dict = self._by_access.get(token_hash)
+            field = "access_token_hash"
+        elif token_type == "refresh":
+            token_dict = self._by_refresh.get(token_hash)
+            field = "refresh_token_hash"
+        else:
+            return None
+
+        # Constant-time confirmation of the indexed hash
+        if token_dict is None or not hmac.compare_digest(token_dict[field], token_hash):
+            return None
+        return token_dict
 
-        for token_dict in data["tokens"]:
-            record = TokenRecord.from_dict(token_dict)
+    @staticmethod
+    def _check_valid(token_dict: Optional[Dict[str, Any]], token_type: str) -> TokenRecord:
+        """
+        Build the record for a lookup result, rejecting misses and revoked tokens
 
-            # Check matching hash
-            if token_type == "access" and record.access_token_hash == token_hash:
-                if record.revoked:
-                    raise TokenRevoked(f"Token {record.jti} has been revoked")
-                return record
+        Args:
+            token_dict: Result of _lookup()
+            token_type: "access" or "refresh" (for the error message)
 
-            if token_type == "refresh" and record.refresh_token_hash == token_hash:
-                if record.revoked:
-                    raise TokenRevoked(f"Token {record.jti} has been revoked")
-                return record
+        Returns:
+            TokenRecord
 
-        raise TokenNotFoundError(f"Token not found in store ({token_type})")
+        Raises:
+            TokenNotFoundError: Token not found
+            TokenRevoked: Token has been revoked
+        """
+        if token_dict is None:
+            raise TokenNotFoundError(f"Token not found in store ({token_type})")
+        if token_dict["revoked"]:
+            raise TokenRevoked(f"Token {token_dict['jti']} has been revoked")
+        return TokenRecord._from_cached(token_dict)
 
     def revoke_token(self, jti: str) -> None:
         """
@@ -226,17 +589,17 @@ class TokenManager:
         Raises:
             TokenNotFoundError: JTI not found
         """
-        data = self.store.load()
-
-        for token_dict in data["tokens"]:
-            if token_dict["jti"] == jti:
-                token_dict["revoked"] = True
-                token_dict["revoked_at"] = datetime.now(timezone.utc).isoformat()
-                self.store.save(data)
-                self.logger.info(f"Token revoked: {jti}")
-                return
-
-        raise TokenNotFoundError(f"JTI {jti} not found in store")
+        with self._lock:
+            token_dict = self._by_jti.get(jti)
+            if token_dict is None:
+                raise TokenNotFoundError(f"JTI {jti} not found in store")
+
+            # Index entries are the stored dicts: update in place, then log
+            revoked_at = datetime.now(timezone.utc)
+            token_dict["revoked"] = True
+            token_dict["revoked_at"] = revoked_at
+            self._append_log({"op": "revoke", "jti": jti, "revoked_at": revoked_at.isoformat()})
+        self.logger.info(f"Token revoked: {jti}")
 
     def cleanup_expired(self) -> int:
         """
@@ -245,20 +608,26 @@ class TokenManager:
         Returns:
             Number of tokens removed
         """
-        data = self.store.load()
         now = datetime.now(timezone.utc)
-        original_count = len(data["tokens"])
+        now_ts = now.timestamp()
+
+        with self._lock:
+            # Pop expired records off the heap; live ones are never visited
+            heap = self._expiry_heap
+            expired = set()
+            while heap and heap[0][0] <= now_ts:
+                token_dict = heapq.heappop(heap)[2]
+                self._unindex(token_dict)
+                expired.add(id(token_dict))
+
+            removed_count = len(expired)
+            if removed_count > 0:
+                data = self._data
+                data["tokens"] = [t for t in data["tokens"] if id(t) not in expired]
+                data["last_cleanup"] = now.isoformat()
+                self.compact()
 
-        # Keep only non-expired tokens
-        data["tokens"] = [
-            t for t in data["tokens"]
-            if datetime.fromisoformat(t["refresh_expires_at"]) > now
-        ]
-
-        removed_count = original_count - len(data["tokens"])
         if removed_count > 0:
-            data["last_cleanup"] = now.isoformat()
-            self.store.save(data)
             self.logger.info(f"Cleanup removed {removed_count} expired tokens")
 
         return removed_count
@@ -273,11 +642,11 @@ class TokenManager:
         Returns:
             TokenRecord if found, None otherwise
         """
-        data = self.store.load()
-        for token_dict in data["tokens"]:
-            if token_dict["jti"] == jti:
-                return TokenRecord.from_dict(token_dict)
-        return None
+        with self._lock:
+            token_dict = self._by_jti.get(jti)
+            if token_dict is None:
+                return None
+            return TokenRecord._from_cached(token_dict)
 
     def list_client_tokens(self, client_id: str) -> list:
         """
@@ -289,25 +658,52 @@ class TokenManager:
         Returns:
             List of TokenRecord objects
         """
-        data = self.store.load()
-        return [
-            TokenRecord.from_dict(t)
-            for t in data["tokens"]
-            if t["client_id"] == client_id
-        ]
+        with self._lock:
+            client_tokens = self._by_client_id.get(client_id)
+            if not client_tokens:
+                return []
+            return [TokenRecord._from_cached(t) for t in client_tokens.values()]
+
+    def list_client_jtis(self, client_id: str) -> List[str]:
+        """
+        List token JTIs for a client (no record construction)
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            List of JTIs, creation order
+        """
+        with self._lock:
+            return list(self._by_client_id.get(client_id, ()))
+
+    @staticmethod
+    def generate_jti() -> str:
+        """
+        Generate a unique token identifier
+
+        Returns:
+            128-bit random id, URL-safe base64 (22 chars)
+        """
+        return secrets.token_urlsafe(16)
 
     @staticmethod
-    def _hash_token(token: str) -> str:
+    def _hash_token(token: Union[str, bytes], hash_alg: str = HASH_ALG) -> str:
         """
-        Hash a token using SHA256
+        Hash a token for storage
 
         Args:
-            token: Token string
+            token: Token string, or its UTF-8 bytes (hashed without copying)
+            hash_alg: HASH_ALG (BLAKE2b-160) or LEGACY_HASH_ALG (SHA256)
 
         Returns:
-            SHA256 hash (hex)
+            Hash (hex)
         """
-        return hashlib.sha256(token.encode()).hexdigest()
+        if isinstance(token, str):
+            token = token.encode()
+        if hash_alg == HASH_ALG:
+            return hashlib.blake2b(token, digest_size=20).hexdigest()
+        return hashlib.sha256(token).hexdigest()
 
 
 # ============================================================================
@@ -506,6 +902,12 @@ if __name__ == "__main__":
             charlie_tokens = self.manager.list_client_tokens("charlie-id")
             self.assertEqual(len(charlie_tokens), 0)
 
+            self.assertEqual(
+                self.manager.list_client_jtis("alice-id"),
+                ["alice-token-0", "alice-token-1", "alice-token-2"],
+            )
+            self.assertEqual(self.manager.list_client_jtis("charlie-id"), [])
+
         def test_refresh_token_validation(self):
             """Test validating refresh tokens specifically"""
             from datetime import timedelta
@@ -527,5 +929,364 @@ if __name__ == "__main__":
             record = self.manager.validate_token(refresh_token, "refresh")
             self.assertEqual(record.jti, "token-1")
 
+        def test_lookup_does_not_scan_records(self):
+            """Test validation only materializes the matching record"""
+            from datetime import timedelta
+            from unittest import mock
+
+            now = datetime.now(timezone.utc)
+            for i in range(5):
+                self.manager.create_token(
+                    jti=f"token-{i}",
+                    client_id="client-123",
+                    username="alice",
+                    access_token=f"access-{i}",
+                    refresh_token=f"refresh-{i}",
+                    access_expires_at=now + timedelta(hours=1),
+                    refresh_expires_at=now + timedelta(days=7),
+                )
+
+            with mock.patch.object(
+                TokenRecord, "_from_cached", wraps=TokenRecord._from_cached
+            ) as from_cached, mock.patch(
+                f"{__name__}.datetime"
+            ) as dt:
+                record = self.manager.validate_token("access-3", "access")
+                self.assertEqual(record.jti, "token-3")
+                self.assertEqual(from_cached.call_count, 1)
+                dt.fromisoformat.assert_not_called()
+
+        def test_revoke_visible_after_reload(self):
+            """Test revocation is persisted to disk"""
+            from datetime import timedelta
+
+            now = datetime.now(timezone.utc)
+            self.manager.create_token(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token="access-token",
+                refresh_token="refresh-token",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+            self.manager.validate_token("access-token", "access")
+            self.manager.revoke_token("token-1")
+
+            reloaded = TokenManager(self.test_dir)
+            with self.assertRaises(TokenRevoked):
+                reloaded.validate_token("refresh-token", "refresh")
+            self.assertIsInstance(reloaded.get_token_by_jti("token-1").revoked_at, datetime)
+
+            # Disk keeps ISO strings
+            reloaded.compact()
+            stored = reloaded.store.load()["tokens"][0]
+            self.assertEqual(
+                datetime.fromisoformat(stored["refresh_expires_at"]),
+                now + timedelta(days=7),
+            )
+
+        def test_lookups_do_not_reload_store(self):
+            """Test the store file is only parsed at startup"""
+            from datetime import timedelta
+            from unittest import mock
+
+            now = datetime.now(timezone.utc)
+            self.manager.create_token(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token="access-token",
+                refresh_token="refresh-token",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+
+            with mock.patch.object(self.manager.store, "load") as load:
+                self.manager.validate_token("access-token", "access")
+                self.manager.get_token_by_jti("token-1")
+                self.manager.list_client_tokens("client-123")
+                self.manager.revoke_token("token-1")
+                self.manager.cleanup_expired()
+                load.assert_not_called()
+
+        def test_cleanup_only_visits_expired(self):
+            """Test cleanup pops expired records off the expiry heap"""
+            from datetime import timedelta
+
+            now = datetime.now(timezone.utc)
+            for i, days in enumerate([-3, 5, -1, 2]):
+                self.manager.create_token(
+                    jti=f"token-{i}",
+                    client_id="client-123",
+                    username="alice",
+                    access_token=f"access-{i}",
+                    refresh_token=f"refresh-{i}",
+                    access_expires_at=now + timedelta(days=days),
+                    refresh_expires_at=now + timedelta(days=days),
+                )
+
+            self.assertEqual(self.manager.cleanup_expired(), 2)
+            self.assertEqual(len(self.manager._expiry_heap), 2)
+            self.assertIsNone(self.manager.get_token_by_jti("token-0"))
+            self.assertIsNotNone(self.manager.get_token_by_jti("token-1"))
+            self.assertEqual(self.manager.list_client_jtis("client-123"), ["token-1", "token-3"])
+            self.assertEqual(self.manager.cleanup_expired(), 0)
+
+            # Removal was persisted
+            reloaded = TokenManager(self.test_dir)
+            self.assertEqual(
+                sorted(t.jti for t in reloaded.list_client_tokens("client-123")),
+                ["token-1", "token-3"],
+            )
+
+        def test_mutations_appended_to_log(self):
+            """Test create/revoke append to tokens.log instead of rewriting tokens.json"""
+            from datetime import timedelta
+
+            now = datetime.now(timezone.utc)
+            snapshot = self.manager.tokens_file.read_bytes()
+            for i in range(3):
+                self.manager.create_token(
+                    jti=f"token-{i}",
+                    client_id="client-123",
+                    username="alice",
+                    access_token=f"access-{i}",
+                    refresh_token=f"refresh-{i}",
+                    access_expires_at=now + timedelta(hours=1),
+                    refresh_expires_at=now + timedelta(days=7),
+                )
+            self.manager.revoke_token("token-1")
+
+            self.assertEqual(self.manager.tokens_file.read_bytes(), snapshot)
+            self.assertEqual(
+                [e["op"] for e in self.manager.log.load()],
+                ["create", "create", "create", "revoke"],
+            )
+
+            # Replay on startup
+            reloaded = TokenManager(self.test_dir)
+            self.assertEqual(len(reloaded.list_client_tokens("client-123")), 3)
+            with self.assertRaises(TokenRevoked):
+                reloaded.validate_token("access-1", "access")
+
+            # Compaction folds the log into the snapshot; replay stays idempotent
+            reloaded.store.save({**reloaded._data, "tokens": [
+                _format_datetimes(t) for t in reloaded._data["tokens"]
+            ]})
+            again = TokenManager(self.test_dir)
+            self.assertEqual(len(again.list_client_tokens("client-123")), 3)
+            again.compact()
+            self.assertEqual(again.log.size(), 0)
+            self.assertEqual(len(TokenManager(self.test_dir).list_client_tokens("client-123")), 3)
+
+        def test_log_compacted_past_threshold(self):
+            """Test tokens.log is compacted once it exceeds the threshold"""
+            from datetime import timedelta
+
+            now = datetime.now(timezone.utc)
+            manager = TokenManager(self.test_dir, compact_threshold=1, fsync=True)
+            manager.create_token(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token="access-token",
+                refresh_token="refresh-token",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+
+            self.assertEqual(manager.log.size(), 0)
+            self.assertEqual(len(manager.store.load()["tokens"]), 1)
+
+        def test_legacy_sha256_records_still_validate(self):
+            """Test records without hash_alg (sha256) remain valid"""
+            from datetime import timedelta
+
+            now = datetime.now(timezone.utc)
+            legacy = {
+                "jti": "legacy-token",
+                "client_id": "client-123",
+                "username": "alice",
+                "access_token_hash": hashlib.sha256(b"old-access").hexdigest(),
+                "refresh_token_hash": hashlib.sha256(b"old-refresh").hexdigest(),
+                "created_at": now.isoformat(),
+                "access_expires_at": (now + timedelta(hours=1)).isoformat(),
+                "refresh_expires_at": (now + timedelta(days=7)).isoformat(),
+                "revoked": False,
+                "revoked_at": None,
+            }
+            self.manager.store.save({"tokens": [legacy], "last_cleanup": None})
+
+            manager = TokenManager(self.test_dir)
+            record = manager.validate_token("old-refresh", "refresh")
+            self.assertEqual(record.hash_alg, LEGACY_HASH_ALG)
+
+            # New records use BLAKE2b-160 (40 hex chars)
+            created = manager.create_token(
+                jti="new-token",
+                client_id="client-123",
+                username="alice",
+                access_token="new-access",
+                refresh_token="new-refresh",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+            self.assertEqual(created.hash_alg, HASH_ALG)
+            self.assertEqual(len(created.access_token_hash), 40)
+            self.assertEqual(manager.validate_token("new-access").jti, "new-token")
+
+        def test_validate_token_hash(self):
+            """Test validation from a precomputed hash skips hashing"""
+            from datetime import timedelta
+            from unittest import mock
+
+            now = datetime.now(timezone.utc)
+            self.manager.create_token(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token="access-token",
+                refresh_token="refresh-token",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+            token_hash = TokenManager._hash_token("refresh-token")
+
+            with mock.patch.object(TokenManager, "_hash_token") as hash_token:
+                record = self.manager.validate_token_hash(token_hash, "refresh")
+                hash_token.assert_not_called()
+            self.assertEqual(record.jti, "token-1")
+
+            with self.assertRaises(TokenNotFoundError):
+                self.manager.validate_token_hash(token_hash, "access")
+
+            self.manager.revoke_token("token-1")
+            with self.assertRaises(TokenRevoked):
+                self.manager.validate_token_hash(token_hash, "refresh")
+
+        def test_debounced_flush(self):
+            """Test a burst of mutations in an event loop flushes once"""
+            from datetime import timedelta
+            from unittest import mock
+
+            now = datetime.now(timezone.utc)
+            manager = TokenManager(self.test_dir, fsync=True, flush_interval=0.01)
+
+            async def burst():
+                with mock.patch.object(manager.log, "sync") as sync:
+                    for i in range(5):
+                        manager.create_token(
+                            jti=f"token-{i}",
+                            client_id="client-123",
+                            username="alice",
+                            access_token=f"access-{i}",
+                            refresh_token=f"refresh-{i}",
+                            access_expires_at=now + timedelta(hours=1),
+                            refresh_expires_at=now + timedelta(days=7),
+                        )
+                    sync.assert_not_called()
+                    await asyncio.sleep(0.05)
+                    self.assertEqual(sync.call_count, 1)
+
+                    manager.revoke_token("token-0")
+                    manager.flush_now()
+                    self.assertEqual(sync.call_count, 2)
+                    self.assertIsNone(manager._flush_handle)
+
+            asyncio.run(burst())
+
+            # A timer left pending by a finished loop is replaced in the next
+            async def leave_pending():
+                manager.revoke_token("token-2")
+
+            async def next_loop():
+                manager.revoke_token("token-3")
+                await asyncio.sleep(0.05)
+
+            manager.flush_interval = 60
+            asyncio.run(leave_pending())
+            self.assertIsNotNone(manager._flush_handle)
+            manager.flush_interval = 0.01
+            with mock.patch.object(manager.log, "sync") as sync:
+                asyncio.run(next_loop())
+                sync.assert_called_once()
+            self.assertFalse(manager._dirty)
+            self.assertIsNone(manager._flush_handle)
+
+            # Outside a loop every mutation flushes immediately
+            with mock.patch.object(manager.log, "sync") as sync:
+                manager.revoke_token("token-1")
+                sync.assert_called_once()
+            manager.close()
+
+        def test_client_strings_interned(self):
+            """Test client_id/username are shared between loaded records"""
+            from datetime import timedelta
+
+            now = datetime.now(timezone.utc)
+            for i in range(2):
+                self.manager.create_token(
+                    jti=f"token-{i}",
+                    client_id="".join(["client-", "123"]),
+                    username="".join(["ali", "ce"]),
+                    access_token=f"access-{i}",
+                    refresh_token=f"refresh-{i}",
+                    access_expires_at=now + timedelta(hours=1),
+                    refresh_expires_at=now + timedelta(days=7),
+                )
+
+            for manager in (self.manager, TokenManager(self.test_dir)):
+                first, second = manager.list_client_tokens("client-123")
+                self.assertIs(first.client_id, second.client_id)
+                self.assertIs(first.username, second.username)
+
+        def test_generate_jti(self):
+            """Test generated JTIs are unique URL-safe strings"""
+            jtis = {TokenManager.generate_jti() for _ in range(100)}
+            self.assertEqual(len(jtis), 100)
+            for jti in jtis:
+                self.assertEqual(len(jti), 22)
+                self.assertRegex(jti, r"^[A-Za-z0-9_-]+$")
+
+        def test_token_record_round_trip(self):
+            """Test TokenRecord is an immutable tuple surviving to_dict/from_dict"""
+            now = datetime.now(timezone.utc)
+            record = TokenRecord(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token_hash="a",
+                refresh_token_hash="r",
+                created_at=now,
+                access_expires_at=now,
+                refresh_expires_at=now,
+            )
+            self.assertEqual(TokenRecord.from_dict(record.to_dict()), record)
+            self.assertFalse(hasattr(record, "__dict__"))
+            with self.assertRaises(AttributeError):
+                record.revoked = True
+
+        def test_bytes_tokens(self):
+            """Test tokens may be passed as bytes"""
+            from datetime import timedelta
+
+            self.assertEqual(
+                TokenManager._hash_token(b"access-token"),
+                TokenManager._hash_token("access-token"),
+            )
+
+            now = datetime.now(timezone.utc)
+            self.manager.create_token(
+                jti="token-1",
+                client_id="client-123",
+                username="alice",
+                access_token="access-token",
+                refresh_token="refresh-token",
+                access_expires_at=now + timedelta(hours=1),
+                refresh_expires_at=now + timedelta(days=7),
+            )
+            self.assertEqual(self.manager.validate_token(b"access-token").jti, "token-1")
+
     import os
     unittest.main()
@@ -14,6 +14,15 @@ CHANGELOG:
   - Error handling and validation
   - Request/response routing
 
+[2026-10-15 v0.1.1-alpha] Bounded client state
+  - ProtocolState uses __slots__
+  - Per-client states kept in an LRU capped at max_clients
+  - remove_client() drops a client's state on disconnect
+  - initialize/shutdown dispatched through the method table
+  - Lazy %-style logging (no formatting when the level is disabled)
+  - Client ids and client_info keys interned
+  - initialize/shutdown results built once, shared by every response
+
 ARCHITECTURE:
 MCPProtocolHandler implements the MCP 2024-11 protocol specification.
 It handles:
@@ -34,6 +43,8 @@ SECURITY NOTES:
 """
 
 import logging
+import sys
+from collections import OrderedDict
 from typing import Optional, Dict, Any, Callable, Awaitable
 from dataclasses import dataclass
 from datetime import datetime
@@ -47,6 +58,7 @@ from ..core.constants import (
     METHOD_INITIALIZE,
     METHOD_INITIALIZED,
     METHOD_SHUTDOWN,
+    MAX_PROTOCOL_CLIENTS,
     INVALID_REQUEST,
     METHOD_NOT_FOUND,
     INVALID_PARAMS,
@@ -55,7 +67,11 @@ from ..core.constants import (
 from ..security.client_context import ClientContext
 
 
-@dataclass
+# Shutdown result (shared, never mutated)
+_SHUTDOWN_RESULT: Dict[str, Any] = {"status": "ok"}
+
+
+@dataclass(slots=True)
 class ProtocolState:
     """State of MCP protocol for a client"""
     initialized: bool = False
@@ -83,13 +99,19 @@ class MCPProtocolHandler:
     - Transport details (delegated to transport layer)
     """
 
-    def __init__(self, server_name: str = SERVER_NAME, server_version: str = SERVER_VERSION):
+    def __init__(
+        self,
+        server_name: str = SERVER_NAME,
+        server_version: str = SERVER_VERSION,
+        max_clients: int = MAX_PROTOCOL_CLIENTS,
+    ):
         """
         Initialize protocol handler
 
         Args:
             server_name: Name to report as in capabilities
             server_version: Version to report
+            max_clients: Client states kept before evicting the least recent
         """
         self.logger = logging.getLogger("protocol.mcp_protocol_handler")
 
@@ -97,14 +119,21 @@ class MCPProtocolHandler:
         self.server_name = server_name
         self.server_version = server_version
 
-        # Per-client protocol state
-        self._client_states: Dict[str, ProtocolState] = {}
+        # Per-client protocol state, least recently used first
+        self.max_clients = max_clients
+        self._client_states: "OrderedDict[str, ProtocolState]" = OrderedDict()
 
         # Method handlers - will be registered by server
         self._method_handlers: Dict[str, Callable] = {}
 
+        # Lifecycle methods share the table; only they skip the initialized check
+        self._lifecycle_methods = frozenset((METHOD_INITIALIZE, METHOD_SHUTDOWN))
+        self.register_method(METHOD_INITIALIZE, self._handle_initialize)
+        self.register_method(METHOD_SHUTDOWN, self._handle_shutdown)
+
         # Server capabilities
         self._capabilities = DEFAULT_CAPABILITIES.copy()
+        self._build_initialize_result()
 
     def register_method(self, method: str, handler: Callable) -> None:
         """
@@ -115,7 +144,7 @@ class MCPProtocolHandler:
             handler: Async callable(client_context, params) -> result
         """
         self._method_handlers[method] = handler
-        self.logger.debug(f"Method handler registered: {method}")
+        self.logger.debug("Method handler registered: %s", method)
 
     def set_capabilities(self, capabilities: Dict[str, Any]) -> None:
         """
@@ -125,7 +154,27 @@ class MCPProtocolHandler:
             capabilities: Capabilities dictionary
         """
         self._capabilities = capabilities
-        self.logger.info(f"Capabilities updated: {list(capabilities.keys())}")
+        self._build_initialize_result()
+        self.logger.info("Capabilities updated: %s", list(capabilities))
+
+    def _build_initialize_result(self) -> None:
+        """
+        Precompute the initialize result (and server info)
+
+        Rebuilt whenever capabilities change. The dicts are shared by all
+        responses and client states, so they must not be mutated. They stay
+        plain dicts (not MappingProxyType) because responses are JSON-encoded.
+        """
+        self._server_info = {
+            "name": self.server_name,
+            "version": self.server_version,
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+        }
+        self._initialize_result = {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": self._capabilities,
+            "serverInfo": self._server_info,
+        }
 
     async def handle_message(
         self,
@@ -154,135 +203,108 @@ class MCPProtocolHandler:
         client_context.record_request()
 
         self.logger.debug(
-            f"Message from {client_context.client_id[:8]}: "
-            f"method={message.method}, id={message.request_id}"
+            "Message from %.8s: method=%s, id=%s",
+            client_context.client_id, message.method, message.request_id
         )
 
         # Get or create client state
         client_state = self._get_client_state(client_context.client_id)
+        method = message.method
+        handler = self._method_handlers.get(method)
 
-        # Handle lifecycle methods
-        if message.method == METHOD_INITIALIZE:
-            return await self._handle_initialize(message, client_context, client_state)
-
-        elif message.method == METHOD_SHUTDOWN:
-            return await self._handle_shutdown(message, client_context, client_state)
-
-        # Check client initialized (except for initialize)
-        if not client_state.initialized:
+        # Check client initialized (except for lifecycle methods)
+        if not client_state.initialized and method not in self._lifecycle_methods:
             return self._error_response(
                 message.request_id,
                 INVALID_REQUEST,
                 "Client must call initialize first"
             )
 
-        # Route to registered handler
-        if message.method in self._method_handlers:
-            try:
-                handler = self._method_handlers[message.method]
-                result = await handler(client_context, message.params or {})
-
-                # Return result if this was a request (has ID)
-                if message.request_id:
-                    return TransportMessage(
-                        method=message.method,
-                        params={"result": result},
-                        request_id=message.request_id
-                    )
-                else:
-                    # Notification - no response
-                    return None
-
-            except Exception as e:
-                self.logger.error(f"Error in handler {message.method}: {e}")
-                return self._error_response(
-                    message.request_id,
-                    INTERNAL_ERROR,
-                    f"Error executing {message.method}"
-                )
-        else:
+        if handler is None:
             # Method not found
             return self._error_response(
                 message.request_id,
                 METHOD_NOT_FOUND,
-                f"Method not found: {message.method}"
+                f"Method not found: {method}"
             )
 
+        # Route to registered handler
+        try:
+            result = await handler(client_context, message.params or {})
+        except Exception as e:
+            self.logger.error("Error in handler %s: %s", method, e)
+            return self._error_response(
+                message.request_id,
+                INTERNAL_ERROR,
+                f"Error executing {method}"
+            )
+
+        # Notification (no ID) - no response object built
+        request_id = message.request_id
+        if request_id is None:
+            return None
+
+        return TransportMessage(
+            method=method,
+            params={"result": result},
+            request_id=request_id
+        )
+
     async def _handle_initialize(
         self,
-        message: TransportMessage,
         client_context: ClientContext,
-        client_state: ProtocolState
-    ) -> TransportMessage:
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
         Handle initialize request
 
         Args:
-            message: Initialize message
             client_context: Client context
-            client_state: Client protocol state
+            params: Request parameters
 
         Returns:
-            Initialize response
+            Initialize result
         """
-        params = message.params or {}
+        client_state = self._current_state(client_context.client_id)
         client_info = params.get("clientInfo", {})
+        if isinstance(client_info, dict):
+            # Other values (null, strings...) are kept as sent
+            client_info = {
+                sys.intern(key) if type(key) is str else key: value
+                for key, value in client_info.items()
+            }
 
-        self.logger.info(f"Initialize request from {client_context.client_id[:8]}")
+        self.logger.info("Initialize request from %.8s", client_context.client_id)
 
         # Update client state
         client_state.initialized = True
         client_state.client_info = client_info
+        client_state.server_info = self._server_info
 
-        # Build server info
-        server_info = {
-            "name": self.server_name,
-            "version": self.server_version,
-            "protocolVersion": MCP_PROTOCOL_VERSION,
-        }
-        client_state.server_info = server_info
-
-        # Build response
-        response_data = {
-            "protocolVersion": MCP_PROTOCOL_VERSION,
-            "capabilities": self._capabilities,
-            "serverInfo": server_info,
-        }
-
-        return TransportMessage(
-            method=METHOD_INITIALIZE,
-            params={"result": response_data},
-            request_id=message.request_id
-        )
+        return self._initialize_result
 
     async def _handle_shutdown(
         self,
-        message: TransportMessage,
         client_context: ClientContext,
-        client_state: ProtocolState
-    ) -> TransportMessage:
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
         Handle shutdown request
 
         Args:
-            message: Shutdown message
             client_context: Client context
-            client_state: Client protocol state
+            params: Request parameters
 
         Returns:
-            Shutdown response
+            Shutdown result
         """
-        self.logger.info(f"Shutdown request from {client_context.client_id[:8]}")
+        self.logger.info("Shutdown request from %.8s", client_context.client_id)
 
         # Mark client as no longer initialized
-        client_state.initialized = False
+        self._current_state(client_context.client_id).initialized = False
 
         # Return success
-        return TransportMessage(
-            method=METHOD_SHUTDOWN,
-            params={"result": {"status": "ok"}},
-            request_id=message.request_id
-        )
+        return _SHUTDOWN_RESULT
 
     def _get_client_state(self, client_id: str) -> ProtocolState:
         """
@@ -294,9 +316,40 @@ class MCPProtocolHandler:
         Returns:
             Client protocol state
         """
-        if client_id not in self._client_states:
-            self._client_states[client_id] = ProtocolState()
-        return self._client_states[client_id]
+        states = self._client_states
+        state = states.get(client_id)
+        if state is None:
+            state = states[sys.intern(client_id)] = ProtocolState()
+            if len(states) > self.max_clients:
+                evicted, _ = states.popitem(last=False)
+                self.logger.debug("Evicted protocol state: %.8s", evicted)
+        else:
+            states.move_to_end(client_id)
+        return state
+
+    def _current_state(self, client_id: str) -> ProtocolState:
+        """
+        Get state for the client whose message is being handled
+
+        handle_message already fetched (and LRU-refreshed) it, so this is
+        a plain lookup; falls back to _get_client_state if called directly.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            Client protocol state
+        """
+        return self._client_states.get(client_id) or self._get_client_state(client_id)
+
+    def remove_client(self, client_id: str) -> None:
+        """
+        Drop protocol state for a client (call on transport disconnect)
+
+        Args:
+            client_id: Client identifier
+        """
+        self._client_states.pop(client_id, None)
 
     def _error_response(
         self,
@@ -334,7 +387,8 @@ class MCPProtocolHandler:
         Returns:
             dict: Client protocol info
         """
-        state = self._get_client_state(client_id)
+        # Read-only: unknown clients get defaults without taking an LRU slot
+        state = self._client_states.get(client_id) or ProtocolState()
         return {
             "initialized": state.initialized,
             "client_info": state.client_info,
@@ -349,9 +403,8 @@ class MCPProtocolHandler:
 if __name__ == "__main__":
     import unittest
     from unittest.mock import AsyncMock, MagicMock
-    import asyncio
 
-    class TestMCPProtocolHandler(unittest.TestCase):
+    class TestMCPProtocolHandler(unittest.IsolatedAsyncioTestCase):
         """Test suite for MCPProtocolHandler"""
 
         def setUp(self):
@@ -379,116 +432,172 @@ if __name__ == "__main__":
             self.handler.set_capabilities(new_caps)
             self.assertEqual(self.handler._capabilities, new_caps)
 
-        def test_initialize_request(self):
+        async def test_initialize_request(self):
             """Test initialize request"""
-            async def test():
-                message = TransportMessage(
-                    method=METHOD_INITIALIZE,
-                    params={"clientInfo": {"name": "test"}},
-                    request_id="1"
-                )
-
-                response = await self.handler.handle_message(message, self.client_context)
+            message = TransportMessage(
+                method=METHOD_INITIALIZE,
+                params={"clientInfo": {"name": "test"}},
+                request_id="1"
+            )
 
-                self.assertIsNotNone(response)
-                self.assertEqual(response.request_id, "1")
-                self.assertEqual(response.method, METHOD_INITIALIZE)
-                self.assertIn("result", response.params)
+            response = await self.handler.handle_message(message, self.client_context)
 
-            asyncio.run(test())
+            self.assertIsNotNone(response)
+            self.assertEqual(response.request_id, "1")
+            self.assertEqual(response.method, METHOD_INITIALIZE)
+            self.assertIn("result", response.params)
 
-        def test_method_not_found(self):
+        async def test_method_not_found(self):
             """Test method not found error"""
-            async def test():
-                # First initialize
-                init_msg = TransportMessage(
-                    method=METHOD_INITIALIZE,
-                    params={"clientInfo": {}},
-                    request_id="1"
-                )
-                await self.handler.handle_message(init_msg, self.client_context)
-
-                # Then call unknown method
-                unknown_msg = TransportMessage(
-                    method="unknown/method",
-                    request_id="2"
-                )
+            # First initialize
+            init_msg = TransportMessage(
+                method=METHOD_INITIALIZE,
+                params={"clientInfo": {}},
+                request_id="1"
+            )
+            await self.handler.handle_message(init_msg, self.client_context)
 
-                response = await self.handler.handle_message(unknown_msg, self.client_context)
+            # Then call unknown method
+            unknown_msg = TransportMessage(
+                method="unknown/method",
+                request_id="2"
+            )
 
-                self.assertIsInstance(response, TransportError)
-                self.assertEqual(response.code, METHOD_NOT_FOUND)
+            response = await self.handler.handle_message(unknown_msg, self.client_context)
 
-            asyncio.run(test())
+            self.assertIsInstance(response, TransportError)
+            self.assertEqual(response.code, METHOD_NOT_FOUND)
 
-        def test_require_initialize(self):
+        async def test_require_initialize(self):
             """Test that client must initialize before other methods"""
-            async def test():
-                # Try to call method without initializing
-                message = TransportMessage(
-                    method="test/method",
-                    request_id="1"
-                )
-
-                response = await self.handler.handle_message(message, self.client_context)
+            # Try to call method without initializing
+            message = TransportMessage(
+                method="test/method",
+                request_id="1"
+            )
 
-                self.assertIsInstance(response, TransportError)
-                self.assertEqual(response.code, INVALID_REQUEST)
+            response = await self.handler.handle_message(message, self.client_context)
 
-            asyncio.run(test())
+            self.assertIsInstance(response, TransportError)
+            self.assertEqual(response.code, INVALID_REQUEST)
 
-        def test_shutdown_request(self):
+        async def test_shutdown_request(self):
             """Test shutdown request"""
-            async def test():
-                # Initialize first
-                init_msg = TransportMessage(
-                    method=METHOD_INITIALIZE,
-                    params={"clientInfo": {}},
-                    request_id="1"
-                )
-                await self.handler.handle_message(init_msg, self.client_context)
-
-                # Then shutdown
-                shutdown_msg = TransportMessage(
-                    method=METHOD_SHUTDOWN,
-                    request_id="2"
-                )
+            # Initialize first
+            init_msg = TransportMessage(
+                method=METHOD_INITIALIZE,
+                params={"clientInfo": {}},
+                request_id="1"
+            )
+            await self.handler.handle_message(init_msg, self.client_context)
 
-                response = await self.handler.handle_message(shutdown_msg, self.client_context)
+            # Then shutdown
+            shutdown_msg = TransportMessage(
+                method=METHOD_SHUTDOWN,
+                request_id="2"
+            )
 
-                self.assertIsNotNone(response)
-                self.assertEqual(response.method, METHOD_SHUTDOWN)
+            response = await self.handler.handle_message(shutdown_msg, self.client_context)
 
-            asyncio.run(test())
+            self.assertIsNotNone(response)
+            self.assertEqual(response.method, METHOD_SHUTDOWN)
 
-        def test_notification_no_response(self):
+        async def test_notification_no_response(self):
             """Test that notifications (no ID) don't get responses"""
-            async def test():
-                # Initialize
-                init_msg = TransportMessage(
-                    method=METHOD_INITIALIZE,
-                    params={"clientInfo": {}},
-                    request_id="1"
-                )
-                await self.handler.handle_message(init_msg, self.client_context)
+            # Initialize
+            init_msg = TransportMessage(
+                method=METHOD_INITIALIZE,
+                params={"clientInfo": {}},
+                request_id="1"
+            )
+            await self.handler.handle_message(init_msg, self.client_context)
 
-                # Register a test method
-                async def test_handler(ctx, params):
-                    return {"status": "ok"}
+            # Register a test method
+            async def test_handler(ctx, params):
+                return {"status": "ok"}
 
-                self.handler.register_method("test/notify", test_handler)
+            self.handler.register_method("test/notify", test_handler)
 
-                # Call as notification (no ID)
-                notification = TransportMessage(
-                    method="test/notify",
-                    params={}
-                )
+            # Call as notification (no ID)
+            notification = TransportMessage(
+                method="test/notify",
+                params={}
+            )
+
+            response = await self.handler.handle_message(notification, self.client_context)
 
-                response = await self.handler.handle_message(notification, self.client_context)
+            self.assertIsNone(response)
 
-                self.assertIsNone(response)
+        async def test_lifecycle_methods_in_dispatch_table(self):
+            """Test initialize/shutdown dispatch through the method table"""
+            self.assertIn(METHOD_INITIALIZE, self.handler._method_handlers)
+            self.assertIn(METHOD_SHUTDOWN, self.handler._method_handlers)
 
-            asyncio.run(test())
+            message = TransportMessage(method=METHOD_SHUTDOWN, request_id="1")
+            response = await self.handler.handle_message(message, self.client_context)
+            self.assertEqual(response.params, {"result": {"status": "ok"}})
+
+        async def test_initialize_result_tracks_capabilities(self):
+            """Test the precomputed initialize result follows set_capabilities"""
+            message = TransportMessage(
+                method=METHOD_INITIALIZE,
+                params={"clientInfo": {}},
+                request_id="1"
+            )
+            response = await self.handler.handle_message(message, self.client_context)
+            result = response.params["result"]
+            self.assertEqual(result["capabilities"], DEFAULT_CAPABILITIES)
+            self.assertEqual(result["serverInfo"]["name"], SERVER_NAME)
+
+            self.handler.set_capabilities({"custom": True})
+            response = await self.handler.handle_message(message, self.client_context)
+            self.assertEqual(response.params["result"]["capabilities"], {"custom": True})
+
+        async def test_initialize_client_info_not_object(self):
+            """Test a non-object clientInfo is stored as sent, not an error"""
+            for client_info in (None, "name", ["a"]):
+                message = TransportMessage(
+                    method=METHOD_INITIALIZE,
+                    params={"clientInfo": client_info},
+                    request_id="1"
+                )
+                response = await self.handler.handle_message(message, self.client_context)
+                self.assertIn("result", response.params)
+                info = self.handler.get_client_info(self.client_context.client_id)
+                self.assertEqual(info["client_info"], client_info)
+
+        async def test_request_id_zero_gets_response(self):
+            """Test a falsy request id is a request, not a notification"""
+            init_msg = TransportMessage(
+                method=METHOD_INITIALIZE,
+                params={"clientInfo": {}},
+                request_id=0
+            )
+            response = await self.handler.handle_message(init_msg, self.client_context)
+            self.assertIsNotNone(response)
+            self.assertEqual(response.request_id, 0)
+
+        def test_client_states_bounded(self):
+            """Test least recently used client state is evicted past max_clients"""
+            handler = MCPProtocolHandler(max_clients=2)
+            handler._get_client_state("a").initialized = True
+            handler._get_client_state("b")
+            handler._get_client_state("a")  # refresh "a"
+            handler._get_client_state("c")
+
+            self.assertEqual(list(handler._client_states), ["a", "c"])
+            self.assertTrue(handler._get_client_state("a").initialized)
+
+            handler.remove_client("a")
+            handler.remove_client("unknown")
+            self.assertEqual(list(handler._client_states), ["c"])
+
+            self.assertFalse(handler.get_client_info("unknown")["initialized"])
+            self.assertEqual(list(handler._client_states), ["c"])
+
+        def test_protocol_state_slots(self):
+            """Test ProtocolState has no per-instance __dict__"""
+            self.assertFalse(hasattr(ProtocolState(), "__dict__"))
 
     # Run tests
     unittest.main()
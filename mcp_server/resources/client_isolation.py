@@ -15,6 +15,22 @@ CHANGELOG:
   - Block path traversal attacks
   - List and clear client files
 
+[2026-10-15 v0.1.1-alpha] Hot path optimizations
+  - Base directory resolved once; client directories cached (one mkdir per client)
+  - resolve_path uses os.path string operations and a prefix check
+  - validate_path_safety: one precompiled regex scan instead of four
+  - list_client_files walks with os.scandir (no stat per entry)
+  - Bounded LRU cache of normalized relative paths (realpath and the
+    containment check still run on every resolve_path call)
+  - validate_access_batch: one directory lookup and one audit line per batch
+  - Lazy %-style logging (messages not built when the level is disabled)
+  - clear_client_directory: unlink + rmdir fast path for flat directories
+  - validate_path_safety_bytes: same check on raw UTF-8 bytes (no decode)
+  - iter_client_files streams files (O(depth) memory)
+  - Client directory cache holds interned str and str + os.sep prefixes
+  - validate_access(already_resolved=True) normalizes instead of calling
+    realpath (symlinks not followed: caller vouches the path is canonical)
+
 ARCHITECTURE:
 ClientIsolationManager ensures each client operates in its own directory.
 - Each client has: data/clients/{client_id}/
@@ -30,12 +46,75 @@ SECURITY NOTES:
 """
 
 import logging
+import os
+import re
+import shutil
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any, Set, Iterator, List, Tuple
 
 
 logger = logging.getLogger(__name__)
 
+# Max cached relative path normalizations
+RESOLVE_CACHE_SIZE = 4096
+
+# "..", "//", "\\\\" or NUL anywhere in a path string
+_DANGEROUS_RE = re.compile(r'\.\.|//|\\\\|\x00')
+_DOTDOT_B = b".."
+_SLASHES_B = b"//"
+_BACKSLASHES_B = b"\\\\"
+_NUL_B = b"\x00"
+
+
+@lru_cache(maxsize=RESOLVE_CACHE_SIZE)
+def _normalize_relative(relative_path: str) -> str:
+    """
+    Validate and normalize a client-relative path (no filesystem access).
+
+    Only this pure string step is cached: symlinks can change at any time,
+    so realpath and the containment check are never cached.
+
+    Args:
+        relative_path: Relative path requested
+
+    Returns:
+        str: Normalized relative path (no leading ..)
+
+    Raises:
+        ValueError: If path is absolute or attempts escape (../)
+    """
+    # Check if path is absolute
+    if os.path.isabs(relative_path) or relative_path.startswith(("/", "\\")):
+        raise ValueError(
+            f"Absolute paths not allowed: {relative_path}. "
+            f"Must be relative path within client directory."
+        )
+
+    # Normalize path (remove ., .., etc.) and reject upward escapes
+    norm = os.path.normpath(relative_path)
+    if norm == ".." or norm.startswith(".." + os.sep) or os.path.isabs(norm):
+        raise ValueError(
+            f"Path traversal not allowed: {relative_path}. "
+            f"Cannot use .. or absolute paths."
+        )
+    return norm
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """
+    Yield paths of all regular files under root (symlinks not followed).
+
+    DirEntry file types come from readdir, so no stat call per entry.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
 
 class ClientIsolationManager:
     """
@@ -54,8 +133,12 @@ class ClientIsolationManager:
         """
         self.base_dir = Path(base_dir) if base_dir else Path("data/clients")
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Canonical once, so containment checks compare resolved paths
+        self.base_dir = self.base_dir.resolve()
+        # client_id -> (created client directory, its str, str + os.sep)
+        self._client_dirs: Dict[str, Tuple[Path, str, str]] = {}
         self.logger = logging.getLogger("resources.client_isolation")
-        self.logger.info(f"Client isolation directory: {self.base_dir}")
+        self.logger.info("Client isolation directory: %s", self.base_dir)
 
     def get_client_directory(self, client_id: str) -> Path:
         """
@@ -67,12 +150,38 @@ class ClientIsolationManager:
         Returns:
             Path: Absolute path to client's directory (data/clients/{client_id}/)
 
-        Note: Creates directory if it doesn't exist
+        Note: Creates directory on first use (then cached)
+        """
+        return self._client_entry(client_id)[0]
+
+    def _client_entry(self, client_id: str) -> Tuple[Path, str, str]:
         """
+        Get cached (directory, directory str, prefix str) for a client.
+
+        The str forms are interned once so containment checks are plain
+        string compares against a fixed prefix.
+
+        Args:
+            client_id: ID of the client
+
+        Returns:
+            Tuple[Path, str, str]: Client directory, str(dir), str(dir) + os.sep
+        """
+        entry = self._client_dirs.get(client_id)
+        if entry is not None:
+            return entry
+
         client_dir = self.base_dir / client_id
         client_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.debug(f"Client directory for {client_id}: {client_dir}")
-        return client_dir
+        client_dir_str = str(client_dir)
+        entry = (
+            client_dir,
+            sys.intern(client_dir_str),
+            sys.intern(client_dir_str + os.sep),
+        )
+        self._client_dirs[client_id] = entry
+        self.logger.debug("Client directory for %s: %s", client_id, client_dir)
+        return entry
 
     def resolve_path(
         self,
@@ -92,50 +201,39 @@ class ClientIsolationManager:
         Raises:
             ValueError: If path is absolute or attempts escape (../)
         """
-        # Get client directory
-        client_dir = self.get_client_directory(client_id)
+        norm = _normalize_relative(relative_path)
+        _, client_dir, prefix = self._client_entry(client_id)
 
-        # Check if path is absolute
-        if Path(relative_path).is_absolute():
-            raise ValueError(
-                f"Absolute paths not allowed: {relative_path}. "
-                f"Must be relative path within client directory."
-            )
-
-        # Normalize path (remove ., .., etc.)
-        # Convert to string for normalization
-        path_str = str(Path(relative_path))
-
-        # Check for directory traversal attempts
-        if ".." in path_str or path_str.startswith("/"):
-            raise ValueError(
-                f"Path traversal not allowed: {relative_path}. "
-                f"Cannot use .. or absolute paths."
-            )
-
-        # Resolve within client directory
-        resolved = (client_dir / relative_path).resolve()
+        # Resolve within client directory (follows symlinks)
+        resolved = os.path.realpath(os.path.join(client_dir, norm))
 
         # Verify resolved path is still within client directory
-        try:
-            resolved.relative_to(client_dir)
-        except ValueError:
+        if resolved != client_dir and not resolved.startswith(prefix):
             raise ValueError(
-                f"Path escape detected: {relative_path} resolves outside "
+                f"Path escape detected: {norm} resolves outside "
                 f"client directory {client_dir}"
             )
 
         self.logger.debug(
-            f"Resolved path for {client_id}: {relative_path} → {resolved}"
+            "Resolved path for %s: %s → %s", client_id, relative_path, resolved
         )
-        return resolved
+        return Path(resolved)
+
+    def reset(self) -> None:
+        """
+        Drop cached client directories.
+
+        Note: Files are left in place; directories are recreated on next use
+        """
+        self._client_dirs.clear()
 
     def validate_access(
         self,
         client_id: str,
         target_path: Path,
         action: str = "read",
-        cross_client_permission: bool = False
+        cross_client_permission: bool = False,
+        already_resolved: bool = False
     ) -> bool:
         """
         Validate if client can access a file.
@@ -145,6 +243,8 @@ class ClientIsolationManager:
             target_path: Absolute path to the file
             action: "read" or "write"
             cross_client_permission: Whether client has FILE_READ/WRITE_CROSS_CLIENT perm
+            already_resolved: Only normalize target_path, skip realpath
+                (see validate_access_batch)
 
         Returns:
             bool: True if access allowed
@@ -155,53 +255,106 @@ class ClientIsolationManager:
           - Require cross_client_permission flag
           - Still log for audit trail
         """
-        client_dir = self.get_client_directory(client_id)
-        target_path = Path(target_path).resolve()
+        return self.validate_access_batch(
+            client_id, [target_path], action, cross_client_permission, already_resolved
+        )[0]
 
-        # Check if target is within client's directory
-        try:
-            target_path.relative_to(client_dir)
-            # Inside client directory - access allowed
+    def validate_access_batch(
+        self,
+        client_id: str,
+        target_paths: List[Path],
+        action: str = "read",
+        cross_client_permission: bool = False,
+        already_resolved: bool = False
+    ) -> List[bool]:
+        """
+        Validate if client can access several files.
+
+        Same rules as validate_access, but the client directory is looked up
+        once and out-of-directory paths are audited in a single log line.
+
+        Args:
+            client_id: ID of the client requesting access
+            target_paths: Absolute paths to the files
+            action: "read" or "write"
+            cross_client_permission: Whether client has FILE_READ/WRITE_CROSS_CLIENT perm
+            already_resolved: Only normalize the paths (os.path.normpath),
+                skip realpath. Symlinks are not followed, so a symlink
+                created after the path was resolved is not detected; only
+                pass True when nothing can have changed the tree since.
+
+        Returns:
+            List[bool]: One result per path, in order
+        """
+        _, client_dir, prefix = self._client_entry(client_id)
+
+        results = []
+        outside = []
+        for target_path in target_paths:
+            if already_resolved:
+                resolved = os.path.normpath(os.fspath(target_path))
+            else:
+                resolved = os.path.realpath(target_path)
+            if resolved == client_dir or resolved.startswith(prefix):
+                results.append(True)
+            else:
+                outside.append(resolved)
+                results.append(cross_client_permission)
+
+        own_count = len(results) - len(outside)
+        if own_count:
             self.logger.info(
-                f"Access allowed: {client_id} → {target_path} (own directory)"
+                "Access allowed: %s → %d path(s) (own directory)", client_id, own_count
             )
-            return True
-        except ValueError:
-            # Outside client directory - need cross-client permission
-            if not cross_client_permission:
+        if outside:
+            if cross_client_permission:
+                # Cross-client permission granted - allow but audit
                 self.logger.warning(
-                    f"Access denied: {client_id} → {target_path} "
-                    f"(no cross-client permission)"
+                    "Cross-client access: %s → %s (CROSS_CLIENT permission granted)",
+                    client_id, ", ".join(outside)
                 )
-                return False
+            else:
+                self.logger.warning(
+                    "Access denied: %s → %s (no cross-client permission)",
+                    client_id, ", ".join(outside)
+                )
+        return results
 
-            # Cross-client permission granted - allow but audit
-            self.logger.warning(
-                f"Cross-client access: {client_id} → {target_path} "
-                f"(CROSS_CLIENT permission granted)"
-            )
-            return True
+    def iter_client_files(self, client_id: str) -> Iterator[Path]:
+        """
+        Iterate over all files in a client's directory.
+
+        Files are yielded while the tree is walked, so large directories are
+        never held in memory at once.
+
+        Args:
+            client_id: ID of the client
+
+        Yields:
+            Path: Each file in client's directory (symlinks not followed)
+        """
+        client_dir, client_dir_str, _ = self._client_entry(client_id)
+        if not client_dir.exists():
+            return
+
+        for path in _walk_files(client_dir_str):
+            yield Path(path)
 
     def list_client_files(self, client_id: str) -> list:
         """
         List all files in a client's directory.
 
+        Prefer iter_client_files for large directories.
+
         Args:
             client_id: ID of the client
 
         Returns:
-            List[Path]: All files and directories in client's directory
+            List[Path]: All files in client's directory
         """
-        client_dir = self.get_client_directory(client_id)
-        if not client_dir.exists():
-            return []
-
-        files = []
-        for item in client_dir.rglob("*"):
-            if item.is_file():
-                files.append(item)
+        files = list(self.iter_client_files(client_id))
 
-        self.logger.debug(f"Listed {len(files)} files for {client_id}")
+        self.logger.debug("Listed %d files for %s", len(files), client_id)
         return files
 
     def clear_client_directory(self, client_id: str) -> None:
@@ -216,16 +369,24 @@ class ClientIsolationManager:
         client_dir = self.get_client_directory(client_id)
 
         if not client_dir.exists():
-            self.logger.info(f"Client directory doesn't exist: {client_dir}")
+            self.logger.info("Client directory doesn't exist: %s", client_dir)
             return
 
         # Remove all files
-        import shutil
         try:
-            shutil.rmtree(client_dir)
-            self.logger.info(f"Cleared client directory: {client_dir}")
+            with os.scandir(client_dir) as it:
+                entries = list(it)
+            if any(entry.is_dir(follow_symlinks=False) for entry in entries):
+                shutil.rmtree(client_dir)
+            else:
+                # Flat directory: no tree walk needed
+                for entry in entries:
+                    os.unlink(entry.path)
+                os.rmdir(client_dir)
+            self._client_dirs.pop(client_id, None)
+            self.logger.info("Cleared client directory: %s", client_dir)
         except Exception as e:
-            self.logger.error(f"Failed to clear client directory: {e}")
+            self.logger.error("Failed to clear client directory: %s", e)
 
     @staticmethod
     def validate_path_safety(path_str: str) -> bool:
@@ -238,11 +399,28 @@ class ClientIsolationManager:
         Returns:
             bool: True if path is safe
         """
-        dangerous_patterns = ["..", "//", "\\\\", "\x00"]
-        for pattern in dangerous_patterns:
-            if pattern in path_str:
-                return False
-        return True
+        return _DANGEROUS_RE.search(path_str) is None
+
+    @staticmethod
+    def validate_path_safety_bytes(path_bytes: bytes) -> bool:
+        """
+        Quick validation that a UTF-8 encoded path is safe (no traversal).
+
+        Same patterns as validate_path_safety, for callers still holding
+        the raw bytes.
+
+        Args:
+            path_bytes: UTF-8 encoded path to validate
+
+        Returns:
+            bool: True if path is safe
+        """
+        return not (
+            _DOTDOT_B in path_bytes
+            or _SLASHES_B in path_bytes
+            or _BACKSLASHES_B in path_bytes
+            or _NUL_B in path_bytes
+        )
 
 
 # ============================================================================
@@ -252,19 +430,25 @@ class ClientIsolationManager:
 if __name__ == "__main__":
     import unittest
     import tempfile
-    import shutil
 
     class TestClientIsolationManager(unittest.TestCase):
         """Test suite for ClientIsolationManager"""
 
-        def setUp(self):
-            """Setup test fixtures"""
-            self.temp_dir = tempfile.TemporaryDirectory()
-            self.manager = ClientIsolationManager(Path(self.temp_dir.name))
+        @classmethod
+        def setUpClass(cls):
+            """Setup one manager shared by all tests"""
+            cls.temp_dir = tempfile.TemporaryDirectory()
+            cls.manager = ClientIsolationManager(Path(cls.temp_dir.name))
 
-        def tearDown(self):
-            """Cleanup test fixtures"""
-            self.temp_dir.cleanup()
+        @classmethod
+        def tearDownClass(cls):
+            """Cleanup shared fixtures"""
+            cls.temp_dir.cleanup()
+
+        def setUp(self):
+            """Per-test client ids keep tests isolated in the shared manager"""
+            self.alice = f"alice_{self._testMethodName}"
+            self.bob = f"bob_{self._testMethodName}"
 
         def test_initialization(self):
             """Test manager initialization"""
@@ -273,48 +457,61 @@ if __name__ == "__main__":
 
         def test_create_client_directory(self):
             """Test client directory creation"""
-            client_dir = self.manager.get_client_directory("alice_123")
+            client_dir = self.manager.get_client_directory(self.alice)
             self.assertTrue(client_dir.exists())
-            self.assertEqual(client_dir.name, "alice_123")
+            self.assertEqual(client_dir.name, self.alice)
 
         def test_resolve_path_simple(self):
             """Test simple path resolution"""
-            resolved = self.manager.resolve_path("alice_123", "data.txt")
-            expected = self.manager.base_dir / "alice_123" / "data.txt"
+            resolved = self.manager.resolve_path(self.alice, "data.txt")
+            expected = self.manager.base_dir / self.alice / "data.txt"
             self.assertEqual(resolved, expected)
 
         def test_resolve_path_nested(self):
             """Test nested path resolution"""
-            resolved = self.manager.resolve_path("alice_123", "files/subfolder/doc.pdf")
-            expected = self.manager.base_dir / "alice_123" / "files/subfolder/doc.pdf"
+            resolved = self.manager.resolve_path(self.alice, "files/subfolder/doc.pdf")
+            expected = self.manager.base_dir / self.alice / "files/subfolder/doc.pdf"
             self.assertEqual(resolved, expected)
 
-        def test_resolve_path_absolute_rejected(self):
-            """Test that absolute paths are rejected"""
+        def test_resolve_path_symlink_escape_rejected(self):
+            """Test a symlink pointing outside the client directory is rejected"""
+            client_dir = self.manager.get_client_directory(self.alice)
+            os.symlink(self.manager.base_dir, client_dir / "escape")
             with self.assertRaises(ValueError):
-                self.manager.resolve_path("alice_123", "/etc/passwd")
+                self.manager.resolve_path(self.alice, f"escape/{self.bob}/secret.txt")
 
-        def test_resolve_path_traversal_rejected(self):
-            """Test that path traversal is rejected"""
+        def test_resolve_path_inner_dots_normalized(self):
+            """Test .. segments that stay inside the client directory resolve"""
+            resolved = self.manager.resolve_path(self.alice, "files/../data.txt")
+            self.assertEqual(resolved, self.manager.base_dir / self.alice / "data.txt")
             with self.assertRaises(ValueError):
-                self.manager.resolve_path("alice_123", "../../etc/passwd")
+                self.manager.resolve_path(self.alice, f"files/../../{self.bob}/x")
 
         def test_validate_access_own_file(self):
             """Test access to own file is allowed"""
-            own_path = self.manager.resolve_path("alice_123", "data.txt")
+            own_path = self.manager.resolve_path(self.alice, "data.txt")
             allowed = self.manager.validate_access(
-                "alice_123",
+                self.alice,
                 own_path,
                 action="read",
-                cross_client_permission=False
+                cross_client_permission=False,
+                already_resolved=True
             )
             self.assertTrue(allowed)
 
+        def test_validate_access_already_resolved_normalizes(self):
+            """Test the no-realpath path still collapses .. segments"""
+            alice_dir = self.manager.get_client_directory(self.alice)
+            escape = f"{alice_dir}{os.sep}..{os.sep}{self.bob}{os.sep}x"
+            self.assertFalse(self.manager.validate_access(
+                self.alice, escape, already_resolved=True
+            ))
+
         def test_validate_access_other_file_denied(self):
             """Test access to other client's file is denied"""
-            bob_path = self.manager.resolve_path("bob_456", "secret.txt")
+            bob_path = self.manager.resolve_path(self.bob, "secret.txt")
             allowed = self.manager.validate_access(
-                "alice_123",
+                self.alice,
                 bob_path,
                 action="read",
                 cross_client_permission=False
@@ -323,24 +520,140 @@ if __name__ == "__main__":
 
         def test_validate_access_cross_client_allowed(self):
             """Test cross-client access with permission is allowed"""
-            bob_path = self.manager.resolve_path("bob_456", "secret.txt")
+            bob_path = self.manager.resolve_path(self.bob, "secret.txt")
             allowed = self.manager.validate_access(
-                "alice_123",
+                self.alice,
                 bob_path,
                 action="read",
                 cross_client_permission=True
             )
             self.assertTrue(allowed)
 
+        def test_validate_access_sibling_prefix_denied(self):
+            """Test a sibling directory sharing the name prefix is outside"""
+            sibling = self.manager.resolve_path(self.alice + "_evil", "data.txt")
+            self.assertFalse(self.manager.validate_access(self.alice, sibling))
+            self.assertTrue(self.manager.validate_access(
+                self.alice, self.manager.get_client_directory(self.alice)
+            ))
+
+        def test_validate_access_batch(self):
+            """Test batch access checks and single aggregated audit line"""
+            own = [self.manager.resolve_path(self.alice, f"f{i}.txt") for i in range(3)]
+            other = self.manager.resolve_path(self.bob, "secret.txt")
+
+            with self.assertLogs("resources.client_isolation", "WARNING") as logs:
+                allowed = self.manager.validate_access_batch(self.alice, own + [other])
+            self.assertEqual(allowed, [True, True, True, False])
+            self.assertEqual(len(logs.output), 1)
+
+            allowed = self.manager.validate_access_batch(
+                self.alice, [other, str(own[0])], cross_client_permission=True
+            )
+            self.assertEqual(allowed, [True, True])
+
+        def test_client_directory_cached(self):
+            """Test client directory is created once, recreated after clear"""
+            first = self.manager.get_client_directory(self.alice)
+            self.assertIs(self.manager.get_client_directory(self.alice), first)
+
+            self.manager.clear_client_directory(self.alice)
+            self.assertFalse(first.exists())
+            self.assertTrue(self.manager.get_client_directory(self.alice).exists())
+
+        def test_resolve_path_normalization_cached(self):
+            """Test only normalization is cached; directories recreated after clear"""
+            first = self.manager.resolve_path(self.alice, "data.txt")
+            hits = _normalize_relative.cache_info().hits
+            self.assertEqual(self.manager.resolve_path(self.alice, "data.txt"), first)
+            self.assertEqual(_normalize_relative.cache_info().hits, hits + 1)
+
+            self.manager.clear_client_directory(self.alice)
+            self.assertEqual(self.manager.resolve_path(self.alice, "data.txt"), first)
+            self.assertTrue(first.parent.exists())
+
+            self.manager.reset()
+            self.assertEqual(self.manager._client_dirs, {})
+
+        def test_resolve_path_symlink_swapped_after_resolve(self):
+            """Test a directory replaced by an escaping symlink is re-checked"""
+            alice_dir = self.manager.get_client_directory(self.alice)
+            bob_dir = self.manager.get_client_directory(self.bob)
+            (bob_dir / "secret.txt").write_text("bob")
+            (alice_dir / "link").mkdir()
+            self.manager.resolve_path(self.alice, "link/secret.txt")
+
+            (alice_dir / "link").rmdir()
+            os.symlink(bob_dir, alice_dir / "link")
+            with self.assertRaises(ValueError):
+                self.manager.resolve_path(self.alice, "link/secret.txt")
+
         def test_list_client_files(self):
             """Test listing client files"""
             # Create some files
-            client_dir = self.manager.get_client_directory("alice_123")
+            client_dir = self.manager.get_client_directory(self.alice)
             (client_dir / "file1.txt").touch()
             (client_dir / "file2.txt").touch()
 
-            files = self.manager.list_client_files("alice_123")
-            self.assertEqual(len(files), 2)
+            (client_dir / "sub").mkdir()
+            (client_dir / "sub" / "file3.txt").touch()
+
+            files = self.manager.list_client_files(self.alice)
+            self.assertEqual(len(files), 3)
+            self.assertEqual(sorted(self.manager.iter_client_files(self.alice)), sorted(files))
+            self.assertIn(client_dir / "sub" / "file3.txt", files)
+            self.manager.clear_client_directory(self.alice)
+            self.assertFalse(client_dir.exists())
+
+        def test_clear_flat_client_directory(self):
+            """Test clearing a directory holding only files and symlinks"""
+            client_dir = self.manager.get_client_directory(self.alice)
+            (client_dir / "file1.txt").touch()
+            os.symlink(self.manager.base_dir, client_dir / "link")
+
+            self.manager.clear_client_directory(self.alice)
+            self.assertFalse(client_dir.exists())
+            self.assertTrue(self.manager.base_dir.exists())
+
+    class TestClientIsolationLogic(unittest.TestCase):
+        """Path validation logic that needs no filesystem"""
+
+        def setUp(self):
+            """Manager without base directory or mkdir"""
+            self.manager = ClientIsolationManager.__new__(ClientIsolationManager)
+            self.manager.base_dir = Path("/fake")
+            self.manager.logger = logging.getLogger("test")
+            self.manager._client_dirs = {}
+            self.manager._client_entry = lambda cid: (
+                Path("/fake") / cid, f"/fake/{cid}", f"/fake/{cid}/"
+            )
+
+        def test_resolve_path_within_client_dir(self):
+            """Test a plain relative path resolves under the client directory"""
+            self.assertEqual(
+                self.manager.resolve_path("alice_123", "docs/./a.txt"),
+                Path("/fake/alice_123/docs/a.txt"),
+            )
+
+        def test_resolve_path_absolute_rejected(self):
+            """Test that absolute paths are rejected"""
+            with self.assertRaises(ValueError):
+                self.manager.resolve_path("alice_123", "/etc/passwd")
+
+        def test_resolve_path_traversal_rejected(self):
+            """Test that path traversal is rejected"""
+            with self.assertRaises(ValueError):
+                self.manager.resolve_path("alice_123", "../../etc/passwd")
+
+        def test_validate_path_safety(self):
+            """Test dangerous path patterns are detected"""
+            self.assertTrue(ClientIsolationManager.validate_path_safety("a/b.txt"))
+            for path in ["../x", "a//b", "a\\\\b", "a\x00b"]:
+                self.assertFalse(ClientIsolationManager.validate_path_safety(path))
+                self.assertFalse(
+                    ClientIsolationManager.validate_path_safety_bytes(path.encode())
+                )
+            self.assertTrue(ClientIsolationManager.validate_path_safety_bytes(b"a/b.txt"))
 
     # Run tests
     unittest.main()
@@ -15,6 +15,34 @@ CHANGELOG:
   - Audit logging of all executions
   - Error handling and reporting
 
+[2026-10-15 v0.2.1-alpha] Hot path optimizations
+  - Buffered audit trail: entries batched, moved to the log by a timer
+  - Timeouts via asyncio.timeout (no wrapper Task per execution)
+  - Parameter validators compiled once per tool (fastjsonschema, optional)
+  - Execution log bounded (audit_retention); O(1) stats from running counters
+  - audit_level: all / writes_only / failures_only (entries built after filter)
+  - Audit entries store bounded reprs of params/results, not the objects
+  - Traceback text only built when DEBUG logging is enabled
+  - Entry timestamps taken as time.time_ns(), ISO-formatted at flush
+  - Prewarmed sandbox reserve (first call of a client skips sandbox setup)
+  - Granted (client, tool) permission checks cached (TTL + LRU, invalidated
+    by PermissionManager change listeners); keyed by tool name, so the
+    cache holds no Tool references
+  - Basic validation precompiled into (name, required, type) checks, with
+    fastjsonschema's type rules and error messages
+  - Optional audit sink written once per flush (one write, one fsync)
+  - Execution ids are counter values, formatted at flush
+  - Lazy %-style logging; per-call INFO lines skipped when disabled
+  - Success response built as a single literal, no isinstance branch
+  - get_execution_log returns a read-only view (copy only on snapshot=True)
+  - Per-tool executors: validator, timeout, audit flag and a frozen
+    permission tuple resolved once
+  - Basic validators: required-name scan + per-field isinstance, errors
+    built only on failure
+  - Constraint-free schemas validated by a single dict type check
+  - Exceptions use __slots__ (no per-instance attribute dict)
+  - Optional audit sink writer thread (audit_sink_thread), drained by close()
+
 ARCHITECTURE:
 ExecutionManager orchestrates secure tool execution:
   1. Validate input parameters against schema
@@ -28,6 +56,37 @@ ExecutionManager is owned by MCPServer and uses:
   - PermissionManager (check permissions)
   - SandboxContext (isolated execution per client)
 
+Audit entries are appended to a small buffer; from a running event loop a
+timer (log_flush_interval) moves the whole buffer into the execution log
+in one batch, or immediately once log_buffer_max entries are pending.
+get_execution_log flushes first, so it always sees every entry; it
+returns a live read-only view unless snapshot=True is passed. Call
+close() before shutdown. With an audit_sink (e.g. a JSONLStore), each
+flush also persists the batch: one append_batch() call, so one write and
+at most one fsync per batch instead of per entry. The write is inline by
+default; with audit_sink_thread=True it runs on a single writer thread
+(batches stay in order) so disk latency never blocks the event loop, and
+close() waits for pending writes. Only the last audit_retention entries
+are kept; get_stats counts every execution through running counters.
+
+audit_level filters which executions get an audit entry: every one
+("all", default), failures plus successful mutating tools ("writes_only"),
+or failures only ("failures_only"). A tool is mutating if it sets
+is_mutation, otherwise if it needs any permission beyond file reads.
+
+Each tool's input schema is compiled once into a validator function
+(fastjsonschema generates specialized Python code). Without the optional
+fastjsonschema package, or for schemas it rejects, the basic required /
+type check is used instead.
+
+On its first call a tool also gets an executor closure (_make_executor)
+holding its validator, timeout, permission tuple and mutation flag, so
+later calls skip those lookups. The tool itself is passed in on each call
+(the closure holds no reference to it, so the cache entry goes away with
+the tool). The executor reflects the tool as it was then; call
+forget_tool() after changing a tool's schema, timeout, permissions or
+is_mutation. audit_level is read on every call.
+
 SECURITY NOTES:
 - All parameters validated before execution
 - Permissions strictly checked
@@ -38,21 +97,110 @@ SECURITY NOTES:
 """
 
 import asyncio
+import collections
+import collections.abc
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import reprlib
 import traceback
-from typing import Dict, Any, Optional
-from datetime import datetime
+import weakref
+from enum import Enum
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple, Union
+from datetime import datetime, timezone
 import time
 
+try:
+    from asyncio import timeout as _timeout  # Python 3.11+
+except ImportError:
+    try:
+        from async_timeout import timeout as _timeout
+    except ImportError:
+        _timeout = None
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
 from ..tools.tool import Tool
+from ..security.permission import PermissionType
 from ..security.permission_manager import PermissionManager, PermissionDeniedError
 from ..security.client_context import ClientContext
 from .sandbox_context import SandboxContext
 
 
+class AuditLevel(str, Enum):
+    """Which executions are recorded in the audit trail"""
+
+    ALL = "all"
+    WRITES_ONLY = "writes_only"
+    FAILURES_ONLY = "failures_only"
+
+
+# Permissions that do not make a tool mutating (writes_only audit level)
+_READ_ONLY_PERMISSIONS = frozenset({
+    PermissionType.FILE_READ,
+    PermissionType.FILE_READ_CROSS_CLIENT,
+})
+
+
+# JSON Schema type -> Python type(s)
+_NUMERIC = (int, float)  # refined by _is_json_number
+
+_TYPE_MAP = MappingProxyType({
+    "string": str,
+    "number": _NUMERIC,
+    "integer": _NUMERIC,  # integral floats too, as in fastjsonschema
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+})
+
+# Bounded repr of params/results for audit entries: caps nesting and sizes
+# so formatting cost does not grow with the payload, and no reference to
+# the caller's objects is kept
+_AUDIT_REPR = reprlib.Repr()
+_AUDIT_REPR.maxlevel = 3
+_AUDIT_REPR.maxdict = 20
+_AUDIT_REPR.maxlist = 20
+_AUDIT_REPR.maxstring = 200
+_AUDIT_REPR.maxother = 200
+
+# Keywords that constrain nothing (a schema made only of these is a no-op)
+_ANNOTATION_KEYWORDS = frozenset({"title", "description", "default", "examples"})
+
+# Max length of the params/result strings kept in an audit entry
+_AUDIT_FIELD_MAX = 500
+
+
+def _safe_truncate(obj: Any, limit: int = _AUDIT_FIELD_MAX) -> str:
+    """
+    Bounded text of a value for audit entries
+
+    Strings are sliced; anything else goes through the bounded repr, so a
+    large result is never stringified in full.
+
+    Args:
+        obj: Value to format
+        limit: Max length of the returned string
+
+    Returns:
+        str: At most limit characters
+    """
+    if isinstance(obj, str):
+        return obj[:limit]
+    return _AUDIT_REPR.repr(obj)[:limit]
+
+
 class ExecutionError(Exception):
     """Raised when tool execution fails"""
 
+    __slots__ = ("message", "error_type", "details")
+
     def __init__(self, message: str, error_type: str = "execution_error", details: Optional[Dict] = None):
         self.message = message
         self.error_type = error_type
@@ -63,6 +211,8 @@ class ExecutionError(Exception):
 class ValidationError(Exception):
     """Raised when parameter validation fails"""
 
+    __slots__ = ("message", "schema_errors")
+
     def __init__(self, message: str, schema_errors: Optional[list] = None):
         self.message = message
         self.schema_errors = schema_errors or []
@@ -72,10 +222,62 @@ class ValidationError(Exception):
 class ExecutionTimeout(ExecutionError):
     """Raised when tool execution times out"""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message, error_type="timeout")
 
 
+def _raise_invalid(error: str) -> None:
+    """Raise a ValidationError worded like fastjsonschema's ("data.x must be ...")"""
+    raise ValidationError(f"Invalid parameters: {error}", schema_errors=[error])
+
+
+def _is_json_number(value: Any, type_name: str) -> bool:
+    """Check an int/float against "number" or "integer" (bool is neither)"""
+    if value.__class__ is bool:
+        return False
+    return type_name == "number" or isinstance(value, int) or value.is_integer()
+
+
+def _validate_any_object(params: Any) -> None:
+    """Validator for schemas that only require an object (no constraints)"""
+    if not isinstance(params, dict):
+        _raise_invalid("data must be object")
+
+
+class _ReadOnlyLogView(collections.abc.Sequence):
+    """
+    Read-only Sequence over the execution log deque (no copy).
+
+    The view is live: it reflects later flushes. Iterating while a flush
+    runs raises RuntimeError (deque mutated), so take a snapshot to keep
+    entries across awaits.
+    """
+
+    __slots__ = ("_log",)
+
+    def __init__(self, log: collections.deque):
+        self._log = log
+
+    def __len__(self) -> int:
+        return len(self._log)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._log)[index]
+        return self._log[index]
+
+    def __iter__(self):
+        return iter(self._log)
+
+    def __reversed__(self):
+        return reversed(self._log)
+
+    def __repr__(self) -> str:
+        return f"<execution log view: {len(self._log)} entries>"
+
+
 class ExecutionManager:
     """
     Manages secure execution of tools
@@ -89,6 +291,16 @@ class ExecutionManager:
         permission_manager: PermissionManager,
         default_timeout: int = 30,
         max_memory_mb: int = 512,
+        log_flush_interval: float = 1.0,
+        log_buffer_max: int = 256,
+        audit_retention: int = 10000,
+        audit_level: Union[AuditLevel, str] = AuditLevel.ALL,
+        sandbox_reserve_size: int = 4,
+        perm_cache_ttl: float = 60.0,
+        perm_cache_size: int = 4096,
+        audit_sink: Optional[Any] = None,
+        audit_fsync: bool = False,
+        audit_sink_thread: bool = False,
     ):
         """
         Initialize execution manager
@@ -97,6 +309,18 @@ class ExecutionManager:
             permission_manager: PermissionManager instance
             default_timeout: Default timeout in seconds
             max_memory_mb: Max memory limit in MB (Phase 2: logged only)
+            log_flush_interval: Max seconds audit entries wait in the buffer
+            log_buffer_max: Pending entries that trigger an immediate flush
+            audit_retention: Max entries kept in the execution log
+            audit_level: Executions recorded in the log (see AuditLevel)
+            sandbox_reserve_size: Prewarmed sandboxes kept ready for new clients
+            perm_cache_ttl: Seconds a granted (client, tool) check is reused
+            perm_cache_size: Max cached (client, tool) grants
+            audit_sink: Store with append_batch(entries, sync) persisting
+                flushed entries (e.g. JSONLStore), None = memory only
+            audit_fsync: fsync the sink after each batch
+            audit_sink_thread: Write batches to the sink from a writer
+                thread instead of inline (call close() at shutdown)
         """
         self.logger = logging.getLogger("execution.manager")
         self.permission_manager = permission_manager
@@ -106,8 +330,48 @@ class ExecutionManager:
         # Execution contexts per client
         self._sandboxes: Dict[str, SandboxContext] = {}
 
-        # Execution audit trail
-        self._execution_log: list = []
+        # Unbound sandboxes, refilled from the event loop after use
+        self.sandbox_reserve_size = sandbox_reserve_size
+        self._sandbox_reserve: collections.deque = collections.deque()
+        self._replenish_scheduled = False
+
+        # Granted permission checks: (client_id, tool name) -> (expiry
+        # (monotonic), permissions checked). Denials are never cached so
+        # each one reaches the permission audit.
+        self.perm_cache_ttl = perm_cache_ttl
+        self.perm_cache_size = perm_cache_size
+        self._perm_cache: "collections.OrderedDict[tuple, tuple]" = collections.OrderedDict()
+        permission_manager.add_change_listener(self.invalidate_client)
+
+        # Compiled parameter validators and executors per tool (dropped
+        # with the tool: neither holds a reference to it)
+        self._validators: "weakref.WeakKeyDictionary[Tool, Callable]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executors: "weakref.WeakKeyDictionary[Tool, Callable]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Execution audit trail (+ entries buffered until the next flush)
+        self.audit_retention = audit_retention
+        self.audit_level = AuditLevel(audit_level)
+        self._execution_log: collections.deque = collections.deque(maxlen=audit_retention)
+        self._log_buffer: list = []
+        self.log_flush_interval = log_flush_interval
+        self.log_buffer_max = log_buffer_max
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.audit_sink = audit_sink
+        self.audit_fsync = audit_fsync
+        self.audit_sink_thread = audit_sink_thread
+        self._sink_writer: Optional[ThreadPoolExecutor] = None
+        # Execution ids: "<client_id>:<tool>:<n>" built at flush from n
+        self._exec_counter = itertools.count()
+
+        # Running statistics (cover entries rotated out of the log)
+        self._total = 0
+        self._success = 0
+        self._time_ms_sum = 0
 
     def get_sandbox(self, client_id: str) -> SandboxContext:
         """
@@ -119,11 +383,35 @@ class ExecutionManager:
         Returns:
             SandboxContext: Client's sandbox
         """
-        if client_id not in self._sandboxes:
-            self._sandboxes[client_id] = SandboxContext(client_id)
-            self.logger.debug(f"Sandbox created for {client_id}")
-
-        return self._sandboxes[client_id]
+        sandbox = self._sandboxes.get(client_id)
+        if sandbox is None:
+            if self._sandbox_reserve:
+                sandbox = self._sandbox_reserve.popleft()
+                sandbox.rebind(client_id)
+            else:
+                sandbox = SandboxContext(client_id)
+            self._sandboxes[client_id] = sandbox
+            self.logger.debug("Sandbox created for %s", client_id)
+            self._schedule_replenish()
+
+        return sandbox
+
+    def _schedule_replenish(self) -> None:
+        """Refill the sandbox reserve soon, outside the current request"""
+        if self._replenish_scheduled or self.sandbox_reserve_size <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: sandboxes are created on demand
+        self._replenish_scheduled = True
+        loop.call_soon(self._replenish_sandboxes)
+
+    def _replenish_sandboxes(self) -> None:
+        """Create sandboxes until the reserve is full"""
+        self._replenish_scheduled = False
+        while len(self._sandbox_reserve) < self.sandbox_reserve_size:
+            self._sandbox_reserve.append(SandboxContext("reserve"))
 
     def clear_sandbox(self, client_id: str) -> None:
         """
@@ -135,7 +423,7 @@ class ExecutionManager:
         if client_id in self._sandboxes:
             self._sandboxes[client_id].clear()
             del self._sandboxes[client_id]
-            self.logger.info(f"Sandbox cleared for {client_id}")
+            self.logger.info("Sandbox cleared for %s", client_id)
 
     async def execute_tool(
         self,
@@ -171,26 +459,20 @@ class ExecutionManager:
             ExecutionError: If execution fails
         """
         start_time = time.time()
-        execution_id = f"{client.client_id}:{tool.name}:{int(start_time * 1000)}"
+        execution_id = next(self._exec_counter)
+        log_info = self.logger.isEnabledFor(logging.INFO)
 
-        self.logger.info(
-            f"Executing tool: {tool.name} for client {client.client_id}"
-        )
+        if log_info:
+            self.logger.info(
+                "Executing tool: %s for client %s", tool.name, client.client_id
+            )
 
         try:
-            # Step 1: Validate parameters
-            await self._validate_params(params, tool.input_schema.to_dict())
-
-            # Step 2: Check permissions
-            self._check_permissions(client, tool)
-
-            # Step 3: Get sandbox context
-            sandbox = self.get_sandbox(client.client_id)
-            sandbox.increment_execution_count()
-
-            # Step 4: Execute with timeout
-            timeout = tool.timeout if hasattr(tool, "timeout") else self.default_timeout
-            result = await self._execute_with_timeout(tool, client, params, timeout)
+            # Steps 1-4: validate, check permissions, sandbox, run
+            executor = self._executors.get(tool)
+            if executor is None:
+                executor = self._executors[tool] = self._make_executor(tool)
+            result = await executor(tool, client, params)
 
             # Step 5: Log success
             execution_time = time.time() - start_time
@@ -202,26 +484,21 @@ class ExecutionManager:
                 execution_time=execution_time,
                 params=params,
                 result=result,
+                mutation=executor.mutation,
             )
 
-            self.logger.info(
-                f"Tool executed successfully: {tool.name} "
-                f"({execution_time:.3f}s)"
-            )
+            if log_info:
+                self.logger.info(
+                    "Tool executed successfully: %s (%.3fs)",
+                    tool.name, execution_time,
+                )
 
-            # Return in MCP format
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": str(result) if not isinstance(result, str) else result
-                    }
-                ],
-                "isError": False,
-            }
+            # Return in MCP format (a literal is the cheapest way to build it)
+            text = result if type(result) is str else str(result)
+            return {"content": [{"type": "text", "text": text}], "isError": False}
 
         except ValidationError as e:
-            self.logger.warning(f"Validation error: {e.message}")
+            self.logger.warning("Validation error: %s", e.message)
             self._log_execution(
                 execution_id=execution_id,
                 client_id=client.client_id,
@@ -234,7 +511,7 @@ class ExecutionManager:
             raise
 
         except PermissionDeniedError as e:
-            self.logger.warning(f"Permission denied: {e}")
+            self.logger.warning("Permission denied: %s", e)
             self._log_execution(
                 execution_id=execution_id,
                 client_id=client.client_id,
@@ -247,7 +524,7 @@ class ExecutionManager:
             raise
 
         except ExecutionTimeout as e:
-            self.logger.error(f"Tool execution timeout: {tool.name}")
+            self.logger.error("Tool execution timeout: %s", tool.name)
             self._log_execution(
                 execution_id=execution_id,
                 client_id=client.client_id,
@@ -260,8 +537,15 @@ class ExecutionManager:
             raise
 
         except Exception as e:
-            self.logger.error(f"Tool execution failed: {e}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.error("Tool execution failed: %s", e)
+            # Formatting walks every frame: only when DEBUG is enabled
+            tb = (
+                traceback.format_exc()
+                if self.logger.isEnabledFor(logging.DEBUG)
+                else None
+            )
+            if tb:
+                self.logger.debug(tb)
             self._log_execution(
                 execution_id=execution_id,
                 client_id=client.client_id,
@@ -274,84 +558,198 @@ class ExecutionManager:
             raise ExecutionError(
                 f"Tool execution failed: {str(e)}",
                 error_type=type(e).__name__,
-                details={"traceback": traceback.format_exc()},
+                details={"traceback": tb} if tb else {},
             )
 
-    async def _validate_params(
+    def _make_executor(self, tool: Tool) -> Callable:
+        """
+        Build the per-tool part of execute_tool as a closure
+
+        The validator, timeout and mutation flag are resolved here once
+        instead of on every call. The tool is an argument of the returned
+        function rather than a closure variable, so the executor does not
+        keep its weak _executors key alive.
+
+        Args:
+            tool: Tool to specialize for
+
+        Returns:
+            Coroutine function (tool, client, params) -> tool result, with a
+            mutation attribute (tool may modify state, for audit_level)
+        """
+        validator = self._validators.get(tool)
+        if validator is None:
+            validator = self._validators[tool] = self._compile_validator(
+                tool.input_schema.to_dict()
+            )
+        timeout = getattr(tool, "timeout", self.default_timeout)
+        permissions = tuple(tool.permissions)
+        check_permissions = self._check_permissions
+        get_sandbox = self.get_sandbox
+        execute_with_timeout = self._execute_with_timeout
+
+        async def execute(
+            tool: Tool, client: ClientContext, params: Dict[str, Any]
+        ) -> Any:
+            validator(params)
+            check_permissions(client, tool, permissions)
+            get_sandbox(client.client_id).increment_execution_count()
+            return await execute_with_timeout(tool, client, params, timeout)
+
+        execute.mutation = self._is_mutation(tool)
+        return execute
+
+    def forget_tool(self, tool: Tool) -> None:
+        """
+        Drop the cached validator and executor of a tool
+
+        Call after changing the tool's schema, timeout, permissions or
+        is_mutation.
+
+        Args:
+            tool: Tool to forget
+        """
+        self._validators.pop(tool, None)
+        self._executors.pop(tool, None)
+        for key in [key for key in self._perm_cache if key[1] == tool.name]:
+            del self._perm_cache[key]
+
+    def _compile_validator(
         self,
-        params: Dict[str, Any],
         schema: Dict[str, Any],
-    ) -> None:
+    ) -> Callable[[Dict[str, Any]], None]:
         """
-        Validate parameters against JSON Schema
-
-        Phase 2: Basic validation (type checking, required fields)
-        Phase 3+: Full JSON Schema validation with jsonschema library
+        Build a parameter validator for a JSON Schema
 
         Args:
-            params: Parameters to validate
             schema: JSON Schema
 
-        Raises:
-            ValidationError: If validation fails
+        Returns:
+            Callable: validator(params), raises ValidationError if invalid
         """
-        # Basic validation for Phase 2
-        required = schema.get("required", [])
-        properties = schema.get("properties", {})
-
-        # Check required fields
-        for field in required:
-            if field not in params:
-                raise ValidationError(
-                    f"Missing required parameter: {field}",
-                    schema_errors=[f"Required field '{field}' not provided"],
+        if self._is_noop_schema(schema):
+            return _validate_any_object
+
+        if HAS_FASTJSONSCHEMA:
+            try:
+                compiled = fastjsonschema.compile(schema, use_default=False)
+            except fastjsonschema.JsonSchemaDefinitionException as e:
+                self.logger.warning(
+                    "Schema not compilable, using basic validation: %s", e
                 )
+            else:
+                def validate(params: Dict[str, Any]) -> None:
+                    try:
+                        compiled(params)
+                    except fastjsonschema.JsonSchemaValueException as e:
+                        _raise_invalid(e.message)
+                return validate
+
+        return self._compile_basic_validator(schema)
+
+    @staticmethod
+    def _is_noop_schema(schema: Dict[str, Any]) -> bool:
+        """
+        Check whether a schema accepts every object
 
-        # Basic type checking
-        for param_name, param_value in params.items():
-            if param_name in properties:
-                expected_type = properties[param_name].get("type")
-                if expected_type:
-                    if not self._check_type(param_value, expected_type):
-                        raise ValidationError(
-                            f"Invalid type for parameter '{param_name}': "
-                            f"expected {expected_type}, got {type(param_value).__name__}",
-                            schema_errors=[
-                                f"Type mismatch for '{param_name}'"
-                            ],
-                        )
+        True when nothing is required and neither the schema nor any
+        property schema has a keyword beyond annotations.
 
-    def _check_type(self, value: Any, expected_type: str) -> bool:
+        Args:
+            schema: JSON Schema
+
+        Returns:
+            bool: True if only the params object type needs checking
         """
-        Check if value matches expected JSON Schema type
+        if schema.get("type", "object") != "object" or schema.get("required"):
+            return False
+        if not schema.keys() <= {"type", "properties", "required"} | _ANNOTATION_KEYWORDS:
+            return False
+        properties = schema.get("properties") or {}
+        return all(
+            isinstance(prop, dict) and prop.keys() <= _ANNOTATION_KEYWORDS
+            for prop in properties.values()
+        )
+
+    @staticmethod
+    def _compile_type_checks(
+        schema: Dict[str, Any],
+    ) -> List[Tuple[str, bool, Optional[Any], Optional[str]]]:
+        """
+        Precompute basic checks for a JSON Schema
 
         Args:
-            value: Value to check
-            expected_type: JSON Schema type string
+            schema: JSON Schema
 
         Returns:
-            bool: True if type matches
-        """
-        type_map = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
+            List of (name, required, python type or None, schema type name),
+            required fields first
+        """
+        required = schema.get("required", [])
+        properties = schema.get("properties", {})
 
-        if expected_type not in type_map:
-            return True  # Unknown type, skip validation
+        def expected(name: str) -> Tuple[Optional[Any], Optional[str]]:
+            type_name = properties.get(name, {}).get("type")
+            pytype = _TYPE_MAP.get(type_name)  # Unknown type: skip validation
+            return pytype, type_name if pytype is not None else None
+
+        checks = [(name, True) + expected(name) for name in required]
+        checks += [
+            (name, False) + expected(name)
+            for name in properties
+            if name not in required
+        ]
+        return [check for check in checks if check[1] or check[2] is not None]
+
+    @classmethod
+    def _compile_basic_validator(
+        cls,
+        schema: Dict[str, Any],
+    ) -> Callable[[Dict[str, Any]], None]:
+        """
+        Build the basic (required / type) validator for a JSON Schema
 
-        expected_python_type = type_map[expected_type]
-        return isinstance(value, expected_python_type)
+        The happy path is one membership test per required field and one
+        isinstance per present typed field; error messages are only
+        built when a check fails. Types and messages follow fastjsonschema
+        (bool is not a number, 3.0 is an integer, "data.x must be ...").
+
+        Args:
+            schema: JSON Schema
+
+        Returns:
+            Callable: validator(params), raises ValidationError if invalid
+        """
+        checks = cls._compile_type_checks(schema)
+        required = tuple(name for name, is_required, _, _ in checks if is_required)
+        typed = tuple(
+            (name, pytype, type_name)
+            for name, _, pytype, type_name in checks
+            if pytype is not None
+        )
+
+        def validate(params: Dict[str, Any]) -> None:
+            if not isinstance(params, dict):
+                _raise_invalid("data must be object")
+            for name in required:
+                if name not in params:
+                    missing = sorted(set(required) - params.keys())
+                    _raise_invalid(f"data must contain {missing} properties")
+            for name, pytype, type_name in typed:
+                if name in params:
+                    value = params[name]
+                    if not isinstance(value, pytype) or (
+                        pytype is _NUMERIC and not _is_json_number(value, type_name)
+                    ):
+                        _raise_invalid(f"data.{name} must be {type_name}")
+
+        return validate
 
     def _check_permissions(
         self,
         client: ClientContext,
         tool: Tool,
+        permissions: Optional[Tuple[PermissionType, ...]] = None,
     ) -> None:
         """
         Check if client has permissions to execute tool
@@ -359,14 +757,46 @@ class ExecutionManager:
         Args:
             client: Client context
             tool: Tool to execute
+            permissions: Tool's required permissions frozen by the
+                executor (None = read tool.permissions)
 
         Raises:
             PermissionDeniedError: If any required permission missing
         """
-        for required_permission in tool.permissions:
-            self.permission_manager.check_permission(
-                client.client_id, required_permission
-            )
+        if permissions is None:
+            permissions = tuple(tool.permissions)
+
+        # Keyed by name (no Tool reference kept alive); a tool registered
+        # again under that name with other permissions misses the cache
+        key = (client.client_id, tool.name)
+        cache = self._perm_cache
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None and entry[0] > now and entry[1] == permissions:
+            cache.move_to_end(key)
+            return
+
+        check_permission = self.permission_manager.check_permission
+        client_id = client.client_id
+        for required_permission in permissions:
+            check_permission(client_id, required_permission)
+
+        cache[key] = (now + self.perm_cache_ttl, permissions)
+        cache.move_to_end(key)
+        if len(cache) > self.perm_cache_size:
+            cache.popitem(last=False)
+
+    def invalidate_client(self, client_id: str) -> None:
+        """
+        Drop cached permission decisions for a client
+
+        Registered as a PermissionManager change listener.
+
+        Args:
+            client_id: Client identifier
+        """
+        for key in [key for key in self._perm_cache if key[0] == client_id]:
+            del self._perm_cache[key]
 
     async def _execute_with_timeout(
         self,
@@ -393,24 +823,40 @@ class ExecutionManager:
         Raises:
             ExecutionTimeout: If execution exceeds timeout
         """
-        # Execute with timeout
+        # Execute with timeout (a timer on the current task, no child Task)
         try:
-            result = await asyncio.wait_for(
-                tool.execute(client, params),
-                timeout=timeout,
-            )
-            return result
+            if _timeout is None:
+                return await asyncio.wait_for(tool.execute(client, params), timeout=timeout)
+            async with _timeout(timeout):
+                return await tool.execute(client, params)
         except asyncio.TimeoutError:
             self.logger.error(
-                f"Tool {tool.name} exceeded timeout of {timeout}s"
+                "Tool %s exceeded timeout of %ss", tool.name, timeout
             )
             raise ExecutionTimeout(
                 f"Tool execution timeout after {timeout}s"
             )
 
+    @staticmethod
+    def _is_mutation(tool: Tool) -> bool:
+        """
+        Check if a tool may modify state (for the writes_only audit level)
+
+        Args:
+            tool: Tool to check
+
+        Returns:
+            bool: tool.is_mutation if set, else whether any permission
+                goes beyond file reads
+        """
+        is_mutation = getattr(tool, "is_mutation", None)
+        if is_mutation is not None:
+            return is_mutation
+        return any(p.type not in _READ_ONLY_PERMISSIONS for p in tool.permissions)
+
     def _log_execution(
         self,
-        execution_id: str,
+        execution_id: Union[int, str],
         client_id: str,
         tool_name: str,
         status: str,
@@ -418,12 +864,14 @@ class ExecutionManager:
         params: Dict[str, Any],
         result: Any = None,
         error: Optional[str] = None,
+        mutation: bool = True,
     ) -> None:
         """
         Log tool execution for audit trail
 
         Args:
-            execution_id: Unique execution ID
+            execution_id: Unique execution ID (int: counter value, expanded
+                to "<client_id>:<tool_name>:<n>" at flush)
             client_id: Client identifier
             tool_name: Name of executed tool
             status: Execution status (success/error/timeout/etc)
@@ -431,34 +879,128 @@ class ExecutionManager:
             params: Input parameters
             result: Execution result (if success)
             error: Error message (if failed)
+            mutation: Whether the tool may modify state (writes_only level)
         """
+        execution_time_ms = int(execution_time * 1000)
+        success = status == "success"
+        self._total += 1
+        self._success += success
+        self._time_ms_sum += execution_time_ms
+
+        # Filtered successes are counted in stats but get no entry
+        if success and self.audit_level != AuditLevel.ALL:
+            if self.audit_level == AuditLevel.FAILURES_ONLY or not mutation:
+                return
+
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "ts_ns": time.time_ns(),  # ISO "timestamp" set at flush
             "execution_id": execution_id,
             "event_type": "tool_executed",
             "client_id": client_id,
             "tool_name": tool_name,
             "status": status,
-            "execution_time_ms": int(execution_time * 1000),
-            "params": params,
+            "execution_time_ms": execution_time_ms,
+            "params": _safe_truncate(params),
         }
 
         if result is not None:
-            log_entry["result"] = str(result)[:500]  # Truncate for logging
+            log_entry["result"] = _safe_truncate(result)
 
         if error is not None:
             log_entry["error"] = str(error)
 
-        self._execution_log.append(log_entry)
+        self._log_buffer.append(log_entry)
+        if len(self._log_buffer) >= self.log_buffer_max:
+            self.flush()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: entries wait for the next flush/read
+        if self._flush_handle is not None:
+            if self._flush_loop is loop:
+                return
+            # Timer left on a loop that has ended (e.g. a finished
+            # asyncio.run): it will never fire, schedule on this one
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(self.log_flush_interval, self.flush)
+        self._flush_loop = loop
+
+    def flush(self) -> int:
+        """
+        Move buffered audit entries into the execution log in one batch
+
+        Returns:
+            int: Number of entries flushed
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+
+        batch = self._log_buffer
+        if not batch:
+            return 0
+        self._log_buffer = []
+        fromtimestamp = datetime.fromtimestamp
+        for entry in batch:
+            entry["timestamp"] = fromtimestamp(
+                entry.pop("ts_ns") / 1e9, tz=timezone.utc
+            ).isoformat()
+            execution_id = entry["execution_id"]
+            if isinstance(execution_id, int):
+                entry["execution_id"] = (
+                    f"{entry['client_id']}:{entry['tool_name']}:{execution_id}"
+                )
+        self._execution_log.extend(batch)
+
+        if self.audit_sink is not None:
+            if self.audit_sink_thread:
+                if self._sink_writer is None:
+                    # One worker: batches reach the sink in flush order
+                    self._sink_writer = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="audit-sink"
+                    )
+                self._sink_writer.submit(self._write_batch, batch)
+            else:
+                self._write_batch(batch)
+        return len(batch)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Persist one flushed batch to the audit sink (errors are logged)"""
+        try:
+            self.audit_sink.append_batch(batch, sync=self.audit_fsync)
+        except Exception as e:
+            self.logger.error(
+                "Failed to persist %d audit entries: %s", len(batch), e
+            )
+
+    def close(self) -> None:
+        """
+        Flush buffered audit entries and wait for pending sink writes
+
+        Call at shutdown. The manager stays usable; a later flush starts
+        a new writer thread if needed.
+        """
+        self.flush()  # Also cancels and clears any pending flush timer
+        writer, self._sink_writer = self._sink_writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
 
-    def get_execution_log(self) -> list:
+    def get_execution_log(self, snapshot: bool = False) -> Sequence[Dict[str, Any]]:
         """
         Get execution audit log
 
+        Args:
+            snapshot: Return a list copy instead of a live view
+
         Returns:
-            list: Execution log entries
+            Sequence: Read-only view of the log entries (list if snapshot)
         """
-        return list(self._execution_log)
+        self.flush()
+        if snapshot:
+            return list(self._execution_log)
+        return _ReadOnlyLogView(self._execution_log)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -467,7 +1009,7 @@ class ExecutionManager:
         Returns:
             dict: Execution statistics
         """
-        total = len(self._execution_log)
+        total = self._total
         if total == 0:
             return {
                 "total_executions": 0,
@@ -476,15 +1018,15 @@ class ExecutionManager:
                 "avg_execution_time_ms": 0,
             }
 
-        success = sum(1 for e in self._execution_log if e["status"] == "success")
+        success = self._success
         errors = total - success
-        avg_time = sum(e["execution_time_ms"] for e in self._execution_log) / total
+        avg_time = self._time_ms_sum / total
 
         return {
             "total_executions": total,
             "success_count": success,
             "error_count": errors,
-            "success_rate": success / total if total > 0 else 0,
+            "success_rate": success / total,
             "avg_execution_time_ms": avg_time,
         }
 
@@ -495,6 +1037,7 @@ class ExecutionManager:
 
 if __name__ == "__main__":
     import unittest
+    import unittest.mock
     from unittest.mock import AsyncMock, MagicMock
     from ..tools.tool import FunctionTool, InputSchema, OutputSchema
     from ..security.permission import Permission, PermissionType, DEFAULT_PERMISSIONS
@@ -526,69 +1069,247 @@ if __name__ == "__main__":
             sandbox2 = self.manager.get_sandbox("client1")
             self.assertIs(sandbox1, sandbox2)
 
+        def test_sandbox_reserve(self):
+            """Test new clients take prewarmed sandboxes, refilled on the loop"""
+            manager = ExecutionManager(self.permission_manager, sandbox_reserve_size=2)
+
+            async def run_test():
+                manager.get_sandbox("client1")
+                self.assertEqual(len(manager._sandbox_reserve), 0)
+                await asyncio.sleep(0)
+                self.assertEqual(len(manager._sandbox_reserve), 2)
+
+                reserved = manager._sandbox_reserve[0]
+                sandbox = manager.get_sandbox("client2")
+                self.assertIs(sandbox, reserved)
+                self.assertEqual(sandbox.client_id, "client2")
+
+            asyncio.run(run_test())
+            for client_id in ("client1", "client2"):
+                manager.clear_sandbox(client_id)
+
         def test_clear_sandbox(self):
             """Test sandbox cleanup"""
             self.manager.get_sandbox("client1")
             self.manager.clear_sandbox("client1")
             self.assertNotIn("client1", self.manager._sandboxes)
 
+        def _validators_under_test(self, schema):
+            """Compiled validator(s) for a schema: fastjsonschema and basic"""
+            validators = [ExecutionManager._compile_basic_validator(schema)]
+            if HAS_FASTJSONSCHEMA:
+                validators.append(self.manager._compile_validator(schema))
+            return validators
+
         def test_validate_params_success(self):
             """Test parameter validation success"""
-
-            async def run_test():
-                schema = {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "age": {"type": "integer"},
-                    },
-                    "required": ["name"],
-                }
-                params = {"name": "test", "age": 42}
-                await self.manager._validate_params(params, schema)
-
-            asyncio.run(run_test())
+            schema = {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "age": {"type": "integer"},
+                },
+                "required": ["name"],
+            }
+            for validator in self._validators_under_test(schema):
+                validator({"name": "test", "age": 42})
 
         def test_validate_params_missing_required(self):
             """Test parameter validation with missing required field"""
-
-            async def run_test():
-                schema = {
-                    "type": "object",
-                    "properties": {"name": {"type": "string"}},
-                    "required": ["name"],
-                }
-                params = {}
+            schema = {
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+                "required": ["name"],
+            }
+            for validator in self._validators_under_test(schema):
                 with self.assertRaises(ValidationError):
-                    await self.manager._validate_params(params, schema)
-
-            asyncio.run(run_test())
+                    validator({})
 
         def test_validate_params_type_mismatch(self):
             """Test parameter validation with type mismatch"""
+            schema = {
+                "type": "object",
+                "properties": {"age": {"type": "integer"}},
+            }
+            for validator in self._validators_under_test(schema):
+                with self.assertRaises(ValidationError):
+                    validator({"age": "not_an_int"})
+
+        def test_validators_agree(self):
+            """Test basic validation matches fastjsonschema results and messages"""
+            schema = {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "age": {"type": "integer"},
+                    "ratio": {"type": "number"},
+                    "tags": {"type": "array"},
+                },
+                "required": ["name", "age"],
+            }
+            cases = {
+                "ok": ({"name": "a", "age": 3, "ratio": 0.5, "tags": []}, None),
+                "integral float": ({"name": "a", "age": 3.0}, None),
+                "int as number": ({"name": "a", "age": 1, "ratio": 2}, None),
+                "missing": ({"age": 3}, "data must contain ['name'] properties"),
+                "all missing": ({}, "data must contain ['age', 'name'] properties"),
+                "bool integer": ({"name": "a", "age": True}, "data.age must be integer"),
+                "bool number": ({"name": "a", "age": 1, "ratio": False}, "data.ratio must be number"),
+                "fraction": ({"name": "a", "age": 3.5}, "data.age must be integer"),
+                "wrong type": ({"name": 1, "age": 3}, "data.name must be string"),
+                "not object": (["name"], "data must be object"),
+            }
+            for validator in self._validators_under_test(schema):
+                for case, (params, error) in cases.items():
+                    if error is None:
+                        validator(params)
+                        continue
+                    with self.assertRaises(ValidationError, msg=case) as ctx:
+                        validator(params)
+                    self.assertEqual(str(ctx.exception), f"Invalid parameters: {error}", case)
+                    self.assertEqual(ctx.exception.schema_errors, [error], case)
+
+        def test_validator_compiled_once_per_tool(self):
+            """Test execute_tool reuses the tool's compiled validator"""
 
             async def run_test():
-                schema = {
-                    "type": "object",
-                    "properties": {"age": {"type": "integer"}},
-                }
-                params = {"age": "not_an_int"}
+                async def my_tool(ctx, params):
+                    return "ok"
+
+                tool = FunctionTool(
+                    name="test",
+                    description="Test tool",
+                    func=my_tool,
+                    input_schema={"count": {"type": "integer"}},
+                    permissions=[],
+                )
+                tool.input_schema.required = ["count"]
+                self.permission_manager.initialize_client(self.client.client_id, [])
+
+                await self.manager.execute_tool(tool, self.client, {"count": 1})
+                validator = self.manager._validators[tool]
+                with self.assertRaises(ValidationError):
+                    await self.manager.execute_tool(tool, self.client, {"count": "x"})
                 with self.assertRaises(ValidationError):
-                    await self.manager._validate_params(params, schema)
+                    await self.manager.execute_tool(tool, self.client, {})
+                self.assertIs(self.manager._validators[tool], validator)
+
+                # The schema dict is only built when the validator is compiled
+                with unittest.mock.patch.object(
+                    tool.input_schema, "to_dict", side_effect=AssertionError
+                ):
+                    await self.manager.execute_tool(tool, self.client, {"count": 2})
 
             asyncio.run(run_test())
 
-        def test_check_type(self):
-            """Test type checking"""
-            self.assertTrue(self.manager._check_type("hello", "string"))
-            self.assertTrue(self.manager._check_type(42, "integer"))
-            self.assertTrue(self.manager._check_type(3.14, "number"))
-            self.assertTrue(self.manager._check_type(True, "boolean"))
-            self.assertTrue(self.manager._check_type([], "array"))
-            self.assertTrue(self.manager._check_type({}, "object"))
+        def test_tool_executor_cached(self):
+            """Test each tool gets one executor until it is forgotten"""
+            async def run_test():
+                async def my_tool(ctx, params):
+                    await asyncio.sleep(0.05)
+                    return "ok"
+
+                tool = FunctionTool(
+                    name="test",
+                    description="Test tool",
+                    func=my_tool,
+                    input_schema={},
+                    permissions=[],
+                )
+                self.permission_manager.initialize_client(self.client.client_id, [])
+
+                await self.manager.execute_tool(tool, self.client, {})
+                executor = self.manager._executors[tool]
+                self.assertFalse(executor.mutation)
+                await self.manager.execute_tool(tool, self.client, {})
+                self.assertIs(self.manager._executors[tool], executor)
+
+                # A changed timeout is only seen after forget_tool
+                tool.timeout = 0.01
+                await self.manager.execute_tool(tool, self.client, {})
+                self.manager.forget_tool(tool)
+                self.assertNotIn(tool, self.manager._executors)
+                self.assertNotIn(tool, self.manager._validators)
+                with self.assertRaises(ExecutionTimeout):
+                    await self.manager.execute_tool(tool, self.client, {})
 
-            self.assertFalse(self.manager._check_type(42, "string"))
-            self.assertFalse(self.manager._check_type("text", "integer"))
+            asyncio.run(run_test())
+
+        def test_tool_cache_entries_dropped_with_tool(self):
+            """Test cached executors and validators do not keep tools alive"""
+            import gc
+            self.permission_manager.initialize_client(self.client.client_id, [])
+            tool = FunctionTool(
+                name="t", description="", func=AsyncMock(return_value="ok"),
+                input_schema={"n": {"type": "integer"}}, permissions=[],
+            )
+            asyncio.run(self.manager.execute_tool(tool, self.client, {"n": 1}))
+            self.assertEqual(len(self.manager._executors), 1)
+
+            # audit_level is read per call, not frozen into the executor
+            self.manager.audit_level = AuditLevel.FAILURES_ONLY
+            asyncio.run(self.manager.execute_tool(tool, self.client, {"n": 2}))
+            self.assertEqual(len(self.manager.get_execution_log()), 1)
+
+            ref = weakref.ref(tool)
+            del tool
+            gc.collect()
+            self.assertIsNone(ref())
+            self.assertEqual(len(self.manager._executors), 0)
+            self.assertEqual(len(self.manager._validators), 0)
+
+        def test_noop_schema(self):
+            """Test constraint-free schemas only check for an object"""
+            self.assertTrue(ExecutionManager._is_noop_schema(
+                {"type": "object", "properties": {"note": {"description": "x"}}}
+            ))
+            self.assertFalse(ExecutionManager._is_noop_schema(
+                {"type": "object", "properties": {"n": {"type": "integer"}}}
+            ))
+            self.assertFalse(ExecutionManager._is_noop_schema(
+                {"type": "object", "properties": {}, "required": ["n"]}
+            ))
+            self.assertFalse(ExecutionManager._is_noop_schema(
+                {"type": "object", "properties": {}, "additionalProperties": False}
+            ))
+
+            validator = self.manager._compile_validator({"type": "object", "properties": {}})
+            self.assertIs(validator, _validate_any_object)
+            validator({"anything": 1})
+            with self.assertRaises(ValidationError):
+                validator(["not", "an", "object"])
+
+        def test_basic_validation_fallback(self):
+            """Test basic validation still enforces required fields and types"""
+            schema = {
+                "type": "object",
+                "properties": {"age": {"type": "integer"}},
+                "required": ["age"],
+            }
+            # Compiled by _compile_validator when fastjsonschema is missing
+            with unittest.mock.patch(f"{__name__}.HAS_FASTJSONSCHEMA", False):
+                validator = self.manager._compile_validator(schema)
+            validator({"age": 3})
+            with self.assertRaises(ValidationError):
+                validator({})
+            with self.assertRaises(ValidationError):
+                validator({"age": "3"})
+
+            checks = ExecutionManager._compile_type_checks({
+                "properties": {"a": {"type": "string"}, "b": {"type": "any"}},
+                "required": ["c"],
+            })
+            self.assertEqual(checks, [("c", True, None, None), ("a", False, str, "string")])
+
+        def test_exceptions_slotted(self):
+            """Test exception attributes live in slots, not an instance dict"""
+            for error in (
+                ExecutionError("boom", details={"k": 1}),
+                ExecutionTimeout("slow"),
+                ValidationError("bad", ["x"]),
+            ):
+                self.assertEqual(error.__dict__, {})
+            self.assertEqual(ExecutionTimeout("slow").error_type, "timeout")
 
         def test_execution_logging(self):
             """Test execution logging"""
@@ -604,9 +1325,116 @@ if __name__ == "__main__":
 
             log = self.manager.get_execution_log()
             self.assertEqual(len(log), 1)
+            self.assertEqual(log[0]["params"], "{'arg': 'value'}")
+            self.assertNotIn("ts_ns", log[0])
+            self.assertIsNotNone(datetime.fromisoformat(log[0]["timestamp"]).tzinfo)
             self.assertEqual(log[0]["tool_name"], "test_tool")
             self.assertEqual(log[0]["status"], "success")
 
+        def test_log_buffer_flush(self):
+            """Test audit entries are batched by a timer or a full buffer"""
+            manager = ExecutionManager(
+                self.permission_manager, log_flush_interval=0.01, log_buffer_max=3
+            )
+
+            async def run_test():
+                manager._log_execution("e1", "c1", "tool1", "success", 0.1, {})
+                self.assertEqual(len(manager._execution_log), 0)
+                self.assertIsNotNone(manager._flush_handle)
+                await asyncio.sleep(0.05)
+                self.assertEqual(len(manager._execution_log), 1)
+                self.assertIsNone(manager._flush_handle)
+
+                for i in range(3):
+                    manager._log_execution(f"e{i}", "c1", "tool1", "success", 0.1, {})
+                self.assertEqual(len(manager._execution_log), 4)
+                self.assertEqual(manager._log_buffer, [])
+
+            asyncio.run(run_test())
+
+        def test_log_flush_rescheduled_after_loop_ends(self):
+            """Test a timer left on a finished loop does not block flushing"""
+            sink = MagicMock()
+            manager = ExecutionManager(
+                self.permission_manager, log_flush_interval=60, audit_sink=sink
+            )
+
+            async def first_loop():
+                manager._log_execution("e1", "c1", "tool", "success", 0.1, {})
+
+            asyncio.run(first_loop())
+            self.assertIsNotNone(manager._flush_handle)
+
+            async def second_loop():
+                manager.log_flush_interval = 0.01
+                manager._log_execution("e2", "c1", "tool", "success", 0.1, {})
+                await asyncio.sleep(0.05)
+
+            asyncio.run(second_loop())
+            self.assertEqual(manager._log_buffer, [])
+            batch = sink.append_batch.call_args[0][0]
+            self.assertEqual([e["execution_id"] for e in batch], ["e1", "e2"])
+
+            manager._log_execution("e3", "c1", "tool", "success", 0.1, {})
+            manager.close()
+            self.assertIsNone(manager._flush_handle)
+            self.assertIsNone(manager._flush_loop)
+
+        def test_execution_log_bounded_repr(self):
+            """Test large params/results are stored as bounded strings"""
+            params = {"data": list(range(10000)), "text": "x" * 10000}
+            self.manager._log_execution(
+                "e1", "c1", "tool", "success", 0.1, params,
+                result={"rows": [[i] * 100 for i in range(1000)]},
+            )
+            entry = self.manager.get_execution_log()[0]
+            self.assertIsInstance(entry["params"], str)
+            self.assertLessEqual(len(entry["params"]), 500)
+            self.assertLessEqual(len(entry["result"]), 500)
+
+            self.assertEqual(_safe_truncate("abcdef", 3), "abc")
+            self.assertEqual(_safe_truncate({"a": 1}), "{'a': 1}")
+
+        def test_audit_sink_batches(self):
+            """Test each flush persists its batch with one sink call"""
+            sink = MagicMock()
+            manager = ExecutionManager(
+                self.permission_manager, audit_sink=sink, audit_fsync=True
+            )
+            for i in range(3):
+                manager._log_execution(f"e{i}", "c1", "tool", "success", 0.1, {})
+            sink.append_batch.assert_not_called()
+
+            self.assertEqual(manager.flush(), 3)
+            sink.append_batch.assert_called_once()
+            batch = sink.append_batch.call_args[0][0]
+            self.assertEqual([e["execution_id"] for e in batch], ["e0", "e1", "e2"])
+            self.assertEqual(sink.append_batch.call_args[1], {"sync": True})
+
+            sink.append_batch.side_effect = OSError("disk full")
+            manager._log_execution("e3", "c1", "tool", "success", 0.1, {})
+            manager.flush()  # logged, not raised
+            self.assertEqual(len(manager.get_execution_log()), 4)
+
+        def test_audit_sink_thread(self):
+            """Test writer-thread sink keeps batch order and drains on close"""
+            written = []
+            sink = MagicMock()
+            sink.append_batch.side_effect = lambda batch, sync: written.append(
+                [e["execution_id"] for e in batch]
+            )
+            manager = ExecutionManager(
+                self.permission_manager, audit_sink=sink, audit_sink_thread=True
+            )
+            for i in range(3):
+                manager._log_execution(f"e{i}", "c1", "tool", "success", 0.1, {})
+                manager.flush()
+            manager._log_execution("e3", "c1", "tool", "success", 0.1, {})
+
+            manager.close()
+            self.assertEqual(written, [["e0"], ["e1"], ["e2"], ["e3"]])
+            self.assertIsNone(manager._sink_writer)
+
         def test_get_stats(self):
             """Test statistics generation"""
             # Add some executions
@@ -625,6 +1453,63 @@ if __name__ == "__main__":
             self.assertEqual(stats["success_count"], 2)
             self.assertEqual(stats["error_count"], 1)
             self.assertAlmostEqual(stats["success_rate"], 2 / 3)
+            self.assertEqual(stats["avg_execution_time_ms"], 200)
+
+        def test_audit_level(self):
+            """Test audit levels skip successful reads / successes"""
+            read_tool = FunctionTool(
+                name="reader", description="Reads", func=AsyncMock(),
+                permissions=[Permission(PermissionType.FILE_READ)],
+            )
+            write_tool = FunctionTool(
+                name="writer", description="Writes", func=AsyncMock(),
+                permissions=[Permission(PermissionType.FILE_WRITE)],
+            )
+            self.assertFalse(ExecutionManager._is_mutation(read_tool))
+            self.assertTrue(ExecutionManager._is_mutation(write_tool))
+            read_tool.is_mutation = True
+            self.assertTrue(ExecutionManager._is_mutation(read_tool))
+
+            manager = ExecutionManager(self.permission_manager, audit_level="writes_only")
+            manager._log_execution("e1", "c1", "reader", "success", 0.1, {}, mutation=False)
+            manager._log_execution("e2", "c1", "writer", "success", 0.1, {}, mutation=True)
+            manager._log_execution("e3", "c1", "reader", "error", 0.1, {}, mutation=False)
+            self.assertEqual(
+                [e["execution_id"] for e in manager.get_execution_log()], ["e2", "e3"]
+            )
+
+            manager = ExecutionManager(self.permission_manager, audit_level=AuditLevel.FAILURES_ONLY)
+            manager._log_execution("e1", "c1", "writer", "success", 0.1, {})
+            manager._log_execution("e2", "c1", "writer", "timeout", 0.1, {})
+            self.assertEqual(len(manager.get_execution_log()), 1)
+            self.assertEqual(manager.get_stats()["total_executions"], 2)
+
+        def test_execution_log_retention(self):
+            """Test log keeps the newest entries, stats count all executions"""
+            manager = ExecutionManager(self.permission_manager, audit_retention=2)
+            for i in range(5):
+                manager._log_execution(f"e{i}", "c1", "tool", "success", 0.1, {})
+
+            log = manager.get_execution_log()
+            self.assertEqual([e["execution_id"] for e in log], ["e3", "e4"])
+            self.assertEqual(manager.get_stats()["total_executions"], 5)
+
+        def test_execution_log_view(self):
+            """Test log is a live read-only view unless a snapshot is asked"""
+            manager = ExecutionManager(self.permission_manager)
+            manager._log_execution("e1", "c1", "tool", "success", 0.1, {})
+            view = manager.get_execution_log()
+            snapshot = manager.get_execution_log(snapshot=True)
+
+            manager._log_execution("e2", "c1", "tool", "success", 0.1, {})
+            manager.flush()
+            self.assertEqual([e["execution_id"] for e in view], ["e1", "e2"])
+            self.assertEqual(view[-1]["execution_id"], "e2")
+            self.assertEqual(len(view[:1]), 1)
+            self.assertEqual(len(snapshot), 1)
+            self.assertIsInstance(snapshot, list)
+            with self.assertRaises(TypeError):
+                view[0] = {}
 
         def test_execute_tool_success(self):
             """Test successful tool execution"""
@@ -651,6 +1536,11 @@ if __name__ == "__main__":
                 self.assertIn("content", result)
                 self.assertFalse(result["isError"])
 
+                await self.manager.execute_tool(tool, self.client, {"arg": "again"})
+                ids = [e["execution_id"] for e in self.manager.get_execution_log()]
+                prefix = f"{self.client.client_id}:test:"
+                self.assertEqual(ids, [prefix + "0", prefix + "1"])
+
             asyncio.run(run_test())
 
         def test_execute_tool_permission_denied(self):
@@ -678,6 +1568,95 @@ if __name__ == "__main__":
 
             asyncio.run(run_test())
 
+        def test_execute_tool_error_traceback_debug_only(self):
+            """Test the traceback is only captured with DEBUG logging"""
+
+            async def run_test():
+                async def failing_tool(ctx, params):
+                    raise RuntimeError("boom")
+
+                tool = FunctionTool(
+                    name="failing",
+                    description="Failing tool",
+                    func=failing_tool,
+                    permissions=[],
+                )
+                self.permission_manager.initialize_client(self.client.client_id, [])
+
+                with self.assertRaises(ExecutionError) as ctx:
+                    await self.manager.execute_tool(tool, self.client, {})
+                self.assertEqual(ctx.exception.details, {})
+
+                self.manager.logger.setLevel(logging.DEBUG)
+                try:
+                    with self.assertRaises(ExecutionError) as ctx:
+                        await self.manager.execute_tool(tool, self.client, {})
+                finally:
+                    self.manager.logger.setLevel(logging.NOTSET)
+                self.assertIn("RuntimeError", ctx.exception.details["traceback"])
+
+            asyncio.run(run_test())
+
+        def test_permission_cache(self):
+            """Test grants are cached until the client's permissions change"""
+            tool = FunctionTool(
+                name="writer", description="Writes", func=AsyncMock(),
+                permissions=[Permission(PermissionType.FILE_WRITE, "/tmp/*")],
+            )
+            self.permission_manager.initialize_client(
+                self.client.client_id, [Permission(PermissionType.FILE_WRITE, "/tmp/*")]
+            )
+
+            with unittest.mock.patch.object(
+                self.permission_manager, "check_permission",
+                wraps=self.permission_manager.check_permission,
+            ) as check:
+                self.manager._check_permissions(self.client, tool)
+                self.manager._check_permissions(self.client, tool)
+                self.assertEqual(check.call_count, 1)
+
+            self.permission_manager.revoke_permission(
+                self.client.client_id, PermissionType.FILE_WRITE
+            )
+            with self.assertRaises(PermissionDeniedError):
+                self.manager._check_permissions(self.client, tool)
+            with self.assertRaises(PermissionDeniedError):
+                self.manager._check_permissions(self.client, tool)
+
+        def test_permission_cache_bounded(self):
+            """Test least recently used grants are evicted past perm_cache_size"""
+            manager = ExecutionManager(self.permission_manager, perm_cache_size=2)
+            tools = [
+                FunctionTool(name=f"t{i}", description="", func=AsyncMock(), permissions=[])
+                for i in range(3)
+            ]
+            for tool in tools:
+                manager._check_permissions(self.client, tool)
+            self.assertEqual(
+                [key[1] for key in manager._perm_cache], ["t1", "t2"]
+            )
+
+        def test_permission_cache_keeps_no_tool_alive(self):
+            """Test cached grants do not reference tools, and match permissions"""
+            import gc
+            self.permission_manager.initialize_client(
+                self.client.client_id, [Permission(PermissionType.FILE_WRITE, "/tmp/*")]
+            )
+            tool = FunctionTool(name="t", description="", func=AsyncMock(), permissions=[])
+            self.manager._check_permissions(self.client, tool)
+            ref = weakref.ref(tool)
+            del tool
+            gc.collect()
+            self.assertIsNone(ref())
+
+            # Same name, stricter permissions: checked again, not served from cache
+            tool = FunctionTool(
+                name="t", description="", func=AsyncMock(),
+                permissions=[Permission(PermissionType.FILE_DELETE, "/tmp/*")],
+            )
+            with self.assertRaises(PermissionDeniedError):
+                self.manager._check_permissions(self.client, tool)
+
         def test_execute_tool_timeout(self):
             """Test tool execution timeout"""
 
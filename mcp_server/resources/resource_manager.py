@@ -15,11 +15,20 @@ CHANGELOG:
   - Support QUOTA_OVERRIDE permission
   - Audit trail for quota violations
 
+[2026-10-15 v0.1.1-alpha] Hot path optimizations
+  - Per-client quotas/usage/violations in defaultdicts (one lookup)
+  - Slotted quota/usage/requirement dataclasses; check_availability reads
+    each field once and only builds reason strings on denial
+  - QUOTA_OVERRIDE holders tracked in a set kept current by PermissionManager
+    change listeners (optional permission_manager argument)
+  - Lazy %-style logging (no formatting when the level is disabled)
+
 ARCHITECTURE:
 ResourceManager enforces resource quotas per client.
 - Default quotas: CPU 50%, RAM 512MB, Disk 1GB
 - Before execution: verify available resources
-- If QUOTA_OVERRIDE permission: ignore quotas
+- If QUOTA_OVERRIDE permission: ignore quotas (has_quota_override, or
+  tracked from the PermissionManager given at construction)
 - If insufficient: PermissionDeniedError
 - Track usage per client for monitoring
 
@@ -31,14 +40,18 @@ SECURITY NOTES:
 """
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set, Tuple
+
+from ..security.permission import Permission, PermissionType
+from ..security.permission_manager import PermissionManager
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientQuotas:
     """Resource quotas for a client"""
     cpu_percent: float = 50.0          # Max CPU usage (%)
@@ -47,7 +60,7 @@ class ClientQuotas:
     concurrent_processes: int = 5      # Max concurrent subprocesses
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceUsage:
     """Current resource usage for a client"""
     cpu_percent: float = 0.0
@@ -56,7 +69,7 @@ class ResourceUsage:
     concurrent_processes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRequirement:
     """Resource requirement for a subprocess"""
     memory_mb: int = 128               # Estimated memory needed (MB)
@@ -74,13 +87,35 @@ class ResourceManager:
     - Audit trail for violations
     """
 
-    def __init__(self):
-        """Initialize ResourceManager"""
-        self.client_quotas: Dict[str, ClientQuotas] = {}
-        self.client_usage: Dict[str, ResourceUsage] = {}
-        self.quota_violations: Dict[str, int] = {}  # Count of violations per client
+    def __init__(self, permission_manager: Optional[PermissionManager] = None):
+        """
+        Initialize ResourceManager
+
+        Args:
+            permission_manager: If given, clients holding QUOTA_OVERRIDE are
+                tracked from its permission changes
+        """
+        # Entries with default values are created on first access
+        self.client_quotas: Dict[str, ClientQuotas] = defaultdict(ClientQuotas)
+        self.client_usage: Dict[str, ResourceUsage] = defaultdict(ResourceUsage)
+        self.quota_violations: Dict[str, int] = defaultdict(int)  # Count of violations per client
         self.logger = logging.getLogger("resources.resource_manager")
 
+        # Clients holding QUOTA_OVERRIDE (refreshed on permission changes)
+        self.permission_manager = permission_manager
+        self._override_clients: Set[str] = set()
+        if permission_manager is not None:
+            permission_manager.add_change_listener(self._refresh_override)
+
+    def _refresh_override(self, client_id: str) -> None:
+        """Re-check a client's QUOTA_OVERRIDE after a permission change"""
+        if self.permission_manager.has_permission(
+            client_id, Permission(PermissionType.QUOTA_OVERRIDE)
+        ):
+            self._override_clients.add(client_id)
+        else:
+            self._override_clients.discard(client_id)
+
     def get_client_quotas(self, client_id: str) -> ClientQuotas:
         """
         Get resource quotas for a client.
@@ -91,11 +126,6 @@ class ResourceManager:
         Returns:
             ClientQuotas: Quotas for the client (defaults if not set)
         """
-        if client_id not in self.client_quotas:
-            # Create default quotas
-            self.client_quotas[client_id] = ClientQuotas()
-            self.logger.debug(f"Created default quotas for {client_id}")
-
         return self.client_quotas[client_id]
 
     def set_client_quotas(
@@ -112,8 +142,8 @@ class ResourceManager:
         """
         self.client_quotas[client_id] = quotas
         self.logger.info(
-            f"Set quotas for {client_id}: CPU {quotas.cpu_percent}%, "
-            f"RAM {quotas.memory_mb}MB, Disk {quotas.disk_gb}GB"
+            "Set quotas for %s: CPU %s%%, RAM %sMB, Disk %sGB",
+            client_id, quotas.cpu_percent, quotas.memory_mb, quotas.disk_gb,
         )
 
     def get_client_usage(self, client_id: str) -> ResourceUsage:
@@ -126,9 +156,6 @@ class ResourceManager:
         Returns:
             ResourceUsage: Current usage metrics
         """
-        if client_id not in self.client_usage:
-            self.client_usage[client_id] = ResourceUsage()
-
         return self.client_usage[client_id]
 
     def check_availability(
@@ -144,6 +171,7 @@ class ResourceManager:
             client_id: Client requesting resources
             required: ResourceRequirement with needed resources
             has_quota_override: Whether client has QUOTA_OVERRIDE permission
+                (clients tracked from the permission manager need not pass it)
 
         Returns:
             Tuple[bool, Optional[str]]: (allowed, reason_if_denied)
@@ -155,42 +183,43 @@ class ResourceManager:
         - Return (True, None) if available, (False, reason) if not
         """
         # If QUOTA_OVERRIDE permission: ignore quotas
-        if has_quota_override:
-            self.logger.debug(
-                f"Resource check skipped for {client_id} (QUOTA_OVERRIDE)"
-            )
+        if has_quota_override or client_id in self._override_clients:
             return True, None
 
         # Get quotas and current usage
-        quotas = self.get_client_quotas(client_id)
-        usage = self.get_client_usage(client_id)
+        quotas = self.client_quotas[client_id]
+        usage = self.client_usage[client_id]
+        used_mb = usage.memory_mb
+        required_mb = required.memory_mb
+        quota_mb = quotas.memory_mb
+        running = usage.concurrent_processes
+        max_running = quotas.concurrent_processes
+
+        # Happy path: two integer comparisons
+        if used_mb + required_mb <= quota_mb and running < max_running:
+            return True, None
 
         # Check memory
-        if (usage.memory_mb + required.memory_mb) > quotas.memory_mb:
+        if used_mb + required_mb > quota_mb:
             reason = (
                 f"Insufficient memory: "
-                f"current {usage.memory_mb}MB + "
-                f"required {required.memory_mb}MB > "
-                f"quota {quotas.memory_mb}MB"
+                f"current {used_mb}MB + "
+                f"required {required_mb}MB > "
+                f"quota {quota_mb}MB"
             )
-            self.logger.warning(f"Resource denied for {client_id}: {reason}")
+            self.logger.warning("Resource denied for %s: %s", client_id, reason)
             self._record_quota_violation(client_id)
             return False, reason
 
         # Check concurrent processes
-        if usage.concurrent_processes >= quotas.concurrent_processes:
-            reason = (
-                f"Too many concurrent processes: "
-                f"{usage.concurrent_processes} >= "
-                f"quota {quotas.concurrent_processes}"
-            )
-            self.logger.warning(f"Resource denied for {client_id}: {reason}")
-            self._record_quota_violation(client_id)
-            return False, reason
-
-        # All checks passed
-        self.logger.debug(f"Resource check passed for {client_id}")
-        return True, None
+        reason = (
+            f"Too many concurrent processes: "
+            f"{running} >= "
+            f"quota {max_running}"
+        )
+        self.logger.warning("Resource denied for %s: %s", client_id, reason)
+        self._record_quota_violation(client_id)
+        return False, reason
 
     def allocate(
         self,
@@ -211,8 +240,8 @@ class ResourceManager:
         usage.concurrent_processes += 1
 
         self.logger.debug(
-            f"Allocated resources for {client_id} (PID {pid}): "
-            f"memory {required.memory_mb}MB"
+            "Allocated resources for %s (PID %s): memory %sMB",
+            client_id, pid, required.memory_mb,
         )
 
     def release(
@@ -239,9 +268,7 @@ class ResourceManager:
         if used and used.memory_mb > 0:
             usage.memory_mb = max(0, usage.memory_mb - used.memory_mb)
 
-        self.logger.debug(
-            f"Released resources for {client_id} (PID {pid})"
-        )
+        self.logger.debug("Released resources for %s (PID %s)", client_id, pid)
 
     def get_quota_violations(self, client_id: str) -> int:
         """Get count of quota violations for a client"""
@@ -249,13 +276,13 @@ class ResourceManager:
 
     def get_all_violations(self) -> Dict[str, int]:
         """Get all quota violations"""
-        return self.quota_violations.copy()
+        return dict(self.quota_violations)
 
     def _record_quota_violation(self, client_id: str) -> None:
         """Record a quota violation"""
-        self.quota_violations[client_id] = self.quota_violations.get(client_id, 0) + 1
+        self.quota_violations[client_id] += 1
         self.logger.warning(
-            f"Quota violation #{self.quota_violations[client_id]} for {client_id}"
+            "Quota violation #%d for %s", self.quota_violations[client_id], client_id
         )
 
 
@@ -278,6 +305,11 @@ if __name__ == "__main__":
             manager = ResourceManager()
             self.assertEqual(len(manager.client_quotas), 0)
 
+        def test_dataclasses_slotted(self):
+            """Test quota records carry no per-instance __dict__"""
+            for record in (ClientQuotas(), ResourceUsage(), ResourceRequirement()):
+                self.assertFalse(hasattr(record, "__dict__"))
+
         def test_default_quotas(self):
             """Test default quotas"""
             quotas = self.manager.get_client_quotas("alice_123")
@@ -323,6 +355,23 @@ if __name__ == "__main__":
             self.assertTrue(allowed)
             self.assertIsNone(reason)
 
+        def test_quota_override_tracked_from_permissions(self):
+            """Test QUOTA_OVERRIDE grants/revocations reach check_availability"""
+            permission_manager = PermissionManager()
+            manager = ResourceManager(permission_manager)
+            required = ResourceRequirement(memory_mb=1000)
+
+            permission_manager.initialize_client("alice_123", [])
+            self.assertFalse(manager.check_availability("alice_123", required)[0])
+
+            permission_manager.grant_permission(
+                "alice_123", Permission(PermissionType.QUOTA_OVERRIDE)
+            )
+            self.assertEqual(manager.check_availability("alice_123", required), (True, None))
+
+            permission_manager.revoke_permission("alice_123", PermissionType.QUOTA_OVERRIDE)
+            self.assertFalse(manager.check_availability("alice_123", required)[0])
+
         def test_allocate_resources(self):
             """Test allocating resources"""
             required = ResourceRequirement(memory_mb=256)
@@ -350,6 +399,8 @@ if __name__ == "__main__":
 
             violations = self.manager.get_quota_violations("alice_123")
             self.assertEqual(violations, 2)
+            self.assertEqual(self.manager.get_quota_violations("bob_456"), 0)
+            self.assertEqual(self.manager.get_all_violations(), {"alice_123": 2})
 
         def test_concurrent_processes_limit(self):
             """Test concurrent process limit"""
@@ -14,6 +14,9 @@ CHANGELOG:
   - State isolation between clients
   - Execution count tracking
 
+[2026-10-15 v0.2.1-alpha] Sandbox prewarming
+  - rebind(): hand an unused, prewarmed context to a client
+
 ARCHITECTURE:
 SandboxContext provides isolated execution environment for each client:
   - Separate variable storage
@@ -81,6 +84,27 @@ class SandboxContext:
 
         self.logger.info(f"Sandbox context created for {client_id}")
 
+    def rebind(self, client_id: str) -> None:
+        """
+        Assign an unused context to a client
+
+        Lets ExecutionManager prewarm contexts (working directory already
+        created) before knowing which client will use them.
+
+        Args:
+            client_id: Client identifier
+
+        Raises:
+            ValueError: If the context was already used
+        """
+        if self._execution_count or self._variables:
+            raise ValueError("Cannot rebind a sandbox context that was used")
+
+        self.logger = logging.getLogger(f"sandbox.{client_id}")
+        self.client_id = client_id
+        self._created_at = self._last_activity = datetime.utcnow()
+        self.logger.debug(f"Sandbox context bound to {client_id}")
+
     def set_variable(self, name: str, value: Any) -> None:
         """
         Store a variable in context
@@ -332,6 +356,18 @@ if __name__ == "__main__":
             self.assertEqual(context1.get_variable("shared"), "value1")
             self.assertEqual(context2.get_variable("shared"), "value2")
 
+        def test_rebind(self):
+            """Test unused context can be rebound, used one cannot"""
+            context = SandboxContext("reserve")
+            context.rebind("client-2")
+            self.assertEqual(context.client_id, "client-2")
+            self.assertEqual(context.get_stats()["client_id"], "client-2")
+
+            context.increment_execution_count()
+            with self.assertRaises(ValueError):
+                context.rebind("client-3")
+            context.clear()
+
         def test_last_activity_updates(self):
             """Test that last_activity is updated"""
             initial_activity = self.context._last_activity
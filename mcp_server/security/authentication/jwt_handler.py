@@ -13,6 +13,10 @@ CHANGELOG:
   - Refresh token support
   - Custom error handling
 
+[2026-10-15 v0.3.1-alpha] Caller-chosen refresh JTI
+  - generate_tokens(refresh_jti=...) lets the token store record id be
+    the refresh token's jti claim (revocation by claim, across workers)
+
 ARCHITECTURE:
 JWTHandler provides:
   - Stateless authentication with JWT
@@ -126,6 +130,7 @@ class JWTHandler:
         client_id: str,
         username: str,
         roles: Optional[list] = None,
+        refresh_jti: Optional[str] = None,
     ) -> TokenPair:
         """
         Generate access and refresh token pair
@@ -134,6 +139,8 @@ class JWTHandler:
             client_id: Client identifier (UUID)
             username: Username for logging/auditing
             roles: User roles (for future RBAC)
+            refresh_jti: jti claim of the refresh token (e.g. the token
+                store record id; default: random UUID)
 
         Returns:
             TokenPair with both tokens and expiration times
@@ -163,7 +170,7 @@ class JWTHandler:
         )
 
         # Refresh token
-        refresh_jti = str(uuid.uuid4())
+        refresh_jti = refresh_jti or str(uuid.uuid4())
         refresh_exp = now + self.refresh_token_expire
         refresh_claims = {
             "sub": client_id,
@@ -370,6 +377,10 @@ if __name__ == "__main__":
             self.assertNotEqual(tokens.access_token, tokens.refresh_token)
             self.assertGreater(tokens.access_expires_at, datetime.now(timezone.utc))
 
+            tokens = self.handler.generate_tokens(client_id, username, refresh_jti="rec-1")
+            self.assertEqual(self.handler.verify(tokens.refresh_token).jti, "rec-1")
+            self.assertNotEqual(self.handler.verify(tokens.access_token).jti, "rec-1")
+
         def test_verify_valid_token(self):
             """Test valid token verification"""
             client_id = "client-123"
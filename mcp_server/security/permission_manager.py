@@ -14,6 +14,11 @@ CHANGELOG:
   - Audit logging of permission checks
   - Permission delegation framework
 
+[2026-10-15 v0.2.1-alpha] Change listeners
+  - add_change_listener(): callbacks run when a client's permissions change
+    (lets ExecutionManager invalidate its cached permission decisions)
+  - Bound-method listeners are held weakly; remove_change_listener()
+
 ARCHITECTURE:
 PermissionManager implements Role-Based Access Control (RBAC).
 Responsibilities:
@@ -32,8 +37,10 @@ SECURITY NOTES:
 - All decisions logged for audit
 """
 
+import inspect
 import logging
-from typing import Dict, List, Optional, Tuple
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .permission import Permission, PermissionType, DEFAULT_PERMISSIONS
@@ -68,6 +75,53 @@ class PermissionManager:
         # Permission change audit trail
         self._audit_trail: List[Dict] = []
 
+        # References to callbacks(client_id) run after a client's
+        # permissions change (call a reference to get the callback)
+        self._change_listeners: List[Callable[[], Optional[Callable[[str], None]]]] = []
+
+    def add_change_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Register a callback run after a client's permissions change
+
+        Bound methods are held weakly, so a listener does not keep its
+        owner (e.g. an ExecutionManager) alive; it is dropped once the
+        owner is collected.
+
+        Args:
+            callback: Called with the client_id (initialize/grant/revoke)
+        """
+        if inspect.ismethod(callback):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback
+        self._change_listeners.append(ref)
+
+    def remove_change_listener(self, callback: Callable[[str], None]) -> None:
+        """
+        Unregister a change listener (no-op if not registered)
+
+        Args:
+            callback: Callback passed to add_change_listener()
+        """
+        self._change_listeners = [
+            ref for ref in self._change_listeners
+            if ref() is not None and ref() != callback
+        ]
+
+    def _notify_change(self, client_id: str) -> None:
+        """Run change listeners for a client, dropping dead ones"""
+        dead = False
+        for ref in tuple(self._change_listeners):
+            callback = ref()
+            if callback is None:
+                dead = True
+            else:
+                callback(client_id)
+        if dead:
+            self._change_listeners = [
+                ref for ref in self._change_listeners if ref() is not None
+            ]
+
     def initialize_client(
         self,
         client_id: str,
@@ -84,6 +138,7 @@ class PermissionManager:
             initial_permissions = list(DEFAULT_PERMISSIONS)
 
         self._client_permissions[client_id] = initial_permissions
+        self._notify_change(client_id)
         self.logger.info(
             f"Client initialized with {len(initial_permissions)} permissions"
         )
@@ -119,6 +174,7 @@ class PermissionManager:
             return
 
         perms.append(permission)
+        self._notify_change(client_id)
         self.logger.info(f"Permission granted: {client_id} - {permission}")
 
         self._log_audit("permission_granted", client_id, permission.to_dict())
@@ -150,6 +206,7 @@ class PermissionManager:
             self._client_permissions[client_id]
         )
         if removed > 0:
+            self._notify_change(client_id)
             self.logger.info(
                 f"Revoked {removed} permissions of type {permission_type} "
                 f"from {client_id}"
@@ -397,6 +454,44 @@ if __name__ == "__main__":
             self.assertEqual(summary["total_permissions"], 2)
             self.assertIn(PermissionType.FILE_READ.value, summary["by_type"])
 
+        def test_change_listeners(self):
+            """Test listeners run on initialize, grant and revoke"""
+            changed = []
+            self.manager.add_change_listener(changed.append)
+
+            self.manager.initialize_client("test", [])
+            self.manager.grant_permission("test", Permission(PermissionType.FILE_READ))
+            self.manager.revoke_permission("test", PermissionType.FILE_READ)
+            self.manager.revoke_permission("test", PermissionType.FILE_READ)  # no-op
+            self.assertEqual(changed, ["test", "test", "test"])
+
+            self.manager.remove_change_listener(changed.append)
+            self.manager.initialize_client("test", [])
+            self.assertEqual(len(changed), 3)
+
+        def test_change_listener_owner_not_kept_alive(self):
+            """Test bound-method listeners are held weakly"""
+            import gc
+
+            class Owner:
+                def __init__(self):
+                    self.seen = []
+
+                def on_change(self, client_id):
+                    self.seen.append(client_id)
+
+            owner = Owner()
+            self.manager.add_change_listener(owner.on_change)
+            self.manager.initialize_client("test", [])
+            self.assertEqual(owner.seen, ["test"])
+
+            ref = weakref.ref(owner)
+            del owner
+            gc.collect()
+            self.assertIsNone(ref())
+            self.manager.initialize_client("test", [])  # dead listener dropped
+            self.assertEqual(self.manager._change_listeners, [])
+
         def test_audit_trail(self):
             """Test audit trail logging"""
             client_id = "test"
@@ -13,6 +13,10 @@ CHANGELOG:
   - Error handling framework
   - Async-first design using asyncio
 
+[2026-10-15 v0.1.1-alpha] Client events
+  - set_client_handler(): connect / disconnect notifications from
+    multi-client transports (lets the server drop per-client state)
+
 ARCHITECTURE:
 BaseTransport is the abstract base class that all transport implementations
 (Stdio, TCP, DBus) must inherit from. It defines the contract for:
@@ -189,6 +193,7 @@ class BaseTransport(ABC):
         # Message handlers
         self._message_handler: Optional[Callable[[TransportMessage], Awaitable[None]]] = None
         self._error_handler: Optional[Callable[[TransportError], Awaitable[None]]] = None
+        self._client_handler: Optional[Callable[[str, str], Awaitable[None]]] = None
 
     @property
     def status(self) -> str:
@@ -295,6 +300,22 @@ class BaseTransport(ABC):
         self._error_handler = handler
         self.logger.info(f"Error handler registered")
 
+    async def set_client_handler(
+        self,
+        handler: Callable[[str, str], Awaitable[None]]
+    ) -> None:
+        """
+        Register client event handler
+
+        Handler will be called when a client connects ("connect", before
+        its first message) and when its connection closes ("disconnect")
+
+        Args:
+            handler: Async callable(client_id, "connect" | "disconnect") -> None
+        """
+        self._client_handler = handler
+        self.logger.info("Client handler registered")
+
     async def _dispatch_message(self, message: TransportMessage) -> None:
         """
         Dispatch received message to handler
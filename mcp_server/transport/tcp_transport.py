@@ -13,6 +13,10 @@ CHANGELOG:
   - Graceful connection management
   - Error handling for network failures
 
+[2026-10-15 v0.1.1-alpha] Disconnect notification
+  - Client handler is called with "disconnect" when a connection closes
+    (after the existing "connect" notification)
+
 ARCHITECTURE:
 TCPTransport allows remote clients to connect via TCP sockets.
 - One TCPClientConnection per client
@@ -242,6 +246,12 @@ class TCPTransport(BaseTransport):
             del self.clients[client_id]
             self.logger.info(f"Client disconnected: {client_id}")
 
+            if self._client_handler:
+                try:
+                    await self._client_handler(client_id, "disconnect")
+                except Exception as e:
+                    self.logger.error(f"Client handler error: {e}")
+
     async def send_message(self, message: Dict[str, Any]) -> None:
         """
         Send message to all TCP clients (broadcast)
@@ -383,6 +393,28 @@ if __name__ == "__main__":
             """Test client count"""
             self.assertEqual(self.transport.get_client_count(), 0)
 
+        def test_client_handler_connect_and_disconnect(self):
+            """Test the client handler sees connect, then disconnect"""
+            events = []
+
+            async def on_client(client_id, event):
+                events.append((client_id, event))
+
+            reader = AsyncMock()
+            reader.readexactly.side_effect = asyncio.IncompleteReadError(b"", 4)
+            writer = MagicMock()
+            writer.get_extra_info = MagicMock(return_value=("127.0.0.1", 12345))
+            writer.wait_closed = AsyncMock()
+
+            async def run_test():
+                await self.transport.set_client_handler(on_client)
+                await self.transport._handle_client(reader, writer)
+
+            asyncio.run(run_test())
+            self.assertEqual([event for _, event in events], ["connect", "disconnect"])
+            self.assertEqual(events[0][0], events[1][0])
+            self.assertEqual(self.transport.get_client_count(), 0)
+
         def test_config_defaults(self):
             """Test default configuration"""
             config = TCPConfig()
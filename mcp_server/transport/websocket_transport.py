@@ -13,6 +13,10 @@ CHANGELOG:
   - JSON-RPC over WebSocket
   - Compatible with standard WebSocket API
 
+[2026-10-15 v0.1.1-alpha] Disconnect notification
+  - Client handler is called with "disconnect" when a connection closes
+    (after the existing "connect" notification)
+
 ARCHITECTURE:
 WebSocketTransport allows web clients to connect via WebSocket.
 - HTTP server that upgrades to WebSocket
@@ -253,6 +257,12 @@ class WebSocketTransport(BaseTransport):
                 del self.clients[client_id]
             self.logger.info(f"WebSocket client disconnected: {client_id}")
 
+            if self._client_handler:
+                try:
+                    await self._client_handler(client_id, "disconnect")
+                except Exception as e:
+                    self.logger.error(f"Client handler error: {e}")
+
         return ws
 
     async def send_message(self, message: Dict[str, Any]) -> None:
@@ -70,7 +70,11 @@ def main():
 
     modules = [
         ("mcp_server.persistence.json_store", "JSONStore (Base JSON File Handling)"),
+        ("mcp_server.persistence.jsonl_store", "JSONLStore (Append-only JSON Lines)"),
+        ("mcp_server.persistence.msgpack_store", "MsgpackStore (Binary Audit Frames)"),
         ("mcp_server.persistence.token_store", "TokenManager (Token Persistence)"),
+        ("mcp_server.persistence.sqlite_token_store", "SQLiteTokenStore (SQLite Token Persistence)"),
+        ("mcp_server.persistence.token_backend", "TokenBackend (Revocation Backends)"),
         ("mcp_server.security.authentication.jwt_handler", "JWTHandler (JWT Generation/Validation)"),
         ("mcp_server.security.authentication.client_manager", "ClientManager (Client Credentials)"),
         ("mcp_server.persistence.audit_store", "AuditLogger (Audit Trail)"),